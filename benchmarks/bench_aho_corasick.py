@@ -0,0 +1,117 @@
+# benchmarks/bench_aho_corasick.py
+"""Throughput of the Aho-Corasick pattern processors on long synthetic token streams.
+
+Compares `AhoCorasickAutomaton.search_chunk`, which skips to the next pattern start
+while at the root and then follows the compiled goto table, with the equivalent
+failure-link walk over the trie. The same text is then streamed through the
+buffered processors the agent uses in manual detection mode. Token-sized chunks
+are the streaming case; single chunks show the raw per-character cost.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_aho_corasick --tokens 20000
+"""
+
+import time
+import random
+import asyncio
+import argparse
+import functools
+
+from src.llm.pattern_detection import AhoCorasickBufferedProcessor, AhoCorasickBufferedProcessorNormalized
+from src.llm.pattern_detection.aho_corasick import AhoCorasickAutomaton
+from src.llm.pattern_detection.pattern_utils import load_patterns
+
+PATTERNS_PATH = "src/configs/tool_call_patterns.yaml"
+WORDS = ["The", " weather", " in", " Paris", " is", " sunny", ",", " with", " a", " high", " of",
+         " 21", "°C", ".", "\n", " Let", " me", " check", "\"", "tool", "|"]
+TRIGGER_WORDS = [" [", "{", "<", "`"]
+
+
+def make_tokens(count: int, seed: int = 0):
+    """Synthetic LLM output tokens, mostly prose with occasional pattern characters."""
+    rng = random.Random(seed)
+    return [rng.choice(TRIGGER_WORDS if rng.random() < 0.02 else WORDS) for _ in range(count)]
+
+
+def make_near_miss_tokens(count: int, seed: int = 0):
+    """Adversarial tokens made of pattern prefixes, which exercise the failure links."""
+    rng = random.Random(seed)
+    patterns = list(load_patterns(PATTERNS_PATH).values())
+    return [pattern[:rng.randint(1, len(pattern) - 1)] for pattern in (rng.choice(patterns) for _ in range(count))]
+
+
+def search_with_failure_links(automaton: AhoCorasickAutomaton, chunk: str):
+    """Reference search that follows failure links instead of the goto table."""
+    found_patterns = []
+    state = automaton.current_state
+    for i, char in enumerate(chunk):
+        while state > 0 and char not in automaton.next_states[state]:
+            state = automaton.fail[state]
+        state = automaton.next_states[state].get(char, 0)
+        for pattern_name in automaton.output[state]:
+            found_patterns.append((i, pattern_name))
+    automaton.current_state = state
+    return found_patterns
+
+
+def bench_automaton(chunks, repeat: int):
+    automaton = AhoCorasickAutomaton(load_patterns(PATTERNS_PATH))
+    results = {}
+    for label, search in (("failure links", functools.partial(search_with_failure_links, automaton)),
+                          ("search_chunk", automaton.search_chunk)):
+        best = float("inf")
+        for _ in range(repeat):
+            automaton.reset_state()
+            start = time.perf_counter()
+            for chunk in chunks:
+                search(chunk)
+            best = min(best, time.perf_counter() - start)
+        results[label] = best
+    return results
+
+
+async def stream_tokens(processor, tokens):
+    for token in tokens:
+        await processor.process_chunk(token)
+    await processor.flush_buffer()
+
+
+def bench_processors(tokens, repeat: int):
+    results = {}
+    for label, cls in (("standard processor", AhoCorasickBufferedProcessor),
+                       ("normalized processor", AhoCorasickBufferedProcessorNormalized)):
+        prototype = cls(PATTERNS_PATH)
+        best = float("inf")
+        for _ in range(repeat):
+            processor = prototype.clone()
+            start = time.perf_counter()
+            asyncio.run(stream_tokens(processor, tokens))
+            best = min(best, time.perf_counter() - start)
+        results[label] = best
+    return results
+
+
+def report(title: str, chars: int, results):
+    print(title)
+    for label, seconds in results.items():
+        print(f"  {label:<22} {seconds * 1000:8.2f} ms  {chars / seconds / 1e6:6.2f} M chars/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=20000, help="Number of streamed tokens")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the best is reported")
+    args = parser.parse_args()
+
+    print(f"{args.tokens} tokens per stream, best of {args.repeat}")
+    for name, tokens in (("prose", make_tokens(args.tokens)),
+                         ("near-miss", make_near_miss_tokens(args.tokens))):
+        chars = sum(len(token) for token in tokens)
+        report(f"{name} stream, token-sized chunks ({chars} chars)", chars,
+               {**bench_automaton(tokens, args.repeat), **bench_processors(tokens, args.repeat)})
+        report(f"{name} stream, single chunk", chars, bench_automaton(["".join(tokens)], args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+# benchmarks/bench_pattern_detection.py
+"""Benchmark suite for the buffered pattern processors used in manual tool detection.
+
+Replays token streams through `AhoCorasickBufferedProcessor` and
+`AhoCorasickBufferedProcessorNormalized` and reports, per workload and processor:
+
+- throughput in characters per second
+- p50 / p99 latency of a single `process_chunk` call
+- hold-back delay: characters held in the trailing buffer after each chunk
+- allocations: peak traced memory and memory blocks still held per chunk afterwards
+  (from a separate, tracemalloc-instrumented run so tracing does not distort the timings)
+
+Synthetic workloads cover different chunk sizes, tool call positions, whitespace
+noise and near-miss patterns. Recorded streams can be added as JSON Lines files, one
+stream per line, either a list of chunk strings or an object with a `chunks` list.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_pattern_detection --output results.json
+    python -m benchmarks.bench_pattern_detection --compare results.json
+"""
+
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import platform
+import statistics
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional
+
+from src.llm.pattern_detection import AhoCorasickBufferedProcessor, AhoCorasickBufferedProcessorNormalized
+
+PATTERNS_PATH = "src/configs/tool_call_patterns.yaml"
+PROCESSORS = {
+    "standard": AhoCorasickBufferedProcessor,
+    "normalized": AhoCorasickBufferedProcessorNormalized,
+}
+
+PROSE = ("The forecast for Paris shows mild temperatures through the weekend, with light rain "
+         "expected on Saturday afternoon. Let me know if you would like the hourly breakdown, "
+         "or details for another city. ")
+NEAR_MISSES = ["[1, 2]", "{x}", "<b>", "`code`", "[{\"id", "<tool", "```py", "{'nam", "[TOOL"]
+TOOL_CALL = '[{"name": "get_weather", "arguments": {"location": "Paris", "unit": "celsius"}}]'
+
+
+class Workload(NamedTuple):
+    """A named set of token streams."""
+    name: str
+    streams: List[List[str]]
+
+
+def chunk_text(text: str, chunk_size: int, rng: random.Random) -> List[str]:
+    """Split text into chunks averaging `chunk_size` characters, like LLM tokens."""
+    chunks, position = [], 0
+    while position < len(text):
+        size = max(1, round(rng.gauss(chunk_size, chunk_size / 3)))
+        chunks.append(text[position:position + size])
+        position += size
+    return chunks
+
+
+def make_text(
+        rng: random.Random,
+        length: int,
+        tool_call_at: Optional[float],
+        whitespace_noise: float,
+        near_miss_rate: float
+) -> str:
+    """Build a response of roughly `length` characters.
+
+    Args:
+        rng: Random source.
+        length: Approximate number of prose characters.
+        tool_call_at: Relative position of the tool call (0 to 1), or None for no tool call.
+        whitespace_noise: Probability of inserting whitespace after a tool call character.
+        near_miss_rate: Probability per prose word of inserting a near-miss of a pattern.
+    """
+    words = []
+    while sum(len(word) for word in words) < length:
+        for word in PROSE.split(" "):
+            words.append(word + " ")
+            if rng.random() < near_miss_rate:
+                words.append(rng.choice(NEAR_MISSES) + " ")
+    text = "".join(words)[:length]
+
+    if tool_call_at is None:
+        return text
+    tool_call = "".join(ch + (rng.choice(" \n") if rng.random() < whitespace_noise else "") for ch in TOOL_CALL)
+    cut = int(len(text) * tool_call_at)
+    return text[:cut] + tool_call + text[cut:]
+
+
+def synthetic_workloads(streams: int, length: int, seed: int) -> List[Workload]:
+    """Synthetic workloads crossing chunk size, tool call position, noise and near-misses."""
+    workloads = []
+    for chunk_size in (1, 4, 16):
+        for label, tool_call_at in (("no-call", None), ("call-start", 0.0), ("call-end", 1.0)):
+            for noise_label, noise, near_miss_rate in (("clean", 0.0, 0.0), ("noisy", 0.2, 0.05)):
+                rng = random.Random(f"{seed}-{chunk_size}-{label}-{noise_label}")
+                workloads.append(Workload(
+                    f"chunk{chunk_size}/{label}/{noise_label}",
+                    [chunk_text(make_text(rng, length, tool_call_at, noise, near_miss_rate), chunk_size, rng)
+                     for _ in range(streams)]
+                ))
+    return workloads
+
+
+def recorded_workloads(paths: List[str]) -> List[Workload]:
+    """Load recorded token streams from JSON Lines files."""
+    workloads = []
+    for path in paths:
+        with open(path, "r") as f:
+            streams = [json.loads(line) for line in f if line.strip()]
+        workloads.append(Workload(
+            f"recorded/{path}",
+            [stream["chunks"] if isinstance(stream, dict) else stream for stream in streams]
+        ))
+    return workloads
+
+
+async def replay(processor, chunks: List[str], latencies: Optional[List[int]] = None,
+                 held: Optional[List[int]] = None) -> int:
+    """Feed a stream until a pattern matches; return the number of characters processed."""
+    processed = 0
+    for chunk in chunks:
+        start = time.perf_counter_ns()
+        result = await processor.process_chunk(chunk)
+        if latencies is not None:
+            latencies.append(time.perf_counter_ns() - start)
+        if held is not None:
+            held.append(len(processor.trailing_buffer_original))
+        processed += len(chunk)
+        if result.matched:
+            return processed
+    await processor.flush_buffer()
+    return processed
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def measure(prototype, workload: Workload, repeat: int) -> Dict[str, float]:
+    """Measure one processor on one workload."""
+
+    async def timed_run():
+        latencies, held, chars = [], [], 0
+        processors = [prototype.clone() for _ in workload.streams]
+        start = time.perf_counter()
+        for processor, chunks in zip(processors, workload.streams):
+            chars += await replay(processor, chunks, latencies, held)
+        return time.perf_counter() - start, chars, latencies, held
+
+    async def traced_run():
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            chunks = 0
+            for stream in workload.streams:
+                await replay(prototype.clone(), stream)
+                chunks += len(stream)
+            after = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+        return peak, blocks / max(chunks, 1)
+
+    best = None
+    for _ in range(repeat):
+        run = asyncio.run(timed_run())
+        if best is None or run[0] < best[0]:
+            best = run
+    seconds, chars, latencies, held = best
+    peak, blocks_per_chunk = asyncio.run(traced_run())
+
+    return {
+        "chars": chars,
+        "chunks": len(latencies),
+        "seconds": seconds,
+        "chars_per_sec": chars / seconds if seconds else 0.0,
+        "p50_chunk_us": percentile(latencies, 0.50) / 1000,
+        "p99_chunk_us": percentile(latencies, 0.99) / 1000,
+        "mean_held_chars": statistics.fmean(held) if held else 0.0,
+        "max_held_chars": max(held, default=0),
+        "peak_traced_kib": peak / 1024,
+        "retained_blocks_per_chunk": blocks_per_chunk,
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: Dict[str, Dict[str, Dict[str, float]]], baseline: Optional[Dict] = None) -> None:
+    header = f"{'workload':<28} {'processor':<11} {'Mchar/s':>8} {'p50 us':>8} {'p99 us':>8} " \
+             f"{'held':>6} {'max':>4} {'KiB':>7}"
+    print(header + ("  vs baseline" if baseline else ""))
+    for workload, by_processor in results.items():
+        for name, stats in by_processor.items():
+            line = (f"{workload:<28} {name:<11} {stats['chars_per_sec'] / 1e6:8.2f} {stats['p50_chunk_us']:8.1f} "
+                    f"{stats['p99_chunk_us']:8.1f} {stats['mean_held_chars']:6.1f} {stats['max_held_chars']:4d} "
+                    f"{stats['peak_traced_kib']:7.1f}")
+            previous = (baseline or {}).get(workload, {}).get(name)
+            if previous and previous["chars_per_sec"]:
+                line += f"  {stats['chars_per_sec'] / previous['chars_per_sec']:5.2f}x"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--streams", type=int, default=20, help="Streams per synthetic workload")
+    parser.add_argument("--length", type=int, default=2000, help="Approximate characters per synthetic stream")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per measurement; the fastest is kept")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--recorded", nargs="*", default=[], help="JSON Lines files of recorded token streams")
+    parser.add_argument("--processor", choices=sorted(PROCESSORS), nargs="*", default=sorted(PROCESSORS))
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare throughput against")
+    args = parser.parse_args()
+
+    prototypes = {name: PROCESSORS[name](PATTERNS_PATH) for name in args.processor}
+    workloads = synthetic_workloads(args.streams, args.length, args.seed) + recorded_workloads(args.recorded)
+
+    results = {
+        workload.name: {name: measure(prototype, workload, args.repeat) for name, prototype in prototypes.items()}
+        for workload in workloads
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)["results"]
+    print_results(results, baseline)
+
+    if args.output:
+        report = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "settings": vars(args),
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
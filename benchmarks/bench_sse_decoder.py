@@ -0,0 +1,133 @@
+# benchmarks/bench_sse_decoder.py
+"""Benchmark of server-sent event decoding for raw-HTTP adapters.
+
+Compares `SSEDecoder`, which splits events in byte buffers and hands `data` to the
+JSON loader as bytes, with the line-based parsing the WatsonX adapter used before:
+decode and strip every line, collect lines per event, concatenate `data` fields and
+`json.loads` the string. Both decode the same WatsonX-like token stream, delivered in
+network chunks of varying size, and the CPU time per event is reported.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_sse_decoder --events 20000
+"""
+
+import json
+import time
+import random
+import argparse
+from typing import Callable, Dict, Iterable, Iterator, List
+
+from src.llm.adapters.sse_decoder import SSEDecoder
+
+EVENT_TEMPLATE = (
+    'id: {index}\nevent: message\ndata: {{"model_id": "ibm/granite-3-8b-instruct", '
+    '"created_at": "2025-01-01T00:00:00.000Z", "results": [{{"generated_text": "{token}", '
+    '"generated_token_count": {index}, "input_token_count": 512, "stop_reason": "not_finished"}}]}}\n\n'
+)
+TOKENS = ["The", " forecast", " for", " Paris", " shows", " mild", " temperatures", ",", " with", " rain", "."]
+
+
+def make_stream(events: int, rng: random.Random) -> bytes:
+    return "".join(EVENT_TEMPLATE.format(index=i, token=rng.choice(TOKENS)) for i in range(events)).encode()
+
+
+def split_chunks(stream: bytes, rng: random.Random, mean_size: int) -> List[bytes]:
+    chunks, position = [], 0
+    while position < len(stream):
+        size = max(1, int(rng.expovariate(1 / mean_size)))
+        chunks.append(stream[position:position + size])
+        position += size
+    return chunks
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Split chunks into lines, including the newline, as aiohttp's line iteration does."""
+    pending = bytearray()
+    for chunk in chunks:
+        pending += chunk
+        start = 0
+        end = pending.find(b"\n")
+        while end != -1:
+            yield bytes(pending[start:end + 1])
+            start = end + 1
+            end = pending.find(b"\n", start)
+        del pending[:start]
+    if pending:
+        yield bytes(pending)
+
+
+def decode_by_line(chunks: List[bytes]) -> int:
+    """The WatsonX adapter's former parsing, reading the response line by line."""
+    parsed = 0
+    buffer = []
+    for raw_line in iter_lines(chunks):
+        line = raw_line.decode("utf-8").strip()
+        if not line:
+            event = {}
+            for item in buffer:
+                if item.startswith("id:"):
+                    event["id"] = item[len("id:"):].strip()
+                elif item.startswith("event:"):
+                    event["event"] = item[len("event:"):].strip()
+                elif item.startswith("data:"):
+                    event["data"] = event.get("data", "") + item[len("data:"):].strip()
+            buffer = []
+            if "data" in event:
+                json.loads(event["data"])
+                parsed += 1
+            continue
+        buffer.append(line)
+    return parsed
+
+
+def decode_by_bytes(chunks: List[bytes]) -> int:
+    parsed = 0
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        for event in decoder.feed(chunk):
+            event.json()
+            parsed += 1
+    for event in decoder.flush():
+        event.json()
+        parsed += 1
+    return parsed
+
+
+def best_time(function: Callable[[List[bytes]], int], data: List[bytes], repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    stream = make_stream(args.events, rng)
+    results: Dict[int, Dict[str, float]] = {}
+    for mean_size in (64, 512, 4096):
+        chunks = split_chunks(stream, rng, mean_size)
+        assert decode_by_line(chunks) == decode_by_bytes(chunks) == args.events
+        results[mean_size] = {
+            "line": best_time(decode_by_line, chunks, args.repeat),
+            "bytes": best_time(decode_by_bytes, chunks, args.repeat),
+        }
+
+    print(f"{'chunk bytes':>11} {'line us/event':>14} {'bytes us/event':>15} {'speedup':>8}")
+    for mean_size, timing in results.items():
+        line_us = timing["line"] / args.events * 1e6
+        bytes_us = timing["bytes"] / args.events * 1e6
+        print(f"{mean_size:>11} {line_us:14.2f} {bytes_us:15.2f} {line_us / bytes_us:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
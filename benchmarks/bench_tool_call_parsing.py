@@ -0,0 +1,223 @@
+# benchmarks/bench_tool_call_parsing.py
+"""Benchmark of tool call parsing on the versioned corpus of model outputs.
+
+Runs every corpus case through the parser `ToolCallParserFactory` creates for its
+format, configured from `src/configs/parsing.yaml`, and reports per tag and in total:
+
+- parse time: mean and p99 microseconds per case
+- success rate: share of cases whose result matches the expected tool calls (cases
+  expected to fail succeed when parsing reports an error)
+- recovery paths: how many JSON values `JSONToolCallParser.parse_json_value` parsed
+  with strict `json`, `json5`, `preprocess_json` or `split_json_list_items`, or `failed`;
+  recorded by the benchmark around the untimed run of each case, so timings are unaffected
+
+Two modes are measured: `parse`, the full `BaseToolCallParser.parse` on the whole
+text, and `stream`, the `create_stream()` path manual detection uses, fed in chunks.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_tool_call_parsing --output results.json
+    python -m benchmarks.bench_tool_call_parsing --compare results.json
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import contextlib
+import platform
+import statistics
+import subprocess
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+import json5
+import yaml
+
+from src.tools.core.parsers import JSONToolCallParser
+from src.utils.factory import FormatType, ToolCallParserFactory
+
+CORPUS_PATH = "tests/data/tool_call_corpus.json"
+PARSING_CONFIG_PATH = "src/configs/parsing.yaml"
+FORMATS = {"json": FormatType.JSON, "non_json": FormatType.NON_JSON}
+MODES = ("parse", "stream")
+
+
+def load_corpus(paths: List[str]) -> List[Dict[str, Any]]:
+    """Load the cases of one or more corpus files."""
+    cases = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            corpus = json.load(f)
+        cases.extend(corpus["cases"])
+    return cases
+
+
+def is_success(result: Dict[str, Any], expected: Optional[List[Dict[str, Any]]]) -> bool:
+    if expected is None:
+        return "error" in result
+    return result.get("tool_calls") == expected
+
+
+def recovery_path(parser: JSONToolCallParser, json_str: str, items: List[Any]) -> str:
+    """Name the path `parse_json_value` took for a value, following its order of attempts."""
+    for path, loads in (("json", json.loads), ("json5", json5.loads)):
+        try:
+            loads(json_str)
+            return path
+        except Exception:
+            pass
+    try:
+        json5.loads(parser.preprocess_json(json_str))
+        return "preprocess_json"
+    except Exception:
+        pass
+    return "split_json_list_items" if items else "failed"
+
+
+@contextlib.contextmanager
+def record_recovery(parser) -> Iterator[Counter]:
+    """Count the recovery path of every JSON value the parser parses inside the block.
+
+    `parse_json_value` is wrapped on this parser instance only and restored on exit.
+    Parsers other than `JSONToolCallParser` have no recovery paths and count nothing.
+    """
+    counts: Counter = Counter()
+    if not isinstance(parser, JSONToolCallParser):
+        yield counts
+        return
+
+    def parse_json_value(json_str: str) -> List[Any]:
+        items = JSONToolCallParser.parse_json_value(parser, json_str)
+        counts[recovery_path(parser, json_str, items)] += 1
+        return items
+
+    parser.parse_json_value = parse_json_value
+    try:
+        yield counts
+    finally:
+        del parser.parse_json_value
+
+
+def run_case(parser, case: Dict[str, Any], mode: str, chunk_size: int) -> Optional[Dict[str, Any]]:
+    """Parse one case; returns None if the parser does not support the mode."""
+    if mode == "parse":
+        return parser.parse(case["text"])
+    stream = parser.create_stream()
+    if stream is None:
+        return None
+    text = case["text"]
+    for position in range(0, len(text), chunk_size):
+        stream.feed(text[position:position + chunk_size])
+    return stream.result()
+
+
+def measure(cases: List[Dict[str, Any]], config: Dict[str, Any], mode: str, repeat: int,
+            chunk_size: int) -> Dict[str, Dict[str, Any]]:
+    """Measure one mode on all cases, grouped by tag."""
+    parsers = {name: ToolCallParserFactory.get_parser(format_type, config) for name, format_type in FORMATS.items()}
+    groups: Dict[str, Dict[str, Any]] = defaultdict(lambda: {"times": [], "successes": 0, "cases": 0,
+                                                              "recovery": Counter(), "failed_cases": []})
+
+    for case in cases:
+        parser = parsers[case["format"]]
+        with record_recovery(parser) as used:
+            result = run_case(parser, case, mode, chunk_size)
+        if result is None:
+            continue
+
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            run_case(parser, case, mode, chunk_size)
+            times.append(time.perf_counter_ns() - start)
+
+        success = is_success(result, case["expected"])
+        for tag in ["all"] + case["tags"] + [f"format:{case['format']}"]:
+            group = groups[tag]
+            group["times"].append(min(times) / 1000)
+            group["cases"] += 1
+            group["successes"] += success
+            group["recovery"].update(used)
+            if not success:
+                group["failed_cases"].append(case["id"])
+
+    return {
+        tag: {
+            "cases": group["cases"],
+            "success_rate": group["successes"] / group["cases"],
+            "mean_us": statistics.fmean(group["times"]),
+            "p99_us": sorted(group["times"])[min(len(group["times"]) - 1, int(0.99 * len(group["times"])))],
+            "recovery": dict(group["recovery"]),
+            "failed_cases": group["failed_cases"],
+        }
+        for tag, group in sorted(groups.items(), key=lambda item: (item[0] != "all", item[0]))
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: Dict[str, Dict[str, Dict[str, Any]]], baseline: Optional[Dict] = None) -> None:
+    header = f"{'mode':<7} {'tag':<22} {'cases':>5} {'success':>8} {'mean us':>9} {'p99 us':>9}  recovery"
+    print(header)
+    for mode, by_tag in results.items():
+        for tag, stats in by_tag.items():
+            recovery = ", ".join(f"{path}={count}" for path, count in sorted(stats["recovery"].items()))
+            line = (f"{mode:<7} {tag:<22} {stats['cases']:5d} {stats['success_rate']:8.0%} "
+                    f"{stats['mean_us']:9.1f} {stats['p99_us']:9.1f}  {recovery}")
+            previous = (baseline or {}).get(mode, {}).get(tag)
+            if previous and stats["mean_us"]:
+                line += f"  ({previous['mean_us'] / stats['mean_us']:.2f}x vs baseline)"
+            print(line)
+        failed = by_tag.get("all", {}).get("failed_cases")
+        if failed:
+            print(f"{mode:<7} failed cases: {', '.join(failed)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", nargs="*", default=[CORPUS_PATH], help="Corpus JSON files")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed runs per case; the fastest is kept")
+    parser.add_argument("--chunk-size", type=int, default=4, help="Characters per chunk in stream mode")
+    parser.add_argument("--mode", choices=MODES, nargs="*", default=list(MODES))
+    parser.add_argument("--output", help="Write results as JSON to this path")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare parse times against")
+    args = parser.parse_args()
+    # Cases expected to fail would otherwise log a validation error on every run
+    logging.disable(logging.ERROR)
+
+    with open(PARSING_CONFIG_PATH, "r") as f:
+        config = yaml.safe_load(f)
+    cases = load_corpus(args.corpus)
+    results = {mode: measure(cases, config, mode, args.repeat, args.chunk_size) for mode in args.mode}
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)["results"]
+    print_results(results, baseline)
+
+    if args.output:
+        report = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "settings": vars(args),
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,3 @@
 from .chat_agent_streaming import StreamingChatAgent
+from .conversation_store import ConversationStore
+from .request_coalescer import RequestCoalescer
@@ -4,8 +4,10 @@ import os
 import json5
 import yaml
 import asyncio
+import inspect
 import logging
 from functools import wraps
+from contextlib import aclosing, nullcontext
 from typing import List, AsyncGenerator, Dict, Optional, Any, Callable
 
 from src.api import SSEChunk, AgentStatus
@@ -18,11 +20,24 @@ from src.data_models.chat_completions import (
     AssistantMessage,
 )
 from src.llm import LLMFactory
+from src.data_models.tools import ToolResponse, ToolProgress
 from src.tools import ToolRegistry
+from src.agent.conversation_store import ConversationStore
+from src.agent.request_coalescer import RequestCoalescer
+from src.tools.core.base_tool import BaseTool
+from src.tools.core.utils.argument_validator import ArgumentValidationError
 from src.prompt_builders import PromptPayload, PromptBuilderOutput, BasePromptBuilder
 from src.utils.factory import PromptBuilderFactory, ToolCallParserFactory, FormatType
+from src.utils.tracing import HotPathTracer
+from src.utils.token_counter import count_text_tokens, select_messages_within_budget
+from src.llm.pattern_detection.pattern_utils import resolve_pattern_family
 from src.llm.tool_detection.detection_result import DetectionState, DetectionResult
-from src.llm.tool_detection import ManualToolCallDetectionStrategy, VendorToolCallDetectionStrategy
+from src.llm.tool_detection import (
+    DetectionStrategyPool,
+    BaseToolCallDetectionStrategy,
+    ManualToolCallDetectionStrategy,
+    VendorToolCallDetectionStrategy,
+)
 
 
 # ----------------------------------------------------------------
@@ -34,10 +49,14 @@ def handle_streaming_errors(func: Callable[..., AsyncGenerator[SSEChunk, None]])
     @wraps(func)
     async def wrapper(self, *args, **kwargs) -> AsyncGenerator[SSEChunk, None]:
         try:
-            async for item in func(self, *args, **kwargs):
-                yield item
+            async with aclosing(func(self, *args, **kwargs)) as stream:
+                async for item in stream:
+                    yield item
         except Exception:
             self.logger.error(f"Error in {func.__name__}", exc_info=True)
+            # State handlers mark their turn, so the fallback message is never stored as a reply
+            if args and isinstance(args[0], StreamContext):
+                args[0].error_fallback = True
             yield await SSEChunk.make_stop_chunk(
                 content="I apologize - I've encountered an unexpected error. Please try your request again.")
             return
@@ -45,6 +64,23 @@ def handle_streaming_errors(func: Callable[..., AsyncGenerator[SSEChunk, None]])
     return wrapper
 
 
+class ToolTimeoutError(Exception):
+    """Reports a tool call the agent cancelled because it exceeded a timeout.
+
+    Only the agent's timeout handling creates it, so a `TimeoutError` raised inside a
+    tool (for example by an HTTP client) is reported as an ordinary tool error.
+
+    Attributes:
+        tool_name (str): Name of the cancelled tool.
+        timeout (float): The timeout that expired, in seconds.
+    """
+
+    def __init__(self, tool_name: str, timeout: float, message: str):
+        self.tool_name = tool_name
+        self.timeout = timeout
+        super().__init__(message)
+
+
 # ----------------------------------------------------------------
 #  Create Streaming Chat Agent
 # ----------------------------------------------------------------
@@ -60,7 +96,8 @@ class StreamingChatAgent:
     Args:
         config (Dict): Configuration dictionary containing:
 
-            - `history_limit` (int): Maximum number of historical messages to consider
+            - `history_limit` (int): Maximum number of historical messages to consider when
+              the main chat model sets no `history_token_budget`
             - `system_prompt` (str): System prompt to prepend to conversations
             - `detection_mode` (str): Mode for tool detection ('vendor' or 'manual')
             - `use_vendor_chat_completions` (bool): Whether to use vendor chat completions
@@ -68,34 +105,71 @@ class StreamingChatAgent:
             - `tools_config` (Dict): Configuration for available tools
             - `logging_level` (str): Logging level (default: 'INFO')
             - `max_streaming_iterations` (int): Maximum number of streaming iterations
+            - `detection_pool` (Dict): Optional `max_size` and `prebuilt` settings for the
+              pool of per-stream tool detection strategies
+            - `speculative_tool_execution` (bool): Start tools as soon as vendor tool call
+              arguments are complete instead of waiting for the finish chunk (default: False)
+            - `max_hold_back` (int): Optional cap on the characters held back while a
+              manual-mode tool call pattern is partially matched
+            - `pattern_family` (str): Optional tool call pattern family for manual mode;
+              resolved from the main chat model's vendor and model ID when not set
+            - `timeouts` (Dict): Optional `tool_execution_timeout` (default per tool) and
+              `tool_turn_timeout` (all tools of one turn) in seconds
+            - `conversation_store` (Dict): Enables the server-side thread store, with optional
+              `max_threads` and `sqlite_path` settings
+            - `request_coalescing` (bool): Share one agent run between identical concurrent
+              requests (default: False)
 
     Attributes:
         response_model_name (str): Name of the main chat model
         history_limit (int): Maximum number of historical messages to consider
+        history_token_budget (Optional[int]): Estimated token budget for the prompt, read
+            from the main chat model's `history_token_budget` setting
         system_prompt (str): System prompt prepended to conversations
         logger (logging.Logger): Logger instance for the agent
         detection_mode (str): Current tool detection mode
         use_vendor_chat_completions (bool): Whether vendor chat completions are enabled
+        detection_pool (DetectionStrategyPool): Pool leasing a detection strategy to each stream
+        speculative_tool_execution (bool): Whether tools may start before the LLM stream finishes
+        tool_execution_timeout (Optional[float]): Default per-tool timeout in seconds
+        tool_turn_timeout (Optional[float]): Timeout in seconds for all tools of one turn
+        conversation_store (Optional[ConversationStore]): Server-side thread store, if enabled
+        request_coalescer (Optional[RequestCoalescer]): Single-flight layer, if enabled
     """
     def __init__(self, config: Dict) -> None:
         self.config = config
         self.response_model_name = "main_chat_model"
         self.history_limit = self.config.get('history_limit', 3)
         self.system_prompt = self.config.get('system_prompt')
+        self.system_prompt_tokens = count_text_tokens(self.system_prompt or "")
 
         # Initialize logger
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.tracer = HotPathTracer(self.logger)
         logging_level = os.getenv("LOG_LEVEL", "INFO")
         logging.basicConfig(level=getattr(logging, logging_level.upper(), None))
         self.logger.info(f'Logger set to {logging_level}')
 
         # Initialize vendor-specific components
         self.main_chat_model_config = self.config.get('models_config').get('main_chat_model')
+        self.history_token_budget = self.main_chat_model_config.get('history_token_budget')
         self.llm_factory = LLMFactory(config=self.config.get('models_config'))
 
         # Determine detection strategy first
         self.detection_mode = self.config.get("detection_mode", "vendor")
         self.use_vendor_chat_completions = self.config.get("use_vendor_chat_completions", True)
+        self.speculative_tool_execution = self.config.get("speculative_tool_execution", False)
+
+        # Optional server-side thread store keyed by thread ID
+        self.conversation_store = ConversationStore.from_config(self.config.get("conversation_store"))
+
+        # Optional single-flight sharing of identical concurrent requests
+        self.request_coalescer = RequestCoalescer() if self.config.get("request_coalescing", False) else None
+
+        # Tool execution deadlines (seconds); None means no limit
+        timeouts_config = self.config.get("timeouts") or {}
+        self.tool_execution_timeout = timeouts_config.get("tool_execution_timeout")
+        self.tool_turn_timeout = timeouts_config.get("tool_turn_timeout")
 
         # Load parser config if needed for manual detection
         self.logger.info("\n\n" + "=" * 60 + "\n" + "Agent Configuration Summary" + "\n" + "=" * 60 + "\n" +
@@ -110,13 +184,30 @@ class StreamingChatAgent:
                 FormatType.JSON,
                 parser_config
             )
-            self.detection_strategy = ManualToolCallDetectionStrategy(
-                parser=self.tool_call_parser
+            pattern_config_path = "src/configs/tool_call_patterns.yaml"
+            pattern_family = self.config.get("pattern_family") or resolve_pattern_family(
+                pattern_config_path,
+                self.main_chat_model_config.get("vendor"),
+                self.main_chat_model_config.get("model_id")
+            )
+            detection_prototype = ManualToolCallDetectionStrategy(
+                parser=self.tool_call_parser,
+                pattern_config_path=pattern_config_path,
+                max_hold_back=self.config.get("max_hold_back"),
+                pattern_family=pattern_family
             )
         else:
-            self.detection_strategy = VendorToolCallDetectionStrategy()
+            detection_prototype = VendorToolCallDetectionStrategy(speculative=self.speculative_tool_execution)
             self.tool_call_parser = None
 
+        # Each stream leases its own detector; the prototype's automaton is shared read-only
+        pool_config = self.config.get("detection_pool") or {}
+        self.detection_pool = DetectionStrategyPool(
+            prototype=detection_prototype,
+            max_size=pool_config.get("max_size", 256),
+            prebuilt=pool_config.get("prebuilt", 8)
+        )
+
         # Initialize prompt builder with inject_tools flag based on detection mode
         self.prompt_builder: BasePromptBuilder = PromptBuilderFactory.get_prompt_builder(
             vendor=self.main_chat_model_config.get('vendor')
@@ -133,16 +224,30 @@ class StreamingChatAgent:
     async def stream_step(
             self,
             conversation_history: List[TextChatMessage],
-            api_passed_context: Optional[Dict[str, Any]] = None
+            api_passed_context: Optional[Dict[str, Any]] = None,
+            thread_id: Optional[str] = None
     ) -> AsyncGenerator[SSEChunk, None]:
         """Process a conversation step in a streaming fashion.
 
         Handles the main conversation flow, including message generation, tool detection,
         and tool execution. The process flows through different states until completion.
 
+        When the conversation store is enabled and a `thread_id` is given,
+        `conversation_history` holds only the new messages: they are appended to the
+        stored thread, and the completed turn (new messages plus the assistant and tool
+        messages generated for them) is saved back to the store. Concurrent turns on the
+        same thread wait for each other.
+
         Args:
-            conversation_history (List[TextChatMessage]): List of previous conversation messages
+            conversation_history (List[TextChatMessage]): List of previous conversation messages,
+                or only the new ones when the thread is stored server-side
             api_passed_context (Optional[Dict[str, Any]]): Additional context passed from the API
+            thread_id (Optional[str]): Conversation thread ID used with the conversation store
+
+        Note:
+            With `request_coalescing` enabled, identical concurrent requests share a single
+            run and each receive a copy of its chunks. Requests using the conversation store
+            are never coalesced.
 
         Yields:
             SSEChunk: Server-Sent Events chunks containing response content or status updates
@@ -154,38 +259,95 @@ class StreamingChatAgent:
             - INTERMEDIATE: Handling intermediate steps
             - COMPLETING: Finalizing the response
         """
-        self.logger.debug("Starting streaming agent processing")
-
-        context = await self._initialize_context(conversation_history, api_passed_context)
-
-        while context.current_state != StreamState.COMPLETED:
-            match context.current_state:
+        if self.request_coalescer and not (self.conversation_store and thread_id):
+            key = self.request_coalescer.make_key(
+                conversation_history, self.main_chat_model_config, api_passed_context
+            )
+            stream = self.request_coalescer.subscribe(
+                key, lambda: self._run_stream_step(conversation_history, api_passed_context, thread_id)
+            )
+        else:
+            stream = self._run_stream_step(conversation_history, api_passed_context, thread_id)
 
-                case StreamState.STREAMING:
-                    self.logger.info(f"--- Entering Streaming State ---")
-                    async for item in self._handle_streaming(context):
-                        yield item
+        async with aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
-                case StreamState.TOOL_DETECTION:
-                    self.logger.info(f"--- Entering Tool Detection State ---")
-                    async for item in self._handle_tool_detection(context):
-                        yield item
+    async def _run_stream_step(
+            self,
+            conversation_history: List[TextChatMessage],
+            api_passed_context: Optional[Dict[str, Any]],
+            thread_id: Optional[str]
+    ) -> AsyncGenerator[SSEChunk, None]:
+        """Run the state machine for one conversation step. See `stream_step`."""
+        self.logger.debug("Starting streaming agent processing")
 
-                case StreamState.EXECUTING_TOOLS:
-                    self.logger.info(f"--- Entering Executing Tools State ---")
-                    async for item in self._handle_tool_execution(context):
-                        yield item
+        use_store = bool(self.conversation_store and thread_id)
+        # Turns on the same thread run one at a time, each building on the previous one's history
+        async with self.conversation_store.thread_lock(thread_id) if use_store else nullcontext():
+            turn = self._run_turn(conversation_history, api_passed_context, thread_id, use_store)
+            async with aclosing(turn) as chunks:
+                async for chunk in chunks:
+                    yield chunk
 
-                case StreamState.INTERMEDIATE:
-                    self.logger.info(f"--- Entering Intermediate State ---")
-                    async for item in self._handle_intermediate(context):
-                        yield item
+    async def _run_turn(
+            self,
+            conversation_history: List[TextChatMessage],
+            api_passed_context: Optional[Dict[str, Any]],
+            thread_id: Optional[str],
+            use_store: bool
+    ) -> AsyncGenerator[SSEChunk, None]:
+        """Run one turn of the state machine, loading and saving the stored thread if `use_store`."""
+        if use_store:
+            new_messages = [message for message in conversation_history if message.role != "system"]
+            conversation_history = await self.conversation_store.load(thread_id) + new_messages
 
-                case StreamState.COMPLETING:
-                    self.logger.info(f"--- Entering Completing State ---")
-                    async for item in self._handle_completing(context):
-                        yield item
-                    context.current_state = StreamState.COMPLETED
+        context = None
+        detection_strategy = await self.detection_pool.acquire()
+        try:
+            context = await self._initialize_context(conversation_history, api_passed_context, detection_strategy)
+            initial_history_length = len(context.conversation_history)
+
+            while context.current_state != StreamState.COMPLETED:
+                match context.current_state:
+
+                    case StreamState.STREAMING:
+                        self.logger.info(f"--- Entering Streaming State ---")
+                        async for item in self._handle_streaming(context):
+                            yield item
+
+                    case StreamState.TOOL_DETECTION:
+                        self.logger.info(f"--- Entering Tool Detection State ---")
+                        async for item in self._handle_tool_detection(context):
+                            yield item
+
+                    case StreamState.EXECUTING_TOOLS:
+                        self.logger.info(f"--- Entering Executing Tools State ---")
+                        async for item in self._handle_tool_execution(context):
+                            yield item
+
+                    case StreamState.INTERMEDIATE:
+                        self.logger.info(f"--- Entering Intermediate State ---")
+                        async for item in self._handle_intermediate(context):
+                            yield item
+
+                    case StreamState.COMPLETING:
+                        self.logger.info(f"--- Entering Completing State ---")
+                        async for item in self._handle_completing(context):
+                            yield item
+                        context.current_state = StreamState.COMPLETED
+        finally:
+            if context is not None:
+                self._cancel_speculative_tools(context)
+            self.detection_pool.release(detection_strategy)
+
+            # Only turns that completed without the error fallback are stored, so a failed
+            # request can simply be retried
+            if use_store and context is not None and not context.error_fallback and context.current_state in (
+                    StreamState.COMPLETING, StreamState.COMPLETED
+            ):
+                generated = context.conversation_history[initial_history_length:]
+                await self.conversation_store.append(thread_id, new_messages + generated)
 
     # ----------------------------------------------------------------
     #  STATE HANDLERS
@@ -207,14 +369,14 @@ class StreamingChatAgent:
         Raises:
             Exception: If maximum streaming iterations are exceeded
         """
-        self.detection_strategy.reset()
+        context.detection_strategy.reset()
         context.streaming_entry_count += 1
         if context.streaming_entry_count > context.max_streaming_iterations:
             self.logger.error("Maximum streaming iterations reached. Aborting further streaming.")
+            context.current_state = StreamState.COMPLETING
             yield await SSEChunk.make_stop_chunk(
                 content="Maximum streaming depth reached. Please try your request again."
             )
-            context.current_state = StreamState.COMPLETING
             return
 
         prompt_payload = PromptPayload(
@@ -235,27 +397,32 @@ class StreamingChatAgent:
         }
         stream_kwargs = {k: v for k, v in stream_kwargs.items() if v is not None}
 
-        self.logger.debug(f"stream_kwargs: {stream_kwargs}")
+        self.tracer.trace("stream_kwargs: %s", stream_kwargs)
         llm_adapter = context.llm_factory.get_adapter(self.response_model_name)
         stream_gen = llm_adapter.gen_sse_stream if isinstance(llm_input, str) else llm_adapter.gen_chat_sse_stream
 
         accumulated_content = []
-        async for sse_chunk in stream_gen(**stream_kwargs):
-            detection_result = await self.detection_strategy.detect_chunk(sse_chunk, context)
-            self.logger.debug(f"Detection result: {detection_result}")
+        # Closing the stream on an early tool call match stops the upstream generation
+        async with aclosing(stream_gen(**stream_kwargs)) as llm_stream:
+            async for sse_chunk in llm_stream:
+                detection_result = await context.detection_strategy.detect_chunk(sse_chunk, context)
+                self.tracer.sample("Detection result: %s", detection_result)
 
-            if detection_result.state in [DetectionState.NO_MATCH, DetectionState.PARTIAL_MATCH]:
-                if detection_result.content:
-                    accumulated_content.append(detection_result.content)
-                    yield SSEChunk.make_text_chunk(detection_result.content)
+                if detection_result.ready_tool_calls:
+                    self._start_speculative_tools(context, detection_result.ready_tool_calls)
 
-            elif detection_result.state == DetectionState.COMPLETE_MATCH:
-                async for chunk in self._handle_complete_match(context, detection_result, accumulated_content):
-                    yield chunk
-                return
+                if detection_result.state in [DetectionState.NO_MATCH, DetectionState.PARTIAL_MATCH]:
+                    if detection_result.content:
+                        accumulated_content.append(detection_result.content)
+                        yield SSEChunk.make_text_chunk(detection_result.content)
+
+                elif detection_result.state == DetectionState.COMPLETE_MATCH:
+                    async for chunk in self._handle_complete_match(context, detection_result, accumulated_content):
+                        yield chunk
+                    return
 
-        final_result = await self.detection_strategy.finalize_detection(context)
-        self.logger.debug(f"Final detection result: {final_result}")
+        final_result = await context.detection_strategy.finalize_detection(context)
+        self.tracer.trace("Final detection result: %s", final_result)
 
         if final_result.state == DetectionState.COMPLETE_MATCH:
             async for chunk in self._handle_complete_match(context, final_result, accumulated_content):
@@ -265,13 +432,17 @@ class StreamingChatAgent:
                 accumulated_content.append(final_result.content)
                 yield SSEChunk.make_text_chunk(final_result.content)
 
+            # Arguments completed but the model never committed to the call
+            self._cancel_speculative_tools(context)
+
             if accumulated_content:
                 context.conversation_history.append(
                     AssistantMessage(content="".join(accumulated_content))
                 )
 
-            yield await SSEChunk.make_stop_chunk()
+            # Set before yielding: consumers may stop reading at the stop chunk
             context.current_state = StreamState.COMPLETING
+            yield await SSEChunk.make_stop_chunk()
 
     @handle_streaming_errors
     async def _handle_tool_detection(self, context: StreamContext) -> AsyncGenerator[SSEChunk, None]:
@@ -300,13 +471,14 @@ class StreamingChatAgent:
         """Execute detected tools and process their results.
 
         Runs the detected tools concurrently and handles their results, including
-        error cases.
+        error cases. Timed-out tools are reported to the model as tool results saying so.
+        Progress updates from streaming tools are relayed as they arrive.
 
         Args:
             context (StreamContext): Current streaming context
 
         Yields:
-            SSEChunk: Tool execution status updates
+            SSEChunk: Tool progress and execution status updates
         """
         if context.message_buffer.strip():
             context.conversation_history.append(
@@ -314,17 +486,47 @@ class StreamingChatAgent:
             )
             context.message_buffer = ""
 
-        results = await self._execute_tools_concurrently(context)
+        execution = asyncio.create_task(self._execute_tools_concurrently(context))
+        try:
+            # Relay progress from streaming tools while the tools are running
+            while not execution.done():
+                next_progress = asyncio.create_task(context.tool_progress.get())
+                await asyncio.wait({execution, next_progress}, return_when=asyncio.FIRST_COMPLETED)
+                if not next_progress.done():
+                    next_progress.cancel()
+                    break
+                yield await self._make_tool_progress_chunk(*next_progress.result())
+            while not context.tool_progress.empty():
+                yield await self._make_tool_progress_chunk(*context.tool_progress.get_nowait())
+            results = execution.result()
+        finally:
+            if not execution.done():
+                execution.cancel()
 
         tool_results = []
         for call, result in zip(context.current_tool_call, results):
             context.conversation_history.append(
                 AssistantMessage(tool_calls=[call])
             )
-            if isinstance(result, Exception):
+            if isinstance(result, ToolTimeoutError):
                 context.conversation_history.append(
-                    AssistantMessage(
-                        content=f"Error executing tool {call.function.name}: {str(result)}"
+                    ToolMessage(
+                        content=f"{result} and was cancelled; no result is available.",
+                        tool_call_id=call.id
+                    )
+                )
+            elif isinstance(result, ArgumentValidationError):
+                context.conversation_history.append(
+                    ToolMessage(
+                        content=result.to_tool_content(),
+                        tool_call_id=call.id
+                    )
+                )
+            elif isinstance(result, Exception):
+                context.conversation_history.append(
+                    ToolMessage(
+                        content=f"Error executing tool {call.function.name}: {str(result)}",
+                        tool_call_id=call.id
                     )
                 )
             else:
@@ -336,10 +538,18 @@ class StreamingChatAgent:
                     )
                 )
 
-        self.logger.debug("Tool execution results: %s", tool_results)
+        self.tracer.trace("Tool execution results: %s", tool_results)
         context.current_state = StreamState.INTERMEDIATE
         yield await SSEChunk.make_status_chunk(AgentStatus.TOOLS_EXECUTED)
 
+    @staticmethod
+    async def _make_tool_progress_chunk(tool_call: ToolCall, progress: ToolProgress) -> SSEChunk:
+        """Build the status chunk relaying a streaming tool's progress update."""
+        return await SSEChunk.make_status_chunk(
+            AgentStatus.TOOL_PROGRESS,
+            {"tool": tool_call.function.name, "tool_call_id": tool_call.id, **progress.model_dump(exclude_none=True)}
+        )
+
     @handle_streaming_errors
     async def _handle_intermediate(self, context: StreamContext) -> AsyncGenerator[SSEChunk, None]:
         """Handle the intermediate state between tool executions.
@@ -353,7 +563,7 @@ class StreamingChatAgent:
             SSEChunk: Status updates for continuation
         """
         context.message_buffer = ""
-        self.detection_strategy.reset()
+        context.detection_strategy.reset()
         context.current_state = StreamState.STREAMING
         yield await SSEChunk.make_status_chunk(AgentStatus.CONTINUING)
 
@@ -378,10 +588,31 @@ class StreamingChatAgent:
     #  HELPER METHODS
     # ----------------------------------------------------------------
 
+    def _select_history(self, conversation_history: List[TextChatMessage]) -> List[TextChatMessage]:
+        """Select the part of the conversation history sent to the model.
+
+        With a `history_token_budget` the newest messages are packed into the budget
+        left after the system prompt; otherwise the last `history_limit` messages are used.
+
+        Args:
+            conversation_history (List[TextChatMessage]): Previous conversation messages
+
+        Returns:
+            List[TextChatMessage]: Selected messages, oldest first
+        """
+        if self.history_token_budget:
+            budget = self.history_token_budget - self.system_prompt_tokens
+            return select_messages_within_budget(conversation_history, budget)
+
+        if self.history_limit > 0:
+            return conversation_history[-self.history_limit:]
+        return list(conversation_history)
+
     async def _initialize_context(
             self,
             conversation_history: List[TextChatMessage],
-            api_passed_context: Optional[Dict]
+            api_passed_context: Optional[Dict],
+            detection_strategy: BaseToolCallDetectionStrategy
     ) -> StreamContext:
         """Initialize the streaming context for a new conversation step.
 
@@ -391,15 +622,13 @@ class StreamingChatAgent:
         Args:
             conversation_history (List[TextChatMessage]): Previous conversation messages
             api_passed_context (Optional[Dict]): Additional context from the API
+            detection_strategy (BaseToolCallDetectionStrategy): Detection strategy leased
+                for this stream
 
         Returns:
             StreamContext: Initialized streaming context
         """
-        selected_history = (
-            conversation_history[-self.history_limit:]
-            if self.history_limit > 0
-            else conversation_history
-        )
+        selected_history = self._select_history(conversation_history)
 
         if self.system_prompt:
             system_message = SystemMessage(content=self.system_prompt)
@@ -407,12 +636,13 @@ class StreamingChatAgent:
 
         return StreamContext(
             conversation_history=selected_history,
-            tool_definitions=await self.tool_registry.get_tool_definitions(),
+            tool_definitions=self.tool_registry.get_definitions_snapshot().definitions,
             context=api_passed_context,
             llm_factory=self.llm_factory,
             current_state=StreamState.STREAMING,
             max_streaming_iterations=self.config.get("max_streaming_iterations", 1),
-            streaming_entry_count=0
+            streaming_entry_count=0,
+            detection_strategy=detection_strategy
         )
 
     async def _handle_complete_match(
@@ -444,36 +674,150 @@ class StreamingChatAgent:
             )
         context.current_state = StreamState.TOOL_DETECTION
 
-    async def _execute_tools_concurrently(self, context: StreamContext) -> List[Any]:
-        """Execute multiple tools concurrently.
+    async def _run_tool(self, tool_call: ToolCall, context: StreamContext) -> Any:
+        """Run a single tool call.
 
-        Run detected tools in parallel and handle their results or errors.
+        Args:
+            tool_call (ToolCall): The tool call to execute
+            context (StreamContext): Current streaming context
+
+        Returns:
+            Any: A dict with the tool name and result, or the exception raised while running it.
+                Arguments not matching the tool's schema are reported as an `ArgumentValidationError`
+                without running the tool. A tool exceeding its `execution_timeout` (or the agent's
+                `tool_execution_timeout`) is cancelled and reported as a `ToolTimeoutError`.
+        """
+        try:
+            tool = await self.tool_registry.get_tool(tool_call.function.name)
+            if not tool:
+                raise RuntimeError(f"Tool {tool_call.function.name} not found")
+            tool_args = self.tool_registry.validate_arguments(
+                tool_call.function.name, tool_call.function.parsed_arguments
+            )
+            timeout = (tool.config.get("timeouts") or {}).get("execution_timeout", self.tool_execution_timeout)
+            self.logger.info(f"Running tool {tool_call.function.name} with arguments: {tool_args}")
+            if inspect.isasyncgenfunction(tool.execute):
+                execution = self._consume_streaming_tool(tool, tool_call, tool_args, context)
+            else:
+                execution = tool.execute(context=context, **tool_args)
+            # Unlike wait_for, waiting on a task keeps the tool's own TimeoutErrors apart
+            execution_task = asyncio.ensure_future(execution)
+            try:
+                done, _ = await asyncio.wait({execution_task}, timeout=timeout)
+            finally:
+                if not execution_task.done():
+                    execution_task.cancel()
+            if not done:
+                raise ToolTimeoutError(tool_call.function.name, timeout,
+                                       f"Tool {tool_call.function.name} timed out after {timeout} seconds")
+            return {"tool_name": tool_call.function.name, "result": execution_task.result().result}
+
+        except (ArgumentValidationError, ToolTimeoutError) as e:
+            self.logger.warning(str(e))
+            return e
+        except Exception as e:
+            self.logger.error(f"Error executing tool {tool_call.function.name}", exc_info=True)
+            return e
+
+    @staticmethod
+    async def _consume_streaming_tool(
+            tool: BaseTool,
+            tool_call: ToolCall,
+            tool_args: Dict[str, Any],
+            context: StreamContext
+    ) -> ToolResponse:
+        """Run a streaming tool, queueing its progress updates until it yields a result.
 
         Args:
+            tool (BaseTool): Tool whose `execute` is an async generator
+            tool_call (ToolCall): The tool call being executed
+            tool_args (Dict[str, Any]): Parsed tool arguments
             context (StreamContext): Current streaming context
 
         Returns:
-            List[Any]: List of tool execution results or exceptions
+            ToolResponse: The first result yielded by the tool
 
         Raises:
-            RuntimeError: If a requested tool is not found
+            RuntimeError: If the tool finishes without yielding a `ToolResponse`
         """
-        async def run_tool(tool_call: ToolCall):
-            try:
-                tool = await self.tool_registry.get_tool(tool_call.function.name)
-                if not tool:
-                    raise RuntimeError(f"Tool {tool_call.function.name} not found")
-                tool_args = json5.loads(tool_call.function.arguments)
-                self.logger.info(f"Running tool {tool_call.function.name} with arguments: {tool_args}")
-                result = await tool.execute(
-                    context=context,
-                    **tool_args
-                )
-                return {"tool_name": tool_call.function.name, "result": result.result}
+        async with aclosing(tool.execute(context=context, **tool_args)) as updates:
+            async for update in updates:
+                if isinstance(update, ToolResponse):
+                    return update
+                context.tool_progress.put_nowait((tool_call, update))
+        raise RuntimeError(f"Streaming tool {tool_call.function.name} finished without a result")
+
+    @staticmethod
+    def _speculation_key(tool_call: ToolCall) -> str:
+        """Build the key matching a speculatively started tool call to its final form."""
+        return f"{tool_call.function.name}:{tool_call.function.arguments}"
+
+    def _start_speculative_tools(self, context: StreamContext, tool_calls: List[ToolCall]) -> None:
+        """Start executing tool calls whose arguments completed before the stream finished.
+
+        The LLM stream keeps being drained while these tasks run; `_execute_tools_concurrently`
+        picks up their results once the tool calls are confirmed.
 
-            except Exception as e:
-                self.logger.error(f"Error executing tool {tool_call.function.name}", exc_info=True)
-                return e
+        Args:
+            context (StreamContext): Current streaming context
+            tool_calls (List[ToolCall]): Tool calls reported as ready by the detection strategy
+        """
+        for tool_call in tool_calls:
+            key = self._speculation_key(tool_call)
+            if key not in context.speculative_tool_tasks:
+                self.tracer.trace("Speculatively starting tool %s", tool_call.function.name)
+                context.speculative_tool_tasks[key] = asyncio.create_task(self._run_tool(tool_call, context))
 
-        tasks = [run_tool(tc) for tc in context.current_tool_call]
-        return await asyncio.gather(*tasks, return_exceptions=True)
+    def _cancel_speculative_tools(self, context: StreamContext) -> None:
+        """Cancel speculative tool executions that were never claimed.
+
+        Args:
+            context (StreamContext): Current streaming context
+        """
+        for key, task in context.speculative_tool_tasks.items():
+            if not task.done():
+                self.tracer.trace("Cancelling unclaimed speculative tool execution: %s", key)
+                task.cancel()
+        context.speculative_tool_tasks.clear()
+
+    async def _execute_tools_concurrently(self, context: StreamContext) -> List[Any]:
+        """Execute multiple tools concurrently.
+
+        Run detected tools in parallel and handle their results or errors. Tool calls
+        that were already started speculatively are awaited rather than run again. Tools
+        still running when `tool_turn_timeout` expires are cancelled and reported as
+        `ToolTimeoutError`s, while the results of finished tools are kept.
+
+        Args:
+            context (StreamContext): Current streaming context
+
+        Returns:
+            List[Any]: List of tool execution results or exceptions
+        """
+        tasks = []
+        for tool_call in context.current_tool_call:
+            speculative_task = context.speculative_tool_tasks.pop(self._speculation_key(tool_call), None)
+            tasks.append(speculative_task or asyncio.create_task(self._run_tool(tool_call, context)))
+        self._cancel_speculative_tools(context)
+        if not tasks:
+            return []
+
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=self.tool_turn_timeout)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        results = []
+        for tool_call, task in zip(context.current_tool_call, tasks):
+            if task in pending or task.cancelled():
+                self.logger.warning(f"Tool {tool_call.function.name} cancelled at the "
+                                    f"{self.tool_turn_timeout}s turn timeout")
+                results.append(ToolTimeoutError(
+                    tool_call.function.name, self.tool_turn_timeout,
+                    f"Tool {tool_call.function.name} did not finish within {self.tool_turn_timeout} seconds"
+                ))
+            else:
+                results.append(task.exception() or task.result())
+        return results
@@ -0,0 +1,179 @@
+# src/agent/conversation_store.py
+
+import asyncio
+import sqlite3
+import logging
+from contextlib import asynccontextmanager, closing
+from pathlib import Path
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Optional
+
+from pydantic import TypeAdapter
+
+from src.data_models.chat_completions import TextChatMessage
+
+
+_message_adapter = TypeAdapter(TextChatMessage)
+
+
+class ConversationStore:
+    """Server-side store of conversation threads, keyed by thread ID.
+
+    Threads live in an in-memory LRU of at most `max_threads` threads. If `sqlite_path`
+    is set, every `append` is also written through to a local SQLite database, so
+    threads survive restarts, and a thread evicted from memory is loaded back from
+    SQLite the next time it is requested. SQLite holds one row per message, keyed by
+    thread ID and position, so an append only writes the new messages. Without
+    `sqlite_path`, evicted threads are dropped. SQLite access runs in a worker thread
+    so it never blocks the event loop.
+
+    A turn reads a thread and appends to it much later, once the response is complete.
+    `thread_lock` serializes turns on the same thread, so a concurrent turn builds on
+    the history the previous one saved instead of on the same stale history.
+
+    Args:
+        max_threads (int): Maximum number of threads kept in memory.
+        sqlite_path (Optional[str]): Path of the SQLite database threads are persisted to.
+
+    Example:
+        ```python
+        store = ConversationStore(max_threads=1024, sqlite_path="data/threads.db")
+
+        async with store.thread_lock(thread_id):
+            history = await store.load(thread_id)
+            ...
+            await store.append(thread_id, new_messages)
+        ```
+    """
+
+    def __init__(self, max_threads: int = 1024, sqlite_path: Optional[str] = None):
+        if max_threads < 1:
+            raise ValueError("max_threads must be at least 1")
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_threads = max_threads
+        self.sqlite_path = sqlite_path
+        self._threads: "OrderedDict[str, List[TextChatMessage]]" = OrderedDict()
+        self._lock = asyncio.Lock()
+        # Per-thread turn locks, with the number of turns holding or waiting for each
+        self._thread_locks: Dict[str, asyncio.Lock] = {}
+        self._thread_lock_users: Dict[str, int] = {}
+
+        if self.sqlite_path:
+            Path(self.sqlite_path).parent.mkdir(parents=True, exist_ok=True)
+            self._execute("CREATE TABLE IF NOT EXISTS thread_messages "
+                          "(thread_id TEXT NOT NULL, seq INTEGER NOT NULL, message TEXT NOT NULL, "
+                          "PRIMARY KEY (thread_id, seq))")
+        self.logger.debug("Initialized conversation store (max_threads=%d, sqlite_path=%s)",
+                          max_threads, sqlite_path)
+
+    @asynccontextmanager
+    async def thread_lock(self, thread_id: str) -> AsyncIterator[None]:
+        """Hold the thread for one turn, waiting for a turn already running on it.
+
+        Args:
+            thread_id (str): Thread identifier.
+        """
+        lock = self._thread_locks.get(thread_id)
+        if lock is None:
+            lock = self._thread_locks[thread_id] = asyncio.Lock()
+        self._thread_lock_users[thread_id] = self._thread_lock_users.get(thread_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._thread_lock_users[thread_id] -= 1
+            if not self._thread_lock_users[thread_id]:
+                del self._thread_lock_users[thread_id]
+                del self._thread_locks[thread_id]
+
+    async def load(self, thread_id: str) -> List[TextChatMessage]:
+        """Return the stored messages of a thread, oldest first.
+
+        Args:
+            thread_id (str): Thread identifier.
+
+        Returns:
+            List[TextChatMessage]: A copy of the thread's messages, empty for unknown threads.
+        """
+        async with self._lock:
+            thread = list(await self._get_thread(thread_id))
+            await self._evict()
+            return thread
+
+    async def append(self, thread_id: str, messages: List[TextChatMessage]) -> None:
+        """Append messages to a thread, creating it if needed, and persist the new messages.
+
+        Args:
+            thread_id (str): Thread identifier.
+            messages (List[TextChatMessage]): Messages to append, oldest first.
+        """
+        async with self._lock:
+            thread = await self._get_thread(thread_id)
+            if self.sqlite_path and messages:
+                rows = [
+                    (thread_id, seq, _message_adapter.dump_json(message).decode())
+                    for seq, message in enumerate(messages, start=len(thread))
+                ]
+                await asyncio.to_thread(
+                    self._execute_many,
+                    "INSERT INTO thread_messages (thread_id, seq, message) VALUES (?, ?, ?)",
+                    rows
+                )
+            thread.extend(messages)
+            await self._evict()
+
+    async def _get_thread(self, thread_id: str) -> List[TextChatMessage]:
+        """Get a thread from memory or SQLite and mark it most recently used. Requires `_lock`."""
+        thread = self._threads.get(thread_id)
+        if thread is not None:
+            self._threads.move_to_end(thread_id)
+            return thread
+
+        thread = []
+        if self.sqlite_path:
+            rows = await asyncio.to_thread(
+                self._execute, "SELECT message FROM thread_messages WHERE thread_id = ? ORDER BY seq", (thread_id,)
+            )
+            if rows:
+                thread = [_message_adapter.validate_json(row[0]) for row in rows]
+                self.logger.debug("Loaded thread %s from SQLite (%d messages)", thread_id, len(thread))
+
+        self._threads[thread_id] = thread
+        return thread
+
+    async def _evict(self) -> None:
+        """Drop least recently used threads beyond `max_threads` from memory. Requires `_lock`.
+
+        Threads are written through on every `append`, so SQLite already holds them.
+        """
+        while len(self._threads) > self.max_threads:
+            thread_id, _ = self._threads.popitem(last=False)
+            self.logger.debug("Evicted thread %s", thread_id)
+
+    def _execute(self, query: str, params: tuple = ()) -> List[tuple]:
+        """Run a single SQLite statement in its own connection and return all rows."""
+        with closing(sqlite3.connect(self.sqlite_path)) as connection, connection:
+            return connection.execute(query, params).fetchall()
+
+    def _execute_many(self, query: str, rows: List[tuple]) -> None:
+        """Run a SQLite statement once per row in a single transaction."""
+        with closing(sqlite3.connect(self.sqlite_path)) as connection, connection:
+            connection.executemany(query, rows)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict]) -> Optional["ConversationStore"]:
+        """Create a store from the agent's `conversation_store` settings.
+
+        Args:
+            config (Optional[Dict]): Settings with optional `max_threads` and `sqlite_path`.
+
+        Returns:
+            Optional[ConversationStore]: The store, or None if the store is not configured.
+        """
+        if config is None:
+            return None
+        return cls(
+            max_threads=config.get("max_threads", 1024),
+            sqlite_path=config.get("sqlite_path")
+        )
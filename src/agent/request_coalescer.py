@@ -0,0 +1,152 @@
+# src/agent/request_coalescer.py
+
+import json
+import asyncio
+import hashlib
+import logging
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional
+
+from src.api import SSEChunk
+from src.data_models.chat_completions import TextChatMessage
+
+
+class _Flight:
+    """An in-flight upstream stream and the chunks it has produced so far."""
+
+    def __init__(self):
+        self.chunks: List[SSEChunk] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.changed = asyncio.Event()
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def notify(self) -> None:
+        """Wake up every subscriber waiting for new chunks."""
+        changed, self.changed = self.changed, asyncio.Event()
+        changed.set()
+
+
+class RequestCoalescer:
+    """Single-flight layer that shares one agent run between identical concurrent requests.
+
+    The first request for a key (the leader) starts the producer stream in a background
+    task that records its chunks in a fan-out buffer. Identical requests arriving while
+    it is in flight (followers) subscribe to the same buffer, replaying the chunks
+    produced so far and then following along, instead of starting their own LLM stream
+    and tool calls. Every subscriber receives its own copy of each chunk.
+
+    The producer is cancelled once all subscribers have gone, and a key is forgotten as
+    soon as its stream completes, so only concurrent requests are ever coalesced.
+
+    Example:
+        ```python
+        coalescer = RequestCoalescer()
+        key = coalescer.make_key(messages, model_config, context)
+
+        async for chunk in coalescer.subscribe(key, lambda: agent_stream(messages)):
+            ...
+        ```
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._flights: Dict[str, _Flight] = {}
+
+    @staticmethod
+    def make_key(
+            messages: List[TextChatMessage],
+            model_config: Optional[Dict[str, Any]] = None,
+            context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Build the coalescing key for a request.
+
+        Args:
+            messages (List[TextChatMessage]): Request messages.
+            model_config (Optional[Dict[str, Any]]): Configuration of the model serving the request.
+            context (Optional[Dict[str, Any]]): Additional context passed from the API.
+
+        Returns:
+            str: SHA-256 hex digest of the normalized request.
+        """
+        normalized = {
+            "messages": [message.model_dump(mode="json", exclude_none=True) for message in messages],
+            "model_config": model_config,
+            "context": context
+        }
+        payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def subscribe(
+            self,
+            key: str,
+            producer: Callable[[], AsyncGenerator[SSEChunk, None]]
+    ) -> AsyncGenerator[SSEChunk, None]:
+        """Stream the chunks for a key, starting the producer if no flight is in progress.
+
+        Args:
+            key (str): Coalescing key from `make_key`.
+            producer (Callable[[], AsyncGenerator[SSEChunk, None]]): Creates the upstream
+                stream; only called by the leader.
+
+        Yields:
+            SSEChunk: A copy of each chunk produced by the shared stream.
+
+        Raises:
+            Exception: Any error raised by the shared stream, or a `RuntimeError` if the
+                shared stream was cancelled while this subscriber was still following it.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight()
+            self._flights[key] = flight
+            flight.task = asyncio.create_task(self._produce(key, flight, producer))
+        else:
+            self.logger.debug("Coalescing request into in-flight stream %s", key[:12])
+
+        flight.subscribers += 1
+        try:
+            position = 0
+            while True:
+                if position < len(flight.chunks):
+                    yield flight.chunks[position].model_copy()
+                    position += 1
+                elif flight.done:
+                    if flight.error is not None:
+                        raise flight.error
+                    return
+                else:
+                    await flight.changed.wait()
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.done:
+                self.logger.debug("All subscribers left stream %s, cancelling it", key[:12])
+                flight.task.cancel()
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+    async def _produce(
+            self,
+            key: str,
+            flight: _Flight,
+            producer: Callable[[], AsyncGenerator[SSEChunk, None]]
+    ) -> None:
+        """Drain the producer stream into the flight's buffer."""
+        try:
+            async with aclosing(producer()) as stream:
+                async for chunk in stream:
+                    flight.chunks.append(chunk)
+                    flight.notify()
+        except asyncio.CancelledError:
+            # Followers get an ordinary error; the cancellation itself stays with this task
+            flight.error = RuntimeError("coalesced stream cancelled")
+            raise
+        except Exception as e:
+            self.logger.error("Coalesced stream %s failed", key[:12], exc_info=True)
+            flight.error = e
+        finally:
+            flight.done = True
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            flight.notify()
@@ -1,6 +1,6 @@
 # src/api/request_models.py
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 from src.data_models.chat_completions import TextChatMessage
 
@@ -41,7 +41,61 @@ class ChatCompletionRequest(BaseModel):
         model (Optional[str]): ID of the model to use for completion.
         messages (List[dict]): Array of message objects with role and content.
         context (Optional[ContextModel]): Additional context for API tools.
+        stream (bool): Whether to stream the response as server-sent events. When False,
+            a single `chat.completion` object is returned.
     """
     model: Optional[str] = Field(None, description="ID of the model to use")
     messages: List[TextChatMessage] = Field(..., description="Array of messages (role/content)")
     context: Optional[ContextModel] = Field(None, description="Additional context values (e.g. for API tools)")
+    stream: bool = Field(True, description="Stream the response as server-sent events")
+
+
+class ChatCompletionResponseMessage(BaseModel):
+    """Assistant message of a non-streaming chat completion.
+
+    Attributes:
+        role (str): Always "assistant".
+        content (Optional[str]): The full response text.
+        refusal (Optional[str]): Refusal message, if the assistant declined to respond.
+    """
+    role: str = Field("assistant", description="Role of the message author")
+    content: Optional[str] = Field(None, description="The full response text")
+    refusal: Optional[str] = Field(None, description="Refusal message, if any")
+
+
+class ChatCompletionResponseChoice(BaseModel):
+    """A single choice of a non-streaming chat completion.
+
+    Attributes:
+        index (int): Index of the choice.
+        message (ChatCompletionResponseMessage): The aggregated assistant message.
+        finish_reason (Optional[str]): Reason the generation finished.
+    """
+    index: int = 0
+    message: ChatCompletionResponseMessage
+    finish_reason: Optional[str] = None
+
+
+class ChatCompletionResponse(BaseModel):
+    """Response model for non-streaming (`stream: false`) chat completions.
+
+    Follows the OpenAI `chat.completion` object, with the agent's tool activity
+    (the status updates a streaming client would receive) attached as metadata.
+
+    Attributes:
+        id (str): Completion identifier.
+        object (str): Always "chat.completion".
+        created (int): Unix timestamp of creation.
+        model (str): Model identifier.
+        choices (List[ChatCompletionResponseChoice]): The completion choices.
+        thread_id (Optional[str]): Thread ID passed in the request, if any.
+        tool_activity (Optional[List[Dict[str, Any]]]): Status updates emitted while
+            detecting and executing tools.
+    """
+    id: str
+    object: str = "chat.completion"
+    created: int
+    model: str
+    choices: List[ChatCompletionResponseChoice]
+    thread_id: Optional[str] = None
+    tool_activity: Optional[List[Dict[str, Any]]] = Field(None, description="Tool status updates")
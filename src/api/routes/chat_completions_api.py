@@ -15,14 +15,22 @@ import os
 import time
 import yaml
 import logging
-from typing import List, Optional
-from fastapi.responses import StreamingResponse
+from contextlib import aclosing
+from typing import List, Optional, AsyncGenerator
+from fastapi.responses import StreamingResponse, JSONResponse
 from starlette.status import HTTP_403_FORBIDDEN
 from fastapi.security.api_key import APIKeyHeader
 from fastapi import APIRouter, Body, Depends, Header, HTTPException
 
+from src.api import SSEChunk
 from src.agent import StreamingChatAgent
-from src.api.request_models import ChatCompletionRequest
+from src.utils.tracing import HotPathTracer
+from src.api.request_models import (
+    ChatCompletionRequest,
+    ChatCompletionResponse,
+    ChatCompletionResponseChoice,
+    ChatCompletionResponseMessage
+)
 from src.data_models.chat_completions import (
     TextChatMessage,
     UserMessage,
@@ -30,6 +38,7 @@ from src.data_models.chat_completions import (
 )
 
 logger = logging.getLogger(__name__)
+tracer = HotPathTracer(logger)
 router = APIRouter()
 
 # Capture the agent's start time once when the app starts.
@@ -132,13 +141,76 @@ def get_non_sensitive_config(config: dict) -> dict:
     }
 
 
+async def aggregate_completion(
+        response_stream: AsyncGenerator[SSEChunk, None],
+        thread_id: Optional[str] = None
+) -> ChatCompletionResponse:
+    """Run an agent response stream to completion and aggregate it into one response.
+
+    Assistant content is concatenated, and status updates are collected as tool
+    activity, so no per-chunk serialization takes place.
+
+    Args:
+        response_stream (AsyncGenerator[SSEChunk, None]): The agent's response stream.
+        thread_id (Optional[str]): Thread ID to echo in the response.
+
+    Returns:
+        ChatCompletionResponse: The aggregated `chat.completion` object.
+    """
+    content_parts = []
+    refusal_parts = []
+    tool_activity = []
+    finish_reason = None
+
+    async with aclosing(response_stream) as stream:
+        async for sse_chunk in stream:
+            if not sse_chunk or not sse_chunk.choices:
+                continue
+            choice = sse_chunk.choices[0]
+            if choice.delta.metadata:
+                tool_activity.append(choice.delta.metadata)
+            elif choice.delta.role == "assistant":
+                if choice.delta.content:
+                    content_parts.append(choice.delta.content)
+                if choice.delta.refusal:
+                    refusal_parts.append(choice.delta.refusal)
+            if choice.finish_reason in ["stop", "tool_calls"]:
+                finish_reason = choice.finish_reason
+                break
+
+    return ChatCompletionResponse(
+        id=f"chatcmpl-{time.time()}",
+        created=int(time.time()),
+        model="agent-01",
+        choices=[
+            ChatCompletionResponseChoice(
+                message=ChatCompletionResponseMessage(
+                    content="".join(content_parts),
+                    refusal="".join(refusal_parts) or None
+                ),
+                finish_reason=finish_reason
+            )
+        ],
+        thread_id=thread_id,
+        tool_activity=tool_activity or None
+    )
+
+
 @router.post(
     "/chat/completions",
     summary="Generate streaming chat completions",
-    description="Generate a streaming response from the agent based on user input.",
+    description="Generate a streaming response from the agent based on user input. "
+                "Set `stream` to false to receive a single `chat.completion` object instead.",
     tags=["Agent Chat"],
     operation_id="chat",
-    response_class=StreamingResponse
+    responses={
+        200: {
+            "model": ChatCompletionResponse,
+            "description": "Server-sent `thread.message.delta` events, or a `chat.completion` "
+                           "object when `stream` is false.",
+            "content": {"text/event-stream": {"schema": {"type": "string"}}}
+        }
+    }
 )
 async def chat_completions(
         request_body: ChatCompletionRequest = Body(...),
@@ -149,16 +221,19 @@ async def chat_completions(
     """Generate streaming chat completions from the agent.
 
     Processes incoming chat messages and returns a streaming response with
-    token-by-token updates.
+    token-by-token updates. When the agent's conversation store is enabled and a
+    thread ID is sent, only the new messages need to be included in the request.
 
     Args:
         request_body (ChatCompletionRequest): The chat completion request.
-        x_ibm_thread_id (Optional[str]): Thread ID for response correlation.
+        x_ibm_thread_id (Optional[str]): Thread ID for response correlation and server-side
+            conversation storage.
         agent (StreamingChatAgent): The chat agent instance.
         api_key (Optional[str]): Validated API key.
 
     Returns:
-        StreamingResponse: Server-sent events stream of completion tokens.
+        StreamingResponse: Server-sent events stream of completion tokens, or a JSONResponse
+            holding a `ChatCompletionResponse` when `stream` is false.
 
     Raises:
         HTTPException: If processing fails or invalid input is provided.
@@ -170,25 +245,33 @@ async def chat_completions(
         logger.debug("Initiating streaming response")
         response_stream = agent.stream_step(
             conversation_history=processed_messages,
-            api_passed_context=request_body.context.model_dump() if request_body.context else None
+            api_passed_context=request_body.context.model_dump() if request_body.context else None,
+            thread_id=x_ibm_thread_id
         )
 
+        if not request_body.stream:
+            logger.debug("Aggregating non-streaming response")
+            completion = await aggregate_completion(response_stream, x_ibm_thread_id)
+            return JSONResponse(content=completion.model_dump(mode="json", exclude_none=True))
+
         async def sse_generator():
             """Generate SSE chunks from the response stream."""
             try:
-                async for sse_chunk in response_stream:
-                    if sse_chunk:
-                        if x_ibm_thread_id:
-                            sse_chunk.thread_id = x_ibm_thread_id
-                        sse_chunk.object = "thread.message.delta"
-
-                        logger.debug("Sending SSE chunk")
-                        yield f"data: {sse_chunk.model_dump_json(exclude_none=True)}\n\n"
-
-                        if any(choice.finish_reason in ["stop", "tool_calls"]
-                               for choice in sse_chunk.choices):
-                            logger.debug("Stream completed")
-                            return
+                # Close the agent stream as soon as we stop reading so the turn is finalized
+                async with aclosing(response_stream) as stream:
+                    async for sse_chunk in stream:
+                        if sse_chunk:
+                            if x_ibm_thread_id:
+                                sse_chunk.thread_id = x_ibm_thread_id
+                            sse_chunk.object = "thread.message.delta"
+
+                            tracer.sample("Sending SSE chunk")
+                            yield f"data: {sse_chunk.model_dump_json(exclude_none=True)}\n\n"
+
+                            if any(choice.finish_reason in ["stop", "tool_calls"]
+                                   for choice in sse_chunk.choices):
+                                logger.debug("Stream completed")
+                                return
             except Exception as e:
                 logger.error("Error in SSE generator: %s", str(e), exc_info=True)
                 return
@@ -11,6 +11,7 @@ from pydantic import BaseModel
 class AgentStatus(str, Enum):
     STARTING = "starting_generation"
     TOOL_DETECTED = "tool_call_detected"
+    TOOL_PROGRESS = "tool_progress"
     TOOLS_EXECUTED = "tools_executed"
     MAX_DEPTH = "max_depth_reached"
     CONTINUING = "continuing_generation"
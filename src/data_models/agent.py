@@ -1,8 +1,9 @@
 # src/data_models/agent.py
 
+import asyncio
 from enum import Enum
 from pydantic import BaseModel, Field
-from typing import List, Optional, Any, Dict
+from typing import List, Optional, Any, Dict, Sequence
 
 from src.llm import LLMFactory
 from src.data_models.tools import Tool
@@ -90,7 +91,8 @@ class StreamContext(BaseModel):
     Attributes:
         conversation_history (List[TextChatMessage]): The full conversation history,
             including a system message at the start if available.
-        tool_definitions (List[Tool]): Definitions of available tools for execution.
+        tool_definitions (Sequence[Tool]): Definitions of available tools for execution, usually
+            the registry's immutable snapshot tuple.
         message_buffer (str): Buffer for accumulating generated response text.
         tool_call_buffer (str): Buffer for accumulating potential tool call text until parsing.
         current_tool_call (Optional[List[ToolCall]]): The currently processing tool calls, if any.
@@ -99,14 +101,21 @@ class StreamContext(BaseModel):
         max_streaming_iterations (int): The maximum allowed number of times the streaming state can be initiated.
         context (Optional[Dict[str, Any]]): Additional metadata associated with the streaming session.
         llm_factory (Optional[LLMFactory]): LLM factory associated with the streaming agent.
+        detection_strategy (Optional[Any]): Tool call detection strategy leased for this stream.
+        speculative_tool_tasks (Dict[str, Any]): Tool executions started before the stream
+            finished, keyed by tool call signature.
+        tool_progress (asyncio.Queue): Progress updates from streaming tools, as
+            `(ToolCall, ToolProgress)` pairs, waiting to be relayed to the client.
+        error_fallback (bool): Whether a state handler failed and the client was sent the
+            generic error message instead of a real response.
     """
 
     conversation_history: List[TextChatMessage] = Field(
         default_factory=list,
         description="Full conversation history with system message at the start."
     )
-    tool_definitions: List[Tool] = Field(
-        default_factory=list,
+    tool_definitions: Sequence[Tool] = Field(
+        default_factory=tuple,
         description="Definitions of available tools."
     )
     message_buffer: str = Field(
@@ -141,6 +150,22 @@ class StreamContext(BaseModel):
         default=None,
         description="LLM Model factory for retrieving LLM adapters."
     )
+    detection_strategy: Optional[Any] = Field(
+        default=None,
+        description="Tool call detection strategy leased for this stream."
+    )
+    speculative_tool_tasks: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Tool executions started before the stream finished, keyed by tool call signature."
+    )
+    tool_progress: asyncio.Queue = Field(
+        default_factory=asyncio.Queue,
+        description="Progress updates from streaming tools waiting to be relayed to the client."
+    )
+    error_fallback: bool = Field(
+        default=False,
+        description="Whether a state handler failed and the generic error message was sent instead."
+    )
 
     class Config:
         """Pydantic model configuration."""
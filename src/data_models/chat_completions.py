@@ -1,8 +1,16 @@
 # src/data_models/chat_completions.py
 
 import json
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Union, Optional, Literal, Annotated, Dict
+from enum import Enum
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
+from typing import Any, List, Union, Optional, Literal, Annotated, Dict
+
+from src.utils.tool_arguments import dumps_arguments, loads_arguments
+
+
+class _Unparsed(Enum):
+    """Marks arguments that have not been parsed yet; arguments may parse to None."""
+    TOKEN = 0
 
 
 class MessageBase(BaseModel):
@@ -16,8 +24,11 @@ class MessageBase(BaseModel):
 
     Note:
         This class should not be used directly but rather inherited by specific message types.
+        The estimated token count is memoized on the private `_token_count` attribute by
+        `src.utils.token_counter.count_message_tokens`.
     """
     role: str
+    _token_count: Optional[int] = PrivateAttr(default=None)
 
     model_config = ConfigDict(extra='forbid')
 
@@ -83,21 +94,63 @@ class FunctionDetail(BaseModel):
     """Defines the structure for function call details in tool calls.
 
     This model contains the essential information needed to execute a function
-    through the tool calling system.
+    through the tool calling system. Arguments are kept as JSON text, the wire
+    format of the chat completions API, together with their parsed value, so
+    tools receive them without another round trip through a string.
 
     Attributes:
         name (str): The name of the function to be called.
-        arguments (Dict): Dictionary of arguments to be passed to the function.
+        arguments (str): JSON text of the arguments to be passed to the function.
+        parsed_arguments (Any): The parsed arguments. Parsed from `arguments` on
+            first access unless the model was built with `from_arguments`.
     """
     name: str = Field(..., description="Name of the function")
     arguments: str = Field(..., description="Arguments for the function")
+    _parsed_arguments: Any = PrivateAttr(default=_Unparsed.TOKEN)
+
+    @classmethod
+    def from_arguments(cls, name: str, arguments: Any) -> "FunctionDetail":
+        """Build function details from parsed or textual arguments.
+
+        Parsed arguments are serialized to canonical JSON text. Argument text is parsed,
+        falling back to JSON5 for malformed model output, and re-serialized so that
+        `arguments` is always valid JSON; text that cannot be parsed is kept as is.
+
+        Args:
+            name (str): The name of the function to be called.
+            arguments (Any): Parsed arguments, or their JSON text.
+
+        Returns:
+            FunctionDetail: The function details with both representations set.
+        """
+        if isinstance(arguments, str):
+            try:
+                parsed = loads_arguments(arguments) if arguments.strip() else {}
+            except ValueError:
+                return cls(name=name, arguments=arguments)
+        else:
+            parsed = {} if arguments is None else arguments
+        detail = cls(name=name, arguments=dumps_arguments(parsed))
+        detail._parsed_arguments = parsed
+        return detail
+
+    @property
+    def parsed_arguments(self) -> Any:
+        """Any: The parsed arguments.
+
+        Raises:
+            ValueError: If `arguments` is neither valid JSON nor JSON5.
+        """
+        if self._parsed_arguments is _Unparsed.TOKEN:
+            self._parsed_arguments = loads_arguments(self.arguments) if self.arguments.strip() else {}
+        return self._parsed_arguments
 
 
 class ToolCall(BaseModel):
     """Represents a tool call made by the assistant.
 
-    This model handles the structure and formatting of tool calls, including
-    custom serialization of function arguments to JSON.
+    This model handles the structure and formatting of tool calls. Function
+    arguments serialize as JSON text, as in the chat completions API.
 
     Attributes:
         id (str): Unique identifier for the tool call.
@@ -105,9 +158,6 @@ class ToolCall(BaseModel):
         function (FunctionDetail): Detailed information about the function to be called.
 
     Methods:
-        model_dump(*args, **kwargs) -> dict:
-            Custom serialization method that converts function arguments to JSON string.
-
         format_tool_calls() -> str:
             Formats the tool call as a JSON array string for API compatibility.
     """
@@ -115,17 +165,6 @@ class ToolCall(BaseModel):
     type: Literal["function"] = Field(default="function", description="Tool type, currently only 'function' is allowed")
     function: FunctionDetail = Field(..., description="Details of the function call, including name and arguments")
 
-    def model_dump(self, *args, **kwargs) -> dict:
-        """Custom model_dump to convert 'arguments' in function to a JSON string."""
-        # Call the original model_dump
-        data = super().model_dump(*args, **kwargs)
-
-        # Convert 'arguments' to a JSON string within 'function'
-        if "function" in data:
-            data["function"]["arguments"] = json.dumps(data["function"]["arguments"])
-
-        return data
-
     def format_tool_calls(self) -> str:
         """Format tool call as a JSON array string."""
         formatted_call = {
@@ -196,6 +235,7 @@ class ToolMessage(BaseModel):
     role: Literal["tool"] = Field(default="tool", description="Role is fixed to 'tool' for tool messages")
     content: str = Field(..., description="The content of the tool message")
     tool_call_id: Optional[str] = Field(default='123abcdef', description="Tool call ID")
+    _token_count: Optional[int] = PrivateAttr(default=None)
 
 
 """Represents all possible message types in the chat completion system.
@@ -121,3 +121,20 @@ class ToolResponse(BaseModel):
         default=None,
         description="Additional contextual information or metadata about the execution"
     )
+
+
+class ToolProgress(BaseModel):
+    """Represents an intermediate update yielded by a streaming tool.
+
+    Streaming tools implement `execute` as an async generator. Each `ToolProgress` they
+    yield is relayed to the client as a status chunk; the first `ToolResponse` they
+    yield becomes the tool's result and ends the execution.
+    """
+
+    message: str = Field(
+        description="Human-readable description of the progress made so far"
+    )
+    details: Optional[Dict] = Field(
+        default=None,
+        description="Additional structured data about the progress, such as partial results"
+    )
@@ -1,5 +1,6 @@
 from .anthropic_adapter import AnthropicAdapter
 from .base_vendor_adapter import BaseVendorAdapter
+from .sse_decoder import SSEDecoder, SSEEvent
 from .openai_adapter import OpenAIAdapter
 from .mistral_ai_adapter import MistralAIAdapter
 from .watsonx.watsonx_adapter import WatsonXAdapter
@@ -140,7 +140,7 @@ def convert_assistant_message(msg: AssistantMessage) -> Dict[str, Any]:
                 "type": "tool_use",
                 "id": call.id,
                 "name": call.function.name,
-                "input": call.function.arguments,
+                "input": call.function.parsed_arguments,
             })
     return {"role": "assistant", "content": blocks}
 
@@ -305,6 +305,7 @@ class AnthropicAdapter(BaseVendorAdapter):
                             role="assistant",
                             content="",
                             tool_calls=[SSEToolCall(
+                                index=raw_event.index,
                                 id=content_block.id,
                                 type="function",
                                 function=SSEFunction(name=content_block.name, arguments=""),
@@ -333,6 +334,7 @@ class AnthropicAdapter(BaseVendorAdapter):
                             role="assistant",
                             content="",
                             tool_calls=[SSEToolCall(
+                                index=raw_event.index,
                                 type="function",
                                 function=SSEFunction(
                                     name="",
@@ -24,3 +24,17 @@ class BaseVendorAdapter:
     @abstractmethod
     async def gen_chat_sse_stream(self, messages: List[TextChatMessage], tools: Optional[List[Tool]]) -> AsyncGenerator[SSEChunk, None]:
         pass
+
+    async def startup(self) -> None:
+        """
+        Prepare long-lived resources, such as pooled HTTP sessions, when the application starts.
+        Adapters without such resources need not override this.
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Release long-lived resources when the application shuts down.
+        Adapters without such resources need not override this.
+        """
+        pass
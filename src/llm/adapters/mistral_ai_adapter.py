@@ -10,9 +10,11 @@ from typing import AsyncGenerator, List, Optional
 from src.data_models.tools import Tool
 from src.llm.adapters import BaseVendorAdapter
 from src.data_models.chat_completions import TextChatMessage
+from src.utils.tracing import HotPathTracer
 from src.api import SSEChunk, SSEChoice, SSEDelta, SSEToolCall, SSEFunction
 
 logger = logging.getLogger(__name__)
+tracer = HotPathTracer(logger)
 
 
 class MistralAIAdapter(BaseVendorAdapter):
@@ -142,7 +144,7 @@ class MistralAIAdapter(BaseVendorAdapter):
             if 'data' in chunk_data:
                 chunk_data = chunk_data['data']
 
-            logger.debug(f"Converting chunk ID: {chunk_data.get('id', 'unknown')}")
+            tracer.sample("Converting chunk ID: %s", chunk_data.get('id', 'unknown'))
 
             # Process choices
             choices = []
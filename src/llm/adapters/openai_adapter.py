@@ -8,9 +8,11 @@ from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 from src.data_models.tools import Tool
 from src.llm.adapters import BaseVendorAdapter
 from src.data_models.chat_completions import TextChatMessage
+from src.utils.tracing import HotPathTracer
 from src.api import SSEChunk, SSEChoice, SSEDelta, SSEToolCall, SSEFunction
 
 logger = logging.getLogger(__name__)
+tracer = HotPathTracer(logger)
 
 
 class OpenAIAdapter(BaseVendorAdapter):
@@ -135,7 +137,7 @@ class OpenAIAdapter(BaseVendorAdapter):
             ValueError: If chunk conversion fails due to unexpected format.
         """
         try:
-            logger.debug(f"Converting chunk ID: {raw_chunk.id}")
+            tracer.sample("Converting chunk ID: %s", raw_chunk.id)
             choices = []
             for choice in raw_chunk.choices:
                 tool_calls = None
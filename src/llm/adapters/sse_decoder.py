@@ -0,0 +1,130 @@
+# src/llm/adapters/sse_decoder.py
+
+import json
+from typing import Any, List, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+# Parses JSON directly from bytes, without decoding them to str first
+loads_json = orjson.loads if orjson is not None else json.loads
+
+
+class SSEEvent(NamedTuple):
+    """A server-sent event.
+
+    Attributes:
+        data: The event's data lines joined by newlines, still encoded.
+        event: The event type, if the event set one.
+        id: The event ID, if the event set one.
+    """
+    data: bytes
+    event: Optional[str] = None
+    id: Optional[str] = None
+
+    def json(self) -> Any:
+        """Parse the data as JSON."""
+        return loads_json(self.data)
+
+
+class SSEDecoder:
+    """Incremental decoder for server-sent event streams working on raw bytes.
+
+    Network chunks are appended to a byte buffer as they arrive, and complete events
+    are split off at blank lines without decoding each line to a string. Only the
+    short `event` and `id` fields are decoded; `data` stays bytes, so it can go
+    straight to a JSON parser. Line endings may be `\\n`, `\\r\\n` or `\\r`, and comment
+    lines are skipped, as in the SSE specification. Events without data are dropped.
+
+    The decoder is not tied to any HTTP client, so adapters that call an HTTP API
+    directly can share it.
+
+    Example:
+        ```python
+        decoder = SSEDecoder()
+        async for chunk in response.content.iter_any():
+            for event in decoder.feed(chunk):
+                handle(event.json())
+        for event in decoder.flush():
+            handle(event.json())
+        ```
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._scanned = 0
+        self._carriage_return_pending = False
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """Add received bytes and return the events they complete.
+
+        Args:
+            chunk (bytes): Bytes following everything fed so far.
+
+        Returns:
+            List[SSEEvent]: Events completed by this chunk, in stream order.
+        """
+        buffer = self._buffer
+        buffer += chunk
+        if self._carriage_return_pending or b"\r" in chunk:
+            self._normalize_line_endings()
+
+        events = []
+        start = 0
+        # A separator can straddle the previous chunk, so resume one byte early
+        end = buffer.find(b"\n\n", max(self._scanned - 1, 0))
+        while end != -1:
+            event = self._parse_event(bytes(buffer[start:end]))
+            if event is not None:
+                events.append(event)
+            start = end + 2
+            end = buffer.find(b"\n\n", start)
+
+        if start:
+            del buffer[:start]
+        self._scanned = len(buffer)
+        return events
+
+    def flush(self) -> List[SSEEvent]:
+        """Return the final event if the stream ended without a blank line, and reset."""
+        block = bytes(self._buffer).rstrip(b"\r\n")
+        self._buffer.clear()
+        self._scanned = 0
+        self._carriage_return_pending = False
+        event = self._parse_event(block) if block else None
+        return [event] if event is not None else []
+
+    def _normalize_line_endings(self) -> None:
+        """Convert `\\r\\n` and lone `\\r` line endings in the buffer to `\\n`."""
+        buffer = self._buffer
+        # A trailing \r may be the first half of a \r\n still in transit
+        pending = buffer.endswith(b"\r")
+        if pending:
+            del buffer[-1:]
+        buffer[:] = buffer.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        if pending:
+            buffer += b"\r"
+        self._carriage_return_pending = pending
+        self._scanned = 0
+
+    @staticmethod
+    def _parse_event(block: bytes) -> Optional[SSEEvent]:
+        """Parse the lines of one event."""
+        data = []
+        event = event_id = None
+        for line in block.split(b"\n"):
+            field, _, value = line.partition(b":")
+            if value.startswith(b" "):
+                value = value[1:]
+            if field == b"data":
+                data.append(value)
+            elif field == b"event":
+                event = value.decode("utf-8")
+            elif field == b"id":
+                event_id = value.decode("utf-8")
+            # Empty field names are comments; unknown fields are ignored
+        if not data:
+            return None
+        return SSEEvent(data[0] if len(data) == 1 else b"\n".join(data), event, event_id)
@@ -12,17 +12,19 @@ from tenacity import (
     retry_if_exception_type,
     before_sleep_log
 )
-from contextlib import asynccontextmanager
 from typing import AsyncGenerator, List, Optional, Dict, Any
 
 from src.data_models.tools import Tool
 from src.llm.adapters import BaseVendorAdapter
 from src.data_models.chat_completions import TextChatMessage
+from src.utils.tracing import HotPathTracer, Lazy
+from src.llm.adapters.sse_decoder import SSEDecoder, SSEEvent
 from src.llm.adapters.watsonx.watsonx_config import WatsonXConfig
 from src.llm.adapters.watsonx.ibm_token_manager import IBMTokenManager
 from src.api.sse_models import SSEChunk, SSEChoice, SSEDelta, SSEToolCall, SSEFunction
 
 logger = logging.getLogger(__name__)
+tracer = HotPathTracer(logger)
 
 MAX_RETRIES = 1  # no retries
 MIN_RETRY_WAIT = 1  # seconds
@@ -33,6 +35,9 @@ DEFAULT_TIMEOUT = aiohttp.ClientTimeout(
     connect=60,  # 60 seconds connection timeout
     sock_read=60  # 60 seconds socket read timeout
 )
+DEFAULT_LIMIT_PER_HOST = 10  # concurrent connections to the WatsonX endpoint
+DEFAULT_DNS_CACHE_TTL = 300  # seconds
+DEFAULT_KEEPALIVE_TIMEOUT = 30  # seconds an idle connection is kept open
 
 
 class WatsonXAdapter(BaseVendorAdapter):
@@ -50,13 +55,22 @@ class WatsonXAdapter(BaseVendorAdapter):
         project_id (str): WatsonX project identifier.
         base_url (str): Base URL for WatsonX API endpoints.
         timeout (aiohttp.ClientTimeout): Timeout configuration for requests.
-        _session (Optional[aiohttp.ClientSession]): Reusable HTTP session.
+        limit_per_host (int): Maximum number of concurrent connections to the API host.
+        dns_cache_ttl (int): Seconds a resolved API host address is cached.
+        keepalive_timeout (float): Seconds an idle connection stays open for reuse.
+        _sessions (Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession]): HTTP session
+            shared by all requests of this adapter on each event loop, created on first
+            use. Reusing its connections saves the DNS lookup and TCP and TLS handshakes
+            on every generation.
     """
 
     def __init__(self,
                  model_name: str,
                  token_manager: IBMTokenManager,
                  timeout: Optional[aiohttp.ClientTimeout] = None,
+                 limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+                 dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+                 keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
                  **model_params):
         """Initialize the WatsonX Adapter with model configuration.
 
@@ -64,6 +78,9 @@ class WatsonXAdapter(BaseVendorAdapter):
             model_name (str): The identifier of the WatsonX model to use.
             token_manager (IBMTokenManager): Manager for handling IBM authentication.
             timeout (Optional[aiohttp.ClientTimeout]): Custom timeout configuration.
+            limit_per_host (int): Maximum number of concurrent connections to the API host.
+            dns_cache_ttl (int): Seconds a resolved API host address is cached.
+            keepalive_timeout (float): Seconds an idle connection stays open for reuse.
             **model_params: Additional parameters to include in model requests.
 
         Raises:
@@ -74,26 +91,75 @@ class WatsonXAdapter(BaseVendorAdapter):
         self.token_manager = token_manager
         self.project_id = WatsonXConfig.PROJECT_ID
         self.base_url = "https://us-south.ml.cloud.ibm.com/ml/v1/text"
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._sessions: Dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
         self.timeout = timeout or DEFAULT_TIMEOUT
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
         logger.info(f"WatsonX Adapter initialized with model: {self.model_id}")
         logger.debug(f"Model parameters configured: {model_params}")
         logger.debug(f"Timeout configuration: {self.timeout}")
 
-    @asynccontextmanager
-    async def _session_context(self):
-        """Manage the lifecycle of an HTTP session.
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session of the running event loop, creating it on first use.
 
-        Yields:
-            aiohttp.ClientSession: Active HTTP session for making requests.
+        A session is bound to the event loop it was created in, so each loop gets its
+        own session, kept until `close()`. Sessions of loops that have been closed
+        since are discarded when a new session is created.
+
+        Returns:
+            aiohttp.ClientSession: The adapter's keep-alive HTTP session.
         """
-        logger.debug("Creating new HTTP session")
-        session = aiohttp.ClientSession(timeout=self.timeout)
-        try:
-            yield session
-        finally:
-            await session.close()
-            logger.debug("HTTP session closed")
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            self._discard_dead_sessions()
+            logger.debug("Creating pooled HTTP session (limit per host: %d)", self.limit_per_host)
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._sessions[loop] = session
+        return session
+
+    def _discard_dead_sessions(self) -> None:
+        """Forget the sessions of event loops that have been closed.
+
+        A closed loop can no longer run the session's cleanup, so the session is only
+        detached from its connector; this is logged, as the adapter should have been
+        closed before its loop ended.
+        """
+        for loop in [loop for loop in self._sessions if loop.is_closed()]:
+            session = self._sessions.pop(loop)
+            if not session.closed:
+                logger.warning("Discarding HTTP session of a closed event loop; "
+                               "close() the adapter before its event loop ends")
+                session.detach()
+
+    async def startup(self) -> None:
+        """Create the shared HTTP session ahead of the first request."""
+        self._get_session()
+
+    async def close(self) -> None:
+        """Close the shared HTTP sessions of all event loops and their pooled connections.
+
+        Sessions of other running loops are closed on their own loop.
+        """
+        current_loop = asyncio.get_running_loop()
+        sessions, self._sessions = self._sessions, {}
+        for loop, session in sessions.items():
+            if session.closed:
+                continue
+            if loop is current_loop:
+                await session.close()
+            elif loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+            else:
+                logger.warning("Discarding HTTP session of an event loop that is no longer running")
+                session.detach()
+        logger.debug("HTTP sessions closed")
 
     async def gen_chat_sse_stream(
             self,
@@ -206,35 +272,28 @@ class WatsonXAdapter(BaseVendorAdapter):
             "Accept": "application/json",
         }
 
-        logger.debug(f"Making request to endpoint: {endpoint}")
-        logger.debug(f"Request payload: {json.dumps(payload, indent=2)}")
+        logger.debug("Making request to endpoint: %s", endpoint)
+        tracer.trace("Request payload: %s", Lazy(json.dumps, payload, indent=2))
 
         try:
-            async with self._session_context() as session:
-                async with session.post(url,
-                                        json=payload,
-                                        headers=headers,
-                                        timeout=timeout or self.timeout) as resp:
-                    resp.raise_for_status()
-                    logger.debug(f"Stream connected, status: {resp.status}")
-
-                    buffer = []
-                    async for raw_line in resp.content:
-                        line = raw_line.decode("utf-8").strip()
-
-                        if not line:
-                            event_data = self._parse_sse_event(buffer)
-                            buffer = []
-
-                            if "data" in event_data:
-                                try:
-                                    data_parsed = json.loads(event_data["data"])
-                                    yield data_parsed
-                                except json.JSONDecodeError:
-                                    logger.warning(f"Skipping invalid SSE data: {event_data['data']}")
-                            continue
-
-                        buffer.append(line)
+            session = self._get_session()
+            async with session.post(url,
+                                    json=payload,
+                                    headers=headers,
+                                    timeout=timeout or self.timeout) as resp:
+                resp.raise_for_status()
+                logger.debug("Stream connected, status: %d", resp.status)
+
+                decoder = SSEDecoder()
+                async for chunk in resp.content.iter_any():
+                    for event in decoder.feed(chunk):
+                        data_parsed = self._parse_event_data(event)
+                        if data_parsed is not None:
+                            yield data_parsed
+                for event in decoder.flush():
+                    data_parsed = self._parse_event_data(event)
+                    if data_parsed is not None:
+                        yield data_parsed
 
         except aiohttp.ClientError as e:
             logger.error(f"HTTP request failed: {str(e)}", exc_info=True)
@@ -243,25 +302,21 @@ class WatsonXAdapter(BaseVendorAdapter):
             logger.error(f"Request timed out: {str(e)}", exc_info=True)
             raise TimeoutError(f"Request to {endpoint} timed out") from e
 
-    def _parse_sse_event(self, lines: List[str]) -> Dict[str, str]:
-        """Parse Server-Sent Events format into structured data.
+    @staticmethod
+    def _parse_event_data(event: SSEEvent) -> Optional[Dict[str, Any]]:
+        """Parse the JSON data of a server-sent event.
 
         Args:
-            lines (List[str]): Raw SSE message lines.
+            event (SSEEvent): Decoded event.
 
         Returns:
-            Dict[str, str]: Parsed event data.
+            Optional[Dict[str, Any]]: The parsed data, or None if it is not valid JSON.
         """
-        event = {}
-        for line in lines:
-            if line.startswith("id:"):
-                event["id"] = line[len("id:"):].strip()
-            elif line.startswith("event:"):
-                event["event"] = line[len("event:"):].strip()
-            elif line.startswith("data:"):
-                data_str = line[len("data:"):].strip()
-                event["data"] = event.get("data", "") + data_str
-        return event
+        try:
+            return event.json()
+        except ValueError:
+            logger.warning(f"Skipping invalid SSE data: {event.data[:200]!r}")
+            return None
 
     def _convert_to_sse_chunk(self, raw_chunk: dict) -> SSEChunk:
         """Convert WatsonX response format to standardized SSE chunk.
@@ -278,7 +333,7 @@ class WatsonXAdapter(BaseVendorAdapter):
             ValueError: If chunk conversion fails.
         """
         try:
-            logger.debug(f"Converting chunk: {json.dumps(raw_chunk, indent=2)}")
+            tracer.sample("Converting chunk: %s", Lazy(json.dumps, raw_chunk, indent=2))
             # Handle generation_stream format
             if "results" in raw_chunk:
                 result = raw_chunk["results"][0]
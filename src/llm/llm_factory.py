@@ -197,11 +197,14 @@ class LLMFactory:
             if field not in config:
                 raise ValueError(f"Missing required field '{field}' for model '{model_name}'")
 
-        # Extract and return relevant configuration
+        # Extract and return relevant configuration. Agent-level settings such as
+        # `history_token_budget` are not forwarded to the adapter.
         return {
             "vendor": config["vendor"],
             "model_id": config["model_id"],
-            "adapter_params": {k: v for k, v in config.items() if k not in ["vendor", "model_id"]}
+            "adapter_params": {
+                k: v for k, v in config.items() if k not in ["vendor", "model_id", "history_token_budget"]
+            }
         }
 
     @classmethod
@@ -232,6 +235,26 @@ class LLMFactory:
         else:
             raise ValueError(f"Adapter for model '{model_name}' not found.")
 
+    @classmethod
+    async def startup_adapters(cls) -> None:
+        """Run the startup hook of every initialized adapter, e.g. to open pooled HTTP sessions."""
+        for model_name, adapter in (cls._adapters or {}).items():
+            await adapter.startup()
+            logger.debug(f"Started adapter for model: {model_name}")
+
+    @classmethod
+    async def close_adapters(cls) -> None:
+        """Close every initialized adapter, releasing pooled connections.
+
+        Failures are logged so that one adapter cannot keep the others open.
+        """
+        for model_name, adapter in (cls._adapters or {}).items():
+            try:
+                await adapter.close()
+                logger.debug(f"Closed adapter for model: {model_name}")
+            except Exception as e:
+                logger.error(f"Failed to close adapter for {model_name}: {str(e)}")
+
     @classmethod
     def has_adapter(cls, model_name: str) -> bool:
         """Check if an adapter is available for a model without raising exceptions.
@@ -14,8 +14,10 @@ Example:
     matches = automaton.search_chunk('abcdef')
 """
 
+import re
+from array import array
 from collections import deque
-from typing import Dict, List, Tuple
+from typing import Dict, List, Pattern, Tuple
 
 
 class AhoCorasickAutomaton:
@@ -25,11 +27,22 @@ class AhoCorasickAutomaton:
     patterns simultaneously in a given text. It uses a trie data structure augmented
     with failure links to achieve linear-time pattern matching.
 
+    After the trie and failure links are built, they are compiled into a goto table
+    (a DFA), so matching costs one dictionary lookup per character with no
+    failure-link chasing. While the automaton is at the root, the text up to the
+    next character that starts a pattern is skipped with a single regex search,
+    which makes chunks of plain prose nearly free.
+
     Attributes:
         patterns: A dictionary mapping pattern names to their string values.
         next_states: A list of dictionaries representing state transitions.
         fail: A list of failure link states.
         output: A list of pattern names associated with each state.
+        goto: Complete transitions of each state; the next state for state `s` and
+            character `c` is `goto[s].get(c, 0)`, as characters missing from a row lead
+            back to the root.
+        root_chars: Regex matching the characters that lead away from the root.
+        depth: Length of the trie path leading to each state.
         current_state: The current state of the automaton.
 
     Args:
@@ -47,8 +60,12 @@ class AhoCorasickAutomaton:
         self.next_states: List[Dict[str, int]] = []
         self.fail: List[int] = []
         self.output: List[List[str]] = []
+        self.goto: List[Dict[str, int]] = []
+        self.root_chars: Pattern = re.compile("[^\\s\\S]")
+        self.depth = array("i")
         self.current_state = 0
         self._build_machine()
+        self._compile_table()
 
     def _build_machine(self):
         """Builds the Aho-Corasick automaton.
@@ -82,6 +99,31 @@ class AhoCorasickAutomaton:
                 self.fail[nxt_state] = f
                 self.output[nxt_state].extend(self.output[f])
 
+    def _compile_table(self):
+        """Compiles the trie and failure links into the goto table.
+
+        States are visited in BFS order, so the failure state of every state is
+        complete before the state itself; its transitions are inherited and then
+        overridden by the state's own trie edges. Transitions back to the root are
+        left out.
+        """
+        self.goto = [{} for _ in self.next_states]
+        self.depth = array("i", [0]) * len(self.next_states)
+
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            row = self.goto[state]
+            if state > 0:
+                row.update(self.goto[self.fail[state]])
+            for char, nxt_state in self.next_states[state].items():
+                row[char] = nxt_state
+                self.depth[nxt_state] = self.depth[state] + 1
+                queue.append(nxt_state)
+
+        if self.goto[0]:
+            self.root_chars = re.compile("[" + "".join(map(re.escape, sorted(self.goto[0]))) + "]")
+
     def _insert(self, pattern_str: str, pattern_name: str):
         """Inserts a pattern into the trie structure of the automaton.
 
@@ -107,6 +149,29 @@ class AhoCorasickAutomaton:
         """
         self.current_state = 0
 
+    def is_at_root(self) -> bool:
+        """Returns whether no suffix of the text seen so far is a pattern prefix."""
+        return self.current_state == 0
+
+    def current_depth(self) -> int:
+        """Returns the length of the longest suffix of the text seen so far that is a pattern prefix."""
+        return self.depth[self.current_state]
+
+    def clone(self) -> "AhoCorasickAutomaton":
+        """Creates an automaton that shares this automaton's tables.
+
+        The trie, failure links, goto table and outputs are never modified after
+        construction, so clones share them read-only and only track their own `current_state`.
+        This lets many concurrent streams match against one built automaton.
+
+        Returns:
+            A new automaton positioned at the root state.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.current_state = 0
+        return clone
+
     def search_chunk(self, chunk: str) -> List[Tuple[int, str]]:
         """Searches for pattern matches in the given text chunk.
 
@@ -123,12 +188,20 @@ class AhoCorasickAutomaton:
         automaton.search_chunk('abc')  # [(1, 'pat2'), (2, 'pat1')]
         ```
         """
+        state = self.current_state
+        start = 0
+        if state == 0:
+            first = self.root_chars.search(chunk)
+            if first is None:
+                return []
+            start = first.start()
+
         found_patterns = []
-        for i, char in enumerate(chunk):
-            while self.current_state > 0 and char not in self.next_states[self.current_state]:
-                self.current_state = self.fail[self.current_state]
-            self.current_state = self.next_states[self.current_state].get(char, 0)
-            if self.output[self.current_state]:
-                for pattern_name in self.output[self.current_state]:
+        goto, output = self.goto, self.output
+        for i in range(start, len(chunk)):
+            state = goto[state].get(chunk[i], 0)
+            if output[state]:
+                for pattern_name in output[state]:
                     found_patterns.append((i, pattern_name))
+        self.current_state = state
         return found_patterns
@@ -46,6 +46,26 @@ class AhoCorasickAutomatonNormalized:
         """
         self.automaton.reset_state()
 
+    def is_at_root(self) -> bool:
+        """Returns whether no suffix of the normalized text seen so far is a pattern prefix."""
+        return self.automaton.is_at_root()
+
+    def current_depth(self) -> int:
+        """Returns the length, in normalized characters, of the current partial match."""
+        return self.automaton.current_depth()
+
+    def clone(self) -> "AhoCorasickAutomatonNormalized":
+        """Creates a wrapper that shares the normalized patterns and automaton tables.
+
+        Returns:
+            A new `AhoCorasickAutomatonNormalized` with its own matching state.
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.normalized_patterns = self.normalized_patterns
+        clone.pattern_lengths = self.pattern_lengths
+        clone.automaton = self.automaton.clone()
+        return clone
+
     def search_chunk(self, norm_chunk: str) -> List[Tuple[int, str]]:
         """Searches for pattern matches in normalized text.
 
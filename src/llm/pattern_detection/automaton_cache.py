@@ -0,0 +1,220 @@
+# src/llm/pattern_detection/automaton_cache.py
+
+"""Compiled, disk-cached automata that are reloaded when their pattern file changes.
+
+Building an automaton means parsing the pattern YAML, building the trie and failure
+links and compiling the goto table. Every process does this at startup. An
+`AutomatonSource` instead pickles the compiled automaton into a cache directory,
+keyed by a hash of the pattern file, so later processes and workers load it directly.
+
+The source also polls the pattern file. When the file changes, a new automaton is
+compiled and swapped in as a whole, and processors switch to it between streams.
+Inside an event loop the compilation runs in a worker thread, and the current
+automaton stays in use until the new one is ready.
+
+Cache files are unpickled, which can run arbitrary code, so only files owned by the
+current user and not writable by group or others are loaded. The cache directory must
+not be shared with untrusted users.
+
+Example:
+    source = AutomatonSource("src/configs/tool_call_patterns.yaml", normalized=True)
+    automaton = source.compiled.automaton.clone()
+"""
+
+import os
+import stat
+import time
+import pickle
+import asyncio
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from concurrent.futures import Future
+from typing import NamedTuple, Optional, Union
+
+import yaml
+
+from src.llm.pattern_detection.aho_corasick import AhoCorasickAutomaton
+from src.llm.pattern_detection.pattern_utils import select_patterns
+from src.llm.pattern_detection.aho_corasick_normalized import AhoCorasickAutomatonNormalized
+
+CACHE_DIR_ENV = "PATTERN_CACHE_DIR"
+CACHE_FORMAT_VERSION = 2
+
+Automaton = Union[AhoCorasickAutomaton, AhoCorasickAutomatonNormalized]
+
+
+class CompiledAutomaton(NamedTuple):
+    """A compiled automaton and the hash of the pattern file it was built from.
+
+    Attributes:
+        version: Cache key of the automaton, derived from the pattern file contents.
+        automaton: The compiled automaton. It is shared read-only; use `clone()`.
+    """
+    version: str
+    automaton: Automaton
+
+
+class AutomatonSource:
+    """Provides the compiled automaton for a pattern file, from disk cache when possible.
+
+    Args:
+        yaml_path: Path to the YAML file containing pattern definitions.
+        family: Optional model family whose pattern set is compiled.
+        normalized: Whether to compile a whitespace-insensitive automaton.
+        cache_dir: Directory of pickled automata. Defaults to the `PATTERN_CACHE_DIR`
+            environment variable; without either, nothing is cached on disk.
+        poll_interval: Minimum number of seconds between checks of the pattern file
+            in `refresh()`. None disables reloading.
+
+    Attributes:
+        compiled: The current `CompiledAutomaton`. It is replaced as a whole on
+            reload, so readers always see a consistent automaton.
+    """
+
+    def __init__(
+            self,
+            yaml_path: str,
+            family: Optional[str] = None,
+            normalized: bool = False,
+            cache_dir: Optional[str] = None,
+            poll_interval: Optional[float] = 2.0
+    ):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.yaml_path = yaml_path
+        self.family = family
+        self.normalized = normalized
+        self.cache_dir = cache_dir or os.getenv(CACHE_DIR_ENV)
+        self.poll_interval = poll_interval
+        self._file_stamp = self._stat()
+        self._next_poll = time.monotonic() + (poll_interval or 0)
+        self._reload: Optional[Future] = None
+        self.compiled = self._load()
+
+    def refresh(self) -> bool:
+        """Recompiles the automaton if the pattern file has changed.
+
+        The file is checked at most once per `poll_interval`, and only its size and
+        modification time are compared, so calling this for every stream is cheap.
+        When called inside a running event loop, the automaton is compiled in a worker
+        thread and swapped in once it is ready; until then, `compiled` stays the current
+        automaton. Without a running loop it is compiled before returning. If the new
+        pattern file cannot be compiled, the current automaton is kept.
+
+        Returns:
+            True if a new automaton was swapped in before returning.
+        """
+        if self.poll_interval is None or time.monotonic() < self._next_poll:
+            return False
+        self._next_poll = time.monotonic() + self.poll_interval
+        if self._reload is not None:
+            return False
+
+        try:
+            file_stamp = self._stat()
+        except OSError:
+            self.logger.error("Failed to check pattern file %s", self.yaml_path, exc_info=True)
+            return False
+        if file_stamp == self._file_stamp:
+            return False
+        self._file_stamp = file_stamp
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            try:
+                compiled = self._load()
+            except Exception:
+                self._log_reload_failure()
+                return False
+            return self._swap(compiled)
+
+        self._reload = loop.run_in_executor(None, self._load)
+        self._reload.add_done_callback(self._finish_reload)
+        return False
+
+    def _finish_reload(self, reload: Future) -> None:
+        """Swaps in an automaton compiled in the background; runs on the event loop."""
+        self._reload = None
+        if reload.cancelled():
+            return
+        if reload.exception() is not None:
+            self._log_reload_failure(reload.exception())
+            return
+        self._swap(reload.result())
+
+    def _swap(self, compiled: CompiledAutomaton) -> bool:
+        """Makes a newly loaded automaton current, unless its patterns are unchanged."""
+        if compiled.version == self.compiled.version:
+            return False
+        self.compiled = compiled
+        self.logger.info("Reloaded tool call patterns from %s", self.yaml_path)
+        return True
+
+    def _log_reload_failure(self, error: Optional[BaseException] = None) -> None:
+        self.logger.error("Failed to reload patterns from %s, keeping the current automaton",
+                          self.yaml_path, exc_info=error or True)
+
+    def _stat(self):
+        """Size and modification time of the pattern file."""
+        stat = os.stat(self.yaml_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _load(self) -> CompiledAutomaton:
+        """Loads the automaton for the current pattern file from cache, or compiles it."""
+        with open(self.yaml_path, "rb") as f:
+            data = f.read()
+
+        key = hashlib.sha256()
+        for part in (str(CACHE_FORMAT_VERSION), str(self.normalized), self.family or ""):
+            key.update(part.encode("utf-8") + b"\0")
+        key.update(data)
+        version = key.hexdigest()
+
+        cache_file = Path(self.cache_dir) / f"automaton-{version}.pkl" if self.cache_dir else None
+        if cache_file is not None and cache_file.exists() and self._is_trusted(cache_file):
+            try:
+                with open(cache_file, "rb") as f:
+                    automaton = pickle.load(f)
+                self.logger.debug("Loaded compiled automaton from %s", cache_file)
+                return CompiledAutomaton(version, automaton)
+            except Exception:
+                self.logger.warning("Ignoring unreadable automaton cache %s", cache_file, exc_info=True)
+
+        patterns = select_patterns(yaml.safe_load(data) or {}, self.family)
+        automaton_cls = AhoCorasickAutomatonNormalized if self.normalized else AhoCorasickAutomaton
+        automaton = automaton_cls(patterns)
+        if cache_file is not None:
+            self._write_cache(cache_file, automaton)
+        return CompiledAutomaton(version, automaton)
+
+    def _is_trusted(self, cache_file: Path) -> bool:
+        """Whether a cache file may be unpickled: a regular file owned by this user and
+        writable only by its owner."""
+        try:
+            file_stat = os.lstat(cache_file)
+        except OSError:
+            return False
+        owned = not hasattr(os, "getuid") or file_stat.st_uid == os.getuid()
+        if stat.S_ISREG(file_stat.st_mode) and owned and not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            return True
+        self.logger.warning("Ignoring automaton cache %s: it must be a regular file owned by the current "
+                            "user and not writable by group or others", cache_file)
+        return False
+
+    def _write_cache(self, cache_file: Path, automaton: Automaton) -> None:
+        """Writes the automaton atomically, so concurrent workers never read a partial file."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(automaton, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, cache_file)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+            self.logger.debug("Cached compiled automaton in %s", cache_file)
+        except OSError:
+            self.logger.warning("Could not write automaton cache %s", cache_file, exc_info=True)
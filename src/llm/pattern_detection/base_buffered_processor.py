@@ -1,7 +1,11 @@
 # src/llm/pattern_detection/base_buffered_processor.py
 
+import re
+import copy
 from abc import abstractmethod
+from typing import Optional
 from src.data_models.streaming import PatternMatchResult
+from src.llm.pattern_detection.automaton_cache import AutomatonSource, CompiledAutomaton
 
 
 class BaseBufferedProcessor:
@@ -14,6 +18,13 @@ class BaseBufferedProcessor:
     Attributes:
         `tool_call_message`: Message to include when a tool call is detected.
         `trailing_buffer_original`: Buffer containing text carried over from previous chunks.
+        `trigger_regex`: Matches any character that can start a pattern. Set by
+            subclasses; chunks without such a character skip the automaton.
+        `max_hold_back`: Upper bound on the characters held back for a possible
+            partial match. Set by subclasses.
+        `automaton_source`: Provides the compiled automaton and reloads it when the
+            pattern file changes. Set by subclasses.
+        `automaton_version`: Version of the compiled automaton in use.
 
     Args:
         `tool_call_message`: Optional message to use when a tool call is detected.
@@ -23,6 +34,10 @@ class BaseBufferedProcessor:
     def __init__(self, tool_call_message: str = "Tool call detected."):
         self.tool_call_message = tool_call_message
         self.trailing_buffer_original = ""
+        self.trigger_regex: Optional[re.Pattern] = None
+        self.max_hold_back = 0
+        self.automaton_source: Optional[AutomatonSource] = None
+        self.automaton_version: Optional[str] = None
 
     def reset_states(self):
         """Resets the processor's internal state.
@@ -32,11 +47,53 @@ class BaseBufferedProcessor:
         """
         self.trailing_buffer_original = ""
 
+    def clone(self) -> "BaseBufferedProcessor":
+        """Creates a processor with fresh buffers that shares this processor's automaton tables.
+
+        Building the automaton is the expensive part of constructing a processor, so
+        per-stream processors are cloned from a prototype instead of being rebuilt.
+
+        Returns:
+            A new processor of the same type with reset state.
+        """
+        clone = copy.copy(self)
+        clone.automaton = self.automaton.clone()
+        clone.reset_states()
+        return clone
+
+    def refresh_automaton(self) -> bool:
+        """Switches to the latest compiled automaton if the pattern file has changed.
+
+        Reloading is checked through `automaton_source` and swaps the whole automaton,
+        so it must only be called between streams, never while one is in progress.
+
+        Returns:
+            True if a new automaton was installed; the processor's state is then reset.
+        """
+        if self.automaton_source is None:
+            return False
+        self.automaton_source.refresh()
+        compiled = self.automaton_source.compiled
+        if compiled.version == self.automaton_version:
+            return False
+        self.install_automaton(compiled)
+        self.reset_states()
+        return True
+
+    def install_automaton(self, compiled: CompiledAutomaton):
+        """Starts using a compiled automaton and updates the settings derived from its patterns.
+
+        Args:
+            `compiled`: The compiled automaton, shared read-only between processors.
+        """
+        raise NotImplementedError
+
     async def process_chunk(self, chunk: str) -> PatternMatchResult:
         """Processes a chunk of text with buffering.
 
-        Combines the new chunk with any trailing text from previous chunks and
-        delegates the actual processing to process_chunk_impl.
+        Processing is incremental: the automaton's state carries over between chunks,
+        so only the new chunk is scanned and the trailing buffer is never re-scanned.
+        The subclass decides how much text to hold back for a possible partial match.
 
         Args:
             `chunk`: The new text chunk to process.
@@ -50,18 +107,58 @@ class BaseBufferedProcessor:
         print(result.output)  # some text
         ```
         """
-        # Combine the trailing buffer with new chunk
-        combined_original = self.trailing_buffer_original + chunk
+        passthrough = self.passthrough(chunk)
+        if passthrough is not None:
+            return passthrough
 
-        # Let the subclass handle the matching logic on combined_original.
-        result, new_trailing = self.process_chunk_impl(combined_original)
+        # Let the subclass scan the new chunk and decide what to hold back
+        result, new_trailing = self.process_chunk_impl(chunk)
 
         # Update the trailing buffer with what's left
         self.trailing_buffer_original = new_trailing
         return result
 
+    def passthrough(self, chunk: str) -> Optional[PatternMatchResult]:
+        """Releases a chunk without matching when it cannot contain the start of a pattern.
+
+        When the automaton sits at its root, no held-back text can still begin a
+        pattern, so a chunk without any trigger character cannot complete or start
+        a match. Checking for trigger characters is a single C-level regex scan,
+        which keeps the per-chunk cost of ordinary prose close to zero.
+
+        Args:
+            `chunk`: The new text chunk to process.
+
+        Returns:
+            A `PatternMatchResult` releasing the trailing buffer and the chunk, or
+            None if the chunk has to go through the automaton.
+        """
+        if self.trigger_regex is None or not self.automaton.is_at_root() or self.trigger_regex.search(chunk):
+            return None
+        result = PatternMatchResult(output=self.trailing_buffer_original + chunk)
+        self.reset_states()
+        return result
+
+    def hold_back_length(self, available: int) -> int:
+        """Returns how many trailing characters must be held back for a possible match.
+
+        Only the current suffix that is still a pattern prefix can complete a match
+        later, and its length is the depth of the automaton's current state. Holding
+        back exactly that much keeps detection exact while releasing everything else
+        immediately. `max_hold_back` caps the delay; a pattern whose prefix exceeds
+        the cap is still detected, but the part released early is not included in
+        `text_with_tool_call`.
+
+        Args:
+            `available`: Number of characters available to hold back.
+
+        Returns:
+            The number of characters to keep in the trailing buffer.
+        """
+        return min(self.automaton.current_depth(), self.max_hold_back, available)
+
     async def flush_buffer(self) -> PatternMatchResult:
-        """Flushes any remaining text in the trailing buffer.
+        """Flushes any remaining text in the trailing buffer and resets the matching state.
 
         Should be called after processing the final chunk to handle any remaining
         buffered text.
@@ -75,22 +172,21 @@ class BaseBufferedProcessor:
         print(len(result.output))  # 0
         ```
         """
-        from src.data_models.streaming import PatternMatchResult
         result = PatternMatchResult()
         if self.trailing_buffer_original:
             result.output = self.trailing_buffer_original
-            self.trailing_buffer_original = ""
+        self.reset_states()
         return result
 
     @abstractmethod
-    def process_chunk_impl(self, combined_original: str):
-        """Processes combined text to find pattern matches.
+    def process_chunk_impl(self, chunk: str):
+        """Processes a new chunk of text to find pattern matches.
 
         This abstract method must be implemented by subclasses to define specific
         pattern matching behavior.
 
         Args:
-            `combined_original`: Text to process, including any trailing text from
+            `chunk`: The new text, not including the trailing buffer held back from
                 previous chunks.
 
         Returns:
@@ -1,10 +1,12 @@
 # src/llm/pattern_detection/buffered_processor_normalized.py
 
+from array import array
+from typing import Optional
+
 from src.data_models.streaming import PatternMatchResult
-from src.llm.pattern_detection.pattern_utils import load_patterns
-from src.llm.pattern_detection.pattern_utils import normalize_and_map
+from src.llm.pattern_detection.pattern_utils import compile_trigger_regex
 from src.llm.pattern_detection.base_buffered_processor import BaseBufferedProcessor
-from src.llm.pattern_detection.aho_corasick_normalized import AhoCorasickAutomatonNormalized
+from src.llm.pattern_detection.automaton_cache import AutomatonSource, CompiledAutomaton
 
 
 class AhoCorasickBufferedProcessorNormalized(BaseBufferedProcessor):
@@ -14,40 +16,79 @@ class AhoCorasickBufferedProcessorNormalized(BaseBufferedProcessor):
     by normalizing both patterns and input text. It uses the Aho-Corasick algorithm
     for efficient multiple pattern matching.
 
+    Processing is incremental: each character is normalized and scanned exactly once,
+    so the cost of a stream is linear in its length, and only the current partial
+    match is held back between chunks.
+
     Attributes:
         automaton: An instance of AhoCorasickAutomatonNormalized for pattern matching.
         max_pattern_len: The length of the longest pattern in the normalized patterns.
+        max_hold_back: Maximum number of normalized characters held back for a partial match.
         tool_call_message: Message to include when a tool call is detected.
+        held_offsets: Stream offsets of the normalized characters in the trailing buffer.
+        stream_position: Number of original characters consumed so far.
+        normalized_count: Number of normalized characters consumed so far.
 
     Args:
         yaml_path: Path to the YAML file containing pattern definitions.
         tool_call_message: Optional message to use when a tool call is detected.
             Defaults to "Tool call detected."
+        max_hold_back: Optional cap on the normalized characters held back for a partial
+            match. Defaults to `max_pattern_len - 1`, which never truncates a detected tool call.
+        family: Optional model family whose pattern set is loaded instead of all patterns.
     """
 
-    def __init__(self, yaml_path: str, tool_call_message: str = "Tool call detected."):
+    def __init__(
+            self,
+            yaml_path: str,
+            tool_call_message: str = "Tool call detected.",
+            max_hold_back: Optional[int] = None,
+            family: Optional[str] = None
+    ):
         super().__init__(tool_call_message)
-        raw_patterns = load_patterns(yaml_path)
-        self.automaton = AhoCorasickAutomatonNormalized(raw_patterns)
+        self.configured_max_hold_back = max_hold_back
+        self.automaton_source = AutomatonSource(yaml_path, family, normalized=True)
+        self.install_automaton(self.automaton_source.compiled)
+        self.reset_states()
+
+    def install_automaton(self, compiled: CompiledAutomaton):
+        """Starts using a compiled normalized automaton.
+
+        Args:
+            compiled: The compiled automaton, shared read-only between processors.
+        """
+        self.automaton = compiled.automaton.clone()
+        self.automaton_version = compiled.version
         self.max_pattern_len = max(len(p) for p in self.automaton.normalized_patterns.values())
+        self.max_hold_back = (
+            self.max_pattern_len - 1 if self.configured_max_hold_back is None else self.configured_max_hold_back
+        )
+        self.trigger_regex = compile_trigger_regex(self.automaton.normalized_patterns.values())
+
+    def reset_states(self):
+        """Resets the trailing buffer, offset bookkeeping and the automaton's matching state."""
+        super().reset_states()
         self.automaton.reset_state()
+        self.held_offsets = array("I")
+        self.stream_position = 0
+        self.normalized_count = 0
 
-    def process_chunk_impl(self, combined_original: str):
-        """Processes a chunk of text to find pattern matches while ignoring whitespace.
+    def process_chunk_impl(self, chunk: str):
+        """Processes new text to find pattern matches while ignoring whitespace.
 
-        This method normalizes the input text, performs pattern matching, and returns
-        the earliest match found along with any safe text that can be output.
+        Normalizes and scans only `chunk`. For every normalized character still held
+        back, `held_offsets` records its position in the original stream, so a match
+        can be mapped back to the original text without re-normalizing anything.
 
         Args:
-            `combined_original`: The original text chunk to process.
+            `chunk`: The new text, not including the trailing buffer.
 
         Returns:
             A tuple containing:
 
                 - `PatternMatchResult`: Result object containing match information and
                     processed text.
-                - `str`: Any trailing text that needs to be carried over to the next
-                    chunk.
+                - `str`: The trailing text held back for the next chunk.
 
         ``` python title="Example usage"
         processor = AhoCorasickBufferedProcessorNormalized('patterns.yaml')
@@ -56,42 +97,48 @@ class AhoCorasickBufferedProcessorNormalized(BaseBufferedProcessor):
         ```
         """
         result = PatternMatchResult()
-        # Normalize the entire combined_original and get index mapping.
-        norm_combined, index_map = normalize_and_map(combined_original)
-        matches = self.automaton.search_chunk(norm_combined)
+        held_text = self.trailing_buffer_original + chunk
+        held_start = self.stream_position - len(self.trailing_buffer_original)
+        chunk_start = self.stream_position
+        norm_chunk_start = self.normalized_count
+
+        norm_chunk = "".join(chunk.split())
+        if len(norm_chunk) == len(chunk):
+            self.held_offsets.extend(range(chunk_start, chunk_start + len(chunk)))
+        else:
+            self.held_offsets.extend(
+                chunk_start + idx for idx, ch in enumerate(chunk) if not ch.isspace()
+            )
+        self.stream_position += len(chunk)
+        self.normalized_count += len(norm_chunk)
+        held_norm_start = self.normalized_count - len(self.held_offsets)
+
+        matches = self.automaton.search_chunk(norm_chunk)
 
         if not matches:
-            keep_len = min(self.max_pattern_len - 1, len(norm_combined))
+            keep_len = self.hold_back_length(len(self.held_offsets))
             if keep_len > 0:
-                orig_keep_start = index_map[len(norm_combined) - keep_len]
-                safe_text = combined_original[:orig_keep_start]
-                new_trailing = combined_original[orig_keep_start:]
-            else:
-                safe_text = combined_original
-                new_trailing = ""
-            result.output = safe_text
-            return result, new_trailing
-
-        # Find the earliest match
-        earliest_original_index = None
-        earliest_match_pattern = None
-        earliest_norm_start_idx = None
+                del self.held_offsets[:len(self.held_offsets) - keep_len]
+                cut = self.held_offsets[0] - held_start
+                result.output = held_text[:cut]
+                return result, held_text[cut:]
+            self.held_offsets = array("I")
+            result.output = held_text
+            return result, ""
+
+        # Find the earliest match; for matches ending together, the longest pattern comes first
+        earliest_end, earliest_match_pattern = matches[0]
         for norm_end_idx, pattern_name in matches:
-            pat_len = self.automaton.get_pattern_length(pattern_name)
-            norm_start_idx = norm_end_idx - pat_len + 1
-            original_end = index_map[norm_end_idx]
-            original_start = index_map[norm_start_idx]
-            if earliest_original_index is None or original_end < earliest_original_index:
-                earliest_original_index = original_end
-                earliest_match_pattern = pattern_name
-                earliest_norm_start_idx = norm_start_idx
-
-        original_start = index_map[earliest_norm_start_idx]
+            if norm_end_idx < earliest_end:
+                earliest_end, earliest_match_pattern = norm_end_idx, pattern_name
+
+        norm_start = norm_chunk_start + earliest_end - self.automaton.get_pattern_length(earliest_match_pattern) + 1
+        original_start = self.held_offsets[max(norm_start - held_norm_start, 0)] - held_start
+
         result.matched = True
         result.pattern_name = earliest_match_pattern
         result.tool_call_message = self.tool_call_message
-        result.output = combined_original[:original_start]
-        result.text_with_tool_call = combined_original[original_start:]
-        new_trailing = ""
-        self.automaton.reset_state()
-        return result, new_trailing
+        result.output = held_text[:original_start]
+        result.text_with_tool_call = held_text[original_start:]
+        self.reset_states()
+        return result, ""
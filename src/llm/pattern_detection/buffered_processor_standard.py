@@ -1,9 +1,11 @@
 # src/llm/pattern_detection/buffered_processor_standard.py
 
+from typing import Optional
+
 from src.data_models.streaming import PatternMatchResult
-from src.llm.pattern_detection.pattern_utils import load_patterns
-from src.llm.pattern_detection.aho_corasick import AhoCorasickAutomaton
+from src.llm.pattern_detection.pattern_utils import compile_trigger_regex
 from src.llm.pattern_detection.base_buffered_processor import BaseBufferedProcessor
+from src.llm.pattern_detection.automaton_cache import AutomatonSource, CompiledAutomaton
 
 
 class AhoCorasickBufferedProcessor(BaseBufferedProcessor):
@@ -13,32 +15,64 @@ class AhoCorasickBufferedProcessor(BaseBufferedProcessor):
     for efficient multiple pattern matching. Unlike the normalized version, this
     processor is sensitive to whitespace and performs exact string matching.
 
+    Each character is scanned exactly once, and only the current partial match is
+    held back between chunks.
+
     Attributes:
         `automaton`: An instance of AhoCorasickAutomaton for pattern matching.
         `max_pattern_len`: The length of the longest pattern in the raw patterns.
+        `max_hold_back`: Maximum number of characters held back for a partial match.
         `tool_call_message`: Message to include when a tool call is detected.
 
     Args:
         `yaml_path`: Path to the YAML file containing pattern definitions.
         `tool_call_message`: Optional message to use when a tool call is detected.
             Defaults to "Tool call detected."
+        `max_hold_back`: Optional cap on the characters held back for a partial match.
+            Defaults to `max_pattern_len - 1`, which never truncates a detected tool call.
+        `family`: Optional model family whose pattern set is loaded instead of all patterns.
     """
 
-    def __init__(self, yaml_path: str, tool_call_message: str = "Tool call detected."):
+    def __init__(
+            self,
+            yaml_path: str,
+            tool_call_message: str = "Tool call detected.",
+            max_hold_back: Optional[int] = None,
+            family: Optional[str] = None
+    ):
         super().__init__(tool_call_message)
-        raw_patterns = load_patterns(yaml_path)
-        self.automaton = AhoCorasickAutomaton(raw_patterns)
-        self.max_pattern_len = max(len(p) for p in raw_patterns.values())
+        self.configured_max_hold_back = max_hold_back
+        self.automaton_source = AutomatonSource(yaml_path, family)
+        self.install_automaton(self.automaton_source.compiled)
+
+    def install_automaton(self, compiled: CompiledAutomaton):
+        """Starts using a compiled automaton.
+
+        Args:
+            `compiled`: The compiled automaton, shared read-only between processors.
+        """
+        self.automaton = compiled.automaton.clone()
+        self.automaton_version = compiled.version
+        self.max_pattern_len = max(len(p) for p in self.automaton.patterns.values())
+        self.max_hold_back = (
+            self.max_pattern_len - 1 if self.configured_max_hold_back is None else self.configured_max_hold_back
+        )
+        self.trigger_regex = compile_trigger_regex(self.automaton.patterns.values())
+
+    def reset_states(self):
+        """Resets the trailing buffer and the automaton's matching state."""
+        super().reset_states()
         self.automaton.reset_state()
 
-    def process_chunk_impl(self, combined_original: str):
-        """Processes a chunk of text to find exact pattern matches.
+    def process_chunk_impl(self, chunk: str):
+        """Processes new text to find exact pattern matches.
 
-        This method performs exact pattern matching on the input text and returns
-        the earliest match found along with any safe text that can be output.
+        Only `chunk` is fed to the automaton, whose state carries over from previous
+        chunks. Without a match, everything except the current partial match is
+        released; otherwise the text before the earliest match is released.
 
         Args:
-            `combined_original`: The text chunk to process.
+            `chunk`: The new text, not including the trailing buffer.
 
         Returns:
             A tuple containing:
@@ -55,31 +89,23 @@ class AhoCorasickBufferedProcessor(BaseBufferedProcessor):
         ```
         """
         result = PatternMatchResult()
-        # Search in the original text
-        matches = self.automaton.search_chunk(combined_original)
+        held_text = self.trailing_buffer_original + chunk
+        matches = self.automaton.search_chunk(chunk)
 
         if not matches:
-            # Keep up to max_pattern_len - 1 characters for partial match
-            keep_len = min(self.max_pattern_len - 1, len(combined_original))
-            if keep_len > 0:
-                safe_text = combined_original[:-keep_len]
-                new_trailing = combined_original[-keep_len:]
-            else:
-                safe_text = combined_original
-                new_trailing = ""
-            result.output = safe_text
-            return result, new_trailing
+            keep_len = self.hold_back_length(len(held_text))
+            result.output = held_text[:len(held_text) - keep_len]
+            return result, held_text[len(held_text) - keep_len:]
 
         # Otherwise, use the earliest match
         earliest_end, pattern_name = min(matches, key=lambda x: x[0])
         pattern_str = self.automaton.patterns[pattern_name]
-        match_start = earliest_end - len(pattern_str) + 1
+        match_start = max(len(self.trailing_buffer_original) + earliest_end - len(pattern_str) + 1, 0)
 
         result.matched = True
         result.pattern_name = pattern_name
         result.tool_call_message = self.tool_call_message
-        result.output = combined_original[:match_start]
-        result.text_with_tool_call = combined_original[match_start:]
-        new_trailing = ""
+        result.output = held_text[:match_start]
+        result.text_with_tool_call = held_text[match_start:]
         self.automaton.reset_state()
-        return result, new_trailing
+        return result, ""
@@ -1,22 +1,99 @@
 # src/llm/streaming/pattern_utils.py
 
+import re
 import yaml
-from typing import Dict
+from typing import Dict, Iterable, Optional
 
 
-def load_patterns(yaml_path: str) -> Dict[str, str]:
+def load_patterns(yaml_path: str, family: Optional[str] = None) -> Dict[str, str]:
     """
     Load tool call patterns from a YAML file.
 
     Args:
         yaml_path: Path to the YAML file containing patterns
+        family: Optional model family whose pattern set should be loaded. Families
+            are listed under `families` as lists of pattern names. Without a family,
+            or for a family that has no set, all patterns are returned.
 
     Returns:
         Dictionary mapping pattern names to pattern strings
+
+    Raises:
+        ValueError: If a family's set names a pattern that is not defined
     """
     with open(yaml_path, 'r') as f:
         config = yaml.safe_load(f)
-    return config.get('patterns', {})
+    return select_patterns(config, family)
+
+
+def select_patterns(config: Dict, family: Optional[str] = None) -> Dict[str, str]:
+    """
+    Select the patterns of a model family from a parsed pattern configuration.
+
+    Args:
+        config: Parsed contents of a pattern YAML file
+        family: Optional model family; see `load_patterns`
+
+    Returns:
+        Dictionary mapping pattern names to pattern strings
+
+    Raises:
+        ValueError: If a family's set names a pattern that is not defined
+    """
+    patterns = config.get('patterns', {})
+    names = (config.get('families') or {}).get(family) if family else None
+    if names is None:
+        return patterns
+
+    unknown = [name for name in names if name not in patterns]
+    if unknown:
+        raise ValueError(f"Pattern family '{family}' references unknown patterns: {', '.join(unknown)}")
+    return {name: patterns[name] for name in names}
+
+
+def resolve_pattern_family(yaml_path: str, *identifiers: Optional[str]) -> Optional[str]:
+    """
+    Resolve the pattern family of a model from its identifiers.
+
+    The first family whose name occurs in an identifier wins, with identifiers
+    checked in order, e.g. `("watsonx-llama", "meta-llama/llama-3-405b-instruct")`.
+
+    Args:
+        yaml_path: Path to the YAML file containing patterns
+        *identifiers: Model identifiers such as the vendor and the model ID
+
+    Returns:
+        The family name, or None if no family applies
+    """
+    with open(yaml_path, 'r') as f:
+        families = (yaml.safe_load(f) or {}).get('families') or {}
+    for identifier in identifiers:
+        if not identifier:
+            continue
+        for family in families:
+            if family in identifier.lower():
+                return family
+    return None
+
+
+def compile_trigger_regex(patterns: Iterable[str]) -> re.Pattern:
+    """Compiles a regex matching any character that can start one of the patterns.
+
+    A chunk without such a character cannot begin a match, which lets processors
+    skip the automaton entirely with a single C-level scan.
+
+    Args:
+        patterns: The pattern strings.
+
+    Returns:
+        re.Pattern: A character-class regex over the first characters of the patterns.
+
+    ``` python title="Example usage"
+    compile_trigger_regex(['<tool_call>', '[{"name']).search("plain prose")  # None
+    ```
+    """
+    first_chars = sorted({pattern[0] for pattern in patterns if pattern})
+    return re.compile("[" + "".join(re.escape(char) for char in first_chars) + "]")
 
 
 def normalize_and_map(text: str):
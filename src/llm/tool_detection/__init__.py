@@ -1,3 +1,4 @@
 from .base_detection_strategy import BaseToolCallDetectionStrategy
 from .manual_detection_strategy import ManualToolCallDetectionStrategy
 from .vendor_detection_strategy import VendorToolCallDetectionStrategy
+from .strategy_pool import DetectionStrategyPool
@@ -1,5 +1,6 @@
 # src/llm/tool_detection/base_detection_strategy.py
 
+import copy
 from abc import ABC, abstractmethod
 
 from src.api import SSEChunk
@@ -33,6 +34,21 @@ class BaseToolCallDetectionStrategy(ABC):
         """
         pass
 
+    def clone(self) -> "BaseToolCallDetectionStrategy":
+        """Create an independent instance of this strategy for another stream.
+
+        The default implementation makes a shallow copy and resets it, which is
+        sufficient for strategies whose state is rebuilt by `reset()`. Strategies
+        holding other mutable helpers must override this method.
+
+        Returns:
+            BaseToolCallDetectionStrategy: A reset strategy safe to use concurrently
+                with the original.
+        """
+        clone = copy.copy(self)
+        clone.reset()
+        return clone
+
     @abstractmethod
     async def detect_chunk(
             self,
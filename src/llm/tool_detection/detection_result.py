@@ -40,8 +40,12 @@ class DetectionResult(BaseModel):
             excluding any tool call syntax.
         sse_chunk (Optional[SSEChunk]): The original SSE chunk that was
             processed, preserved for reference or further processing.
+        ready_tool_calls (Optional[List[ToolCall]]): Tool calls whose arguments
+            became complete in this chunk, before the stream signalled completion.
+            Only reported by strategies running in speculative mode.
     """
     state: DetectionState
     tool_calls: Optional[List[ToolCall]] = None
     content: Optional[str] = None
     sse_chunk: Optional[SSEChunk] = None
+    ready_tool_calls: Optional[List[ToolCall]] = None
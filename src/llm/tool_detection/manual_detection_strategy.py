@@ -1,10 +1,12 @@
 # src/llm/tool_detection/manual_tool_call_detection.py
 
+import copy
 import logging
-from typing import List
+from typing import List, Optional
 
 from src.api import SSEChunk
 from src.data_models.agent import StreamContext
+from src.utils.tracing import HotPathTracer
 from src.tools.core.parsers import BaseToolCallParser
 from src.data_models.chat_completions import ToolCall, FunctionDetail
 from src.llm.tool_detection import BaseToolCallDetectionStrategy
@@ -19,16 +21,31 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
     of text using the Aho-Corasick algorithm for pattern matching. It maintains internal
     state to track tool call boundaries and accumulate content.
 
+    Once a pattern has matched, the tool call text is fed to the parser's resumable
+    stream, which parses each top-level JSON value as soon as it closes. When a value
+    has yielded tool calls and is followed by something other than another call,
+    `detect_chunk` reports `COMPLETE_MATCH`, so the caller can stop the LLM stream
+    instead of waiting for trailing chatter or stop tokens. Parsers without a stream
+    parse the whole buffer at the end of the stream.
+
     Args:
         parser (BaseToolCallParser): Parser instance for processing detected tool calls.
         pattern_config_path (str, optional): Path to YAML config file containing tool call patterns.
             Defaults to "src/configs/tool_call_patterns.yaml".
+        max_hold_back (Optional[int]): Cap on the characters held back while a pattern is
+            partially matched. Defaults to the length of the longest pattern minus one.
+        pattern_family (Optional[str]): Model family whose pattern set is used, e.g. "granite".
+            Defaults to all patterns.
 
     Attributes:
         tool_call_parser (BaseToolCallParser): Parser for processing tool calls.
         pattern_detector (AhoCorasickBufferedProcessor): Pattern matching processor.
         pre_tool_call_content (List[str]): Buffer for content before tool call.
         tool_call_buffer (str): Buffer for accumulating tool call content.
+        tool_call_stream (Optional[ToolCallStream]): Resumable parser fed the tool call text,
+            or None if the parser does not support incremental parsing.
+        complete_end (Optional[int]): End of the last parsed tool call in `tool_call_buffer`,
+            while waiting to see whether another call follows.
         in_tool_call (bool): Flag indicating if currently processing a tool call.
         accumulation_mode (bool): Flag for content accumulation mode.
 
@@ -46,14 +63,28 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         ```
     """
 
-    def __init__(self, parser: BaseToolCallParser, pattern_config_path: str = "src/configs/tool_call_patterns.yaml"):
+    def __init__(
+            self,
+            parser: BaseToolCallParser,
+            pattern_config_path: str = "src/configs/tool_call_patterns.yaml",
+            max_hold_back: Optional[int] = None,
+            pattern_family: Optional[str] = None
+    ):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.logger.debug("Initializing ManualToolCallDetectionStrategy with config: %s", pattern_config_path)
+        self.tracer = HotPathTracer(self.logger)
+        self.logger.debug("Initializing ManualToolCallDetectionStrategy with config: %s (pattern family: %s)",
+                          pattern_config_path, pattern_family or "all")
         self.tool_call_parser = parser
-        self.pattern_detector = AhoCorasickBufferedProcessorNormalized(pattern_config_path)
+        self.pattern_detector = AhoCorasickBufferedProcessorNormalized(
+            pattern_config_path,
+            max_hold_back=max_hold_back,
+            family=pattern_family
+        )
 
         self.pre_tool_call_content: List[str] = []
         self.tool_call_buffer: str = ""
+        self.tool_call_stream = parser.create_stream()
+        self.complete_end: Optional[int] = None
         self.in_tool_call: bool = False
         self.accumulation_mode: bool = False
 
@@ -62,14 +93,32 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
 
         This method clears all buffers and resets flags to their initial state.
         Should be called between processing different streams or after errors.
+        If the pattern file has changed, the next stream uses the reloaded patterns.
         """
         self.logger.debug("Resetting detector state")
+        self.pattern_detector.refresh_automaton()
         self.pattern_detector.reset_states()
         self.pre_tool_call_content = []
         self.tool_call_buffer = ""
+        if self.tool_call_stream is not None:
+            self.tool_call_stream.reset()
+        self.complete_end = None
         self.in_tool_call = False
         self.accumulation_mode = False
 
+    def clone(self) -> "ManualToolCallDetectionStrategy":
+        """Create an independent strategy that shares the parser and the built automaton.
+
+        Returns:
+            ManualToolCallDetectionStrategy: A reset strategy with its own pattern
+                detector buffers and matching state.
+        """
+        clone = copy.copy(self)
+        clone.pattern_detector = self.pattern_detector.clone()
+        clone.tool_call_stream = self.tool_call_parser.create_stream()
+        clone.reset()
+        return clone
+
     async def detect_chunk(self, sse_chunk: SSEChunk, context: StreamContext) -> DetectionResult:
         """
         Process a single chunk of streaming content for tool call detection.
@@ -90,10 +139,9 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         if not chunk_content:
             return DetectionResult(state=DetectionState.NO_MATCH, sse_chunk=sse_chunk)
 
-        # If already in tool call detection mode, continue accumulating and report a partial match.
+        # If already in tool call detection mode, continue accumulating and check whether the call is complete.
         if self.in_tool_call:
-            self.tool_call_buffer += chunk_content
-            return DetectionResult(
+            return self._accumulate_tool_call(chunk_content) or DetectionResult(
                 state=DetectionState.PARTIAL_MATCH,
                 sse_chunk=sse_chunk
             )
@@ -108,7 +156,10 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         # Return any content remaining that could have been in the same chunk as the patter or in a buffer
         if result.matched:
             self.in_tool_call = True
-            self.tool_call_buffer = result.text_with_tool_call
+            complete = self._accumulate_tool_call(result.text_with_tool_call)
+            if complete is not None:
+                complete.content = result.output
+                return complete
             return DetectionResult(
                 state=DetectionState.PARTIAL_MATCH,
                 content=result.output,
@@ -149,9 +200,13 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
                 self.tool_call_buffer += final_result.output
 
             # Parse accumulated tool call
-            parsed_tool_call_data = self.tool_call_parser.parse(self.tool_call_buffer)
-            self.logger.debug(f"Tool call buffer: {self.tool_call_buffer}")
-            self.logger.debug(f"Parsed tool call data: {parsed_tool_call_data}")
+            if self.tool_call_stream is not None:
+                self.tool_call_stream.feed(final_result.output or "")
+                parsed_tool_call_data = self.tool_call_stream.result()
+            else:
+                parsed_tool_call_data = self.tool_call_parser.parse(self.tool_call_buffer)
+            self.tracer.trace("Tool call buffer: %s", self.tool_call_buffer)
+            self.tracer.trace("Parsed tool call data: %s", parsed_tool_call_data)
 
             if "error" in parsed_tool_call_data:
                 self.logger.error(f"Tool call parsing failed: {parsed_tool_call_data['error']}")
@@ -179,6 +234,45 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         self.logger.debug("No final content to return")
         return DetectionResult(state=DetectionState.NO_MATCH)
 
+    def _accumulate_tool_call(self, text: str) -> Optional[DetectionResult]:
+        """Append text to the tool call buffer and detect the end of the tool call.
+
+        The text is fed to the tool call stream, which parses each top-level JSON value
+        as it closes. The calls parsed so far are only accepted once the next
+        non-whitespace character shows that no further call follows (anything but `,`,
+        `;`, `{` or `[`), so tool calls written as separate values are not cut off.
+
+        Args:
+            text (str): New tool call text.
+
+        Returns:
+            Optional[DetectionResult]: A `COMPLETE_MATCH` with the parsed tool calls once
+                the tool call is complete, otherwise None.
+        """
+        self.tool_call_buffer += text
+        if self.tool_call_stream is None:
+            return None
+        if self.tool_call_stream.feed(text):
+            parsed_tool_call_data = self.tool_call_stream.result()
+            if "error" not in parsed_tool_call_data:
+                self.complete_end = self.tool_call_stream.last_call_end
+
+        if self.complete_end is None:
+            return None
+        following = self.tool_call_buffer[self.complete_end:].lstrip()
+        if not following:
+            return None
+        if following[0] in ",;{[":
+            self.complete_end = None
+            return None
+
+        self.tracer.trace("Tool call complete before end of stream; ignoring trailing text: %.50s", following)
+        parsed_tool_call_data = self.tool_call_stream.result()
+        return DetectionResult(
+            state=DetectionState.COMPLETE_MATCH,
+            tool_calls=self._extract_tool_calls(parsed_tool_call_data)
+        )
+
     def _extract_tool_calls(self, parsed_output: dict) -> List[ToolCall]:
         """Extract structured tool calls from parsed JSON output.
 
@@ -194,13 +288,10 @@ class ManualToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         tool_calls = []
         for tool_call_dict in parsed_output.get("tool_calls", []):
             tool_call_args = tool_call_dict.get("parameters", tool_call_dict.get("arguments"))
-            self.logger.debug("Extracting tool call arguments: %s", tool_call_args)
+            self.tracer.trace("Extracting tool call arguments: %s", tool_call_args)
             tool_calls.append(ToolCall(
                 id='123456789',  # Placeholder ID; modify as needed
                 type=tool_call_dict.get("type", "function"),
-                function=FunctionDetail(
-                    name=tool_call_dict.get("name"),
-                    arguments=str(tool_call_args)
-                )
+                function=FunctionDetail.from_arguments(tool_call_dict.get("name"), tool_call_args)
             ))
         return tool_calls
@@ -0,0 +1,102 @@
+# src/llm/tool_detection/strategy_pool.py
+
+import asyncio
+import logging
+from typing import List, AsyncIterator
+from contextlib import asynccontextmanager
+
+from src.llm.tool_detection.base_detection_strategy import BaseToolCallDetectionStrategy
+
+
+class DetectionStrategyPool:
+    """A bounded pool of tool call detection strategies.
+
+    Detection strategies keep per-stream state (argument buffers, tool call buffers,
+    automaton position), so concurrent streams must never share one instance. The
+    pool hands out a dedicated strategy per stream, cloned from a prototype so that
+    expensive read-only structures such as the Aho-Corasick automaton are built once
+    and shared. Strategies are reset when they are returned.
+
+    Args:
+        prototype (BaseToolCallDetectionStrategy): Strategy that pooled instances
+            are cloned from. It is never handed out itself.
+        max_size (int): Maximum number of strategies that may be leased at once.
+            Further `acquire()` calls wait until a strategy is released.
+        prebuilt (int): Number of strategies cloned up front.
+
+    Raises:
+        ValueError: If `max_size` is smaller than 1.
+
+    Example:
+        ```python
+        pool = DetectionStrategyPool(VendorToolCallDetectionStrategy(), max_size=128)
+
+        async with pool.lease() as detector:
+            async for chunk in stream:
+                result = await detector.detect_chunk(chunk, context)
+        ```
+    """
+
+    def __init__(self, prototype: BaseToolCallDetectionStrategy, max_size: int = 256, prebuilt: int = 8):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.prototype = prototype
+        self.max_size = max_size
+        self._idle: List[BaseToolCallDetectionStrategy] = [
+            prototype.clone() for _ in range(min(max(prebuilt, 0), max_size))
+        ]
+        self._created = len(self._idle)
+        self._slots = asyncio.Semaphore(max_size)
+        self.logger.debug("Initialized detection strategy pool (max_size=%d, prebuilt=%d)",
+                          max_size, self._created)
+
+    @property
+    def in_use(self) -> int:
+        """int: Number of strategies currently leased."""
+        return self._created - len(self._idle)
+
+    async def acquire(self) -> BaseToolCallDetectionStrategy:
+        """Lease a strategy, waiting if `max_size` strategies are already in use.
+
+        Returns:
+            BaseToolCallDetectionStrategy: A reset strategy owned by the caller until
+                it is passed to `release()`.
+        """
+        await self._slots.acquire()
+        if self._idle:
+            return self._idle.pop()
+
+        self._created += 1
+        self.logger.debug("Cloning new detection strategy (%d created)", self._created)
+        return self.prototype.clone()
+
+    def release(self, strategy: BaseToolCallDetectionStrategy) -> None:
+        """Reset a leased strategy and return it to the pool.
+
+        Args:
+            strategy (BaseToolCallDetectionStrategy): Strategy obtained from `acquire()`.
+        """
+        try:
+            strategy.reset()
+            self._idle.append(strategy)
+        except Exception:
+            # A strategy that cannot be reset is dropped; a fresh clone replaces it later.
+            self._created -= 1
+            self.logger.error("Failed to reset detection strategy, discarding it", exc_info=True)
+        finally:
+            self._slots.release()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[BaseToolCallDetectionStrategy]:
+        """Context manager that acquires a strategy and always releases it.
+
+        Yields:
+            BaseToolCallDetectionStrategy: The leased strategy.
+        """
+        strategy = await self.acquire()
+        try:
+            yield strategy
+        finally:
+            self.release(strategy)
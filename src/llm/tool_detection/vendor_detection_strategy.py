@@ -2,11 +2,29 @@
 
 import json
 import logging
+from typing import Dict, List, Optional
+
 from src.api import SSEChunk
+from src.api.sse_models import SSEToolCall
 from src.data_models.agent import StreamContext
 from src.data_models.chat_completions import ToolCall, FunctionDetail
 from src.llm.tool_detection import BaseToolCallDetectionStrategy
 from src.llm.tool_detection.detection_result import DetectionResult, DetectionState
+from src.utils.tracing import HotPathTracer
+from src.utils.tool_arguments import loads_arguments
+
+
+class _PartialToolCall:
+    """Accumulator for one streamed tool call."""
+
+    __slots__ = ("index", "id", "name", "arguments", "ready_tool_call")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.id: Optional[str] = None
+        self.name: Optional[str] = None
+        self.arguments = ""
+        self.ready_tool_call: Optional[ToolCall] = None
 
 
 class VendorToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
@@ -16,11 +34,29 @@ class VendorToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
     across multiple Server-Sent Events (SSE) chunks. It relies on vendor-specific
     metadata in the chunks to identify tool calls and their completion status.
 
+    Parallel tool calls are assembled independently: every tool call delta is routed
+    to an accumulator by its `index`, and a new accumulator is opened when a different
+    `id` arrives at an index that is already in use (some vendors stream every call at
+    index 0). All calls are reported together, in the order they started, once the
+    finish chunk arrives.
+
+    In speculative mode the strategy also watches the accumulated arguments and reports
+    each tool call through `DetectionResult.ready_tool_calls` as soon as its arguments
+    form a complete JSON object, so execution can start while the provider is still
+    streaming the remaining calls.
+
+    Args:
+        speculative (bool): Whether to report tool calls as soon as their arguments
+            are complete. Defaults to False.
+
     Attributes:
+        speculative (bool): Whether speculative reporting is enabled.
         found_complete_call (bool): Flag indicating if a complete tool call was found.
         collected_tool_calls (List[ToolCall]): List of fully collected tool calls.
-        partial_name (str): Buffer for accumulating function name.
-        partial_args (str): Buffer for accumulating function arguments.
+        partial_calls (List[_PartialToolCall]): Accumulators in the order the tool
+            calls started.
+        partial_calls_by_index (Dict[int, _PartialToolCall]): Current accumulator for
+            each vendor tool call index.
 
     Example:
         ```python
@@ -34,14 +70,16 @@ class VendorToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         ```
     """
 
-    def __init__(self):
+    def __init__(self, speculative: bool = False):
         """Initialize the vendor tool call detection strategy."""
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.tracer = HotPathTracer(self.logger)
         self.logger.debug("Initializing VendorToolCallDetectionStrategy")
+        self.speculative = speculative
         self.found_complete_call = None
         self.collected_tool_calls = None
-        self.partial_name = None
-        self.partial_args = None
+        self.partial_calls = None
+        self.partial_calls_by_index = None
         self.reset()
 
     def reset(self) -> None:
@@ -51,8 +89,8 @@ class VendorToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
         detector for processing a new stream of chunks.
         """
         self.logger.debug("Resetting detector state")
-        self.partial_name = None
-        self.partial_args = ""  # Accumulates streamed arguments
+        self.partial_calls: List[_PartialToolCall] = []
+        self.partial_calls_by_index: Dict[int, _PartialToolCall] = {}
         self.collected_tool_calls = []
         self.found_complete_call = False
 
@@ -80,7 +118,6 @@ class VendorToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
             that span multiple chunks. It relies on the finish_reason field to
             determine when a tool call is complete.
         """
-        tool_call_data = None
         if not sse_chunk.choices:
             return DetectionResult(state=DetectionState.NO_MATCH)
 
@@ -89,52 +126,47 @@ class VendorToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
 
         text_content = delta.content if delta.content else None
 
-        # Check if tool call data is present in this chunk
-        tool_calls = delta.tool_calls if delta.tool_calls else None
+        # Route every tool call delta in this chunk to its accumulator
+        ready_tool_calls = []
+        for tool_call_data in delta.tool_calls or []:
+            partial_call = self._get_partial_call(tool_call_data)
+            function = tool_call_data.function
 
-        if tool_calls:
-            tool_call_data = tool_calls[0]  # Assuming index 0 for simplicity
-            function_name = tool_call_data.function.name if tool_call_data.function else None
-            arguments = tool_call_data.function.arguments if tool_call_data.function else None
+            if function and function.name:
+                partial_call.name = function.name
 
-            # If this chunk contains a function name, store it
-            if function_name:
-                self.partial_name = function_name
+            if function and function.arguments:
+                partial_call.arguments += function.arguments
+                ready_tool_call = self._check_ready_tool_call(partial_call)
+                if ready_tool_call:
+                    ready_tool_calls.append(ready_tool_call)
 
-            # If arguments are being streamed, accumulate them
-            if arguments:
-                self.partial_args += arguments
-
-        # If finish_reason indicates the tool call is complete, finalize it
+        # If finish_reason indicates the tool calls are complete, finalize them
         if finish_reason in ["tool_calls", "tool_use"]:
-            if self.partial_name:
-                try:
-                    parsed_args = json.loads(self.partial_args) if self.partial_args else {}
-                except json.JSONDecodeError:
-                    self.logger.warning("Failed to parse arguments as JSON: %s", self.partial_args[:50])
-                    parsed_args = {"_malformed": self.partial_args}
-
-                tool_call = ToolCall(
-                    id=(tool_call_data and tool_call_data.id) or "call_generated",
-                    function=FunctionDetail(
-                        name=self.partial_name,
-                        arguments=str(parsed_args)
-                    )
+            tool_calls = [
+                partial_call.ready_tool_call or self._build_tool_call(
+                    partial_call, self._parse_arguments(partial_call.arguments)
                 )
-                self.collected_tool_calls.append(tool_call)
+                for partial_call in self.partial_calls
+                if partial_call.name
+            ]
+            if tool_calls:
+                self.collected_tool_calls.extend(tool_calls)
                 self.found_complete_call = True
+                self.tracer.trace("Assembled %d tool call(s)", len(tool_calls))
 
                 return DetectionResult(
                     state=DetectionState.COMPLETE_MATCH,
-                    tool_calls=[tool_call],
+                    tool_calls=tool_calls,
                     content=text_content
                 )
 
         # If we're still collecting tool call data, return PARTIAL_MATCH
-        if self.partial_name or self.partial_args:
+        if self.partial_calls:
             return DetectionResult(
                 state=DetectionState.PARTIAL_MATCH,
-                content=text_content
+                content=text_content,
+                ready_tool_calls=ready_tool_calls or None
             )
 
         # Otherwise, just return NO_MATCH and pass the text through
@@ -168,10 +200,98 @@ class VendorToolCallDetectionStrategy(BaseToolCallDetectionStrategy):
                 tool_calls=self.collected_tool_calls
             )
 
-        if self.partial_name or self.partial_args:
+        if self.partial_calls:
             self.logger.debug("Incomplete tool call data at stream end")
-            self.logger.debug(f"Name: {self.partial_name}, Args: {self.partial_args}")
+            for partial_call in self.partial_calls:
+                self.tracer.trace("Name: %s, Args: %s", partial_call.name, partial_call.arguments)
             return DetectionResult(state=DetectionState.NO_MATCH)
 
         self.logger.debug("No tool calls to finalize")
         return DetectionResult(state=DetectionState.NO_MATCH)
+
+    def _get_partial_call(self, tool_call_data: SSEToolCall) -> _PartialToolCall:
+        """Return the accumulator for a tool call delta, opening one if needed.
+
+        A delta continues the current accumulator at its index unless it carries an
+        `id` different from the one already recorded there, which marks the start
+        of another call reusing the same index.
+
+        Args:
+            tool_call_data (SSEToolCall): Tool call delta from the chunk.
+
+        Returns:
+            _PartialToolCall: The accumulator the delta belongs to.
+        """
+        index = tool_call_data.index or 0
+        partial_call = self.partial_calls_by_index.get(index)
+
+        if partial_call is None or (
+                tool_call_data.id and partial_call.id and tool_call_data.id != partial_call.id
+        ):
+            partial_call = _PartialToolCall(index)
+            self.partial_calls.append(partial_call)
+            self.partial_calls_by_index[index] = partial_call
+
+        if tool_call_data.id and not partial_call.id:
+            partial_call.id = tool_call_data.id
+
+        return partial_call
+
+    def _check_ready_tool_call(self, partial_call: _PartialToolCall) -> Optional[ToolCall]:
+        """Report a pending tool call once its arguments form a complete JSON object.
+
+        Only active in speculative mode, and reports each tool call at most once. The
+        cheap closing-brace check avoids a parse attempt on most argument deltas.
+
+        Args:
+            partial_call (_PartialToolCall): Accumulator that just received arguments.
+
+        Returns:
+            Optional[ToolCall]: The tool call if it just became ready, otherwise None.
+        """
+        if not self.speculative or partial_call.ready_tool_call or not partial_call.name:
+            return None
+        if not partial_call.arguments.rstrip().endswith("}"):
+            return None
+        try:
+            parsed_args = json.loads(partial_call.arguments)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(parsed_args, dict):
+            return None
+
+        partial_call.ready_tool_call = self._build_tool_call(partial_call, parsed_args)
+        self.tracer.trace("Tool call '%s' arguments complete before finish chunk", partial_call.name)
+        return partial_call.ready_tool_call
+
+    def _parse_arguments(self, arguments: str) -> dict:
+        """Parse accumulated arguments, preserving malformed input for diagnostics.
+
+        Args:
+            arguments (str): Accumulated argument text.
+
+        Returns:
+            dict: Parsed arguments, or `{"_malformed": arguments}` if they are not valid
+                JSON or JSON5.
+        """
+        try:
+            return loads_arguments(arguments) if arguments else {}
+        except ValueError:
+            self.logger.warning("Failed to parse arguments as JSON: %s", arguments[:50])
+            return {"_malformed": arguments}
+
+    def _build_tool_call(self, partial_call: _PartialToolCall, parsed_args: dict) -> ToolCall:
+        """Build a ToolCall from an accumulator and its parsed arguments.
+
+        Args:
+            partial_call (_PartialToolCall): Accumulator holding the name and vendor ID.
+            parsed_args (dict): Parsed function arguments.
+
+        Returns:
+            ToolCall: The assembled tool call. Calls without a vendor ID get one
+                derived from their position so parallel results stay distinguishable.
+        """
+        return ToolCall(
+            id=partial_call.id or f"call_generated_{self.partial_calls.index(partial_call)}",
+            function=FunctionDetail.from_arguments(partial_call.name, parsed_args)
+        )
@@ -16,6 +16,7 @@ Environment Variables:
 import os
 import yaml
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from starlette import status
 from dotenv import load_dotenv
@@ -23,6 +24,7 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 
+from src.llm import LLMFactory
 from src.api.sse_models import SSEChunk
 from src.api.routes.chat_completions_api import router as chat_completions_router
 
@@ -38,11 +40,33 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.info("Initializing application with log level: %s", log_level)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the model adapters' long-lived resources on startup and release them on shutdown.
+
+    Adapters are created when the agent is initialized, before the application starts.
+    Adapters with pooled HTTP sessions open them here, so the first request does not
+    pay for connection setup, and close them on shutdown.
+
+    Args:
+        app (FastAPI): The application being started.
+    """
+    await LLMFactory.startup_adapters()
+    logger.info("Model adapters started")
+    try:
+        yield
+    finally:
+        await LLMFactory.close_adapters()
+        logger.info("Model adapters closed")
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Chat Completions API",
     description="API for handling chat completions with streaming support",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Load agent config to check for allowed_origins
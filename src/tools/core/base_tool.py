@@ -23,7 +23,14 @@ class BaseTool:
 
     @abstractmethod
     async def execute(self, context: Optional[StreamContext] = None, **kwargs) -> ToolResponse:
-        """Execute the tool's main functionality."""
+        """Execute the tool's main functionality.
+
+        Tools with long-running work may instead implement this method as an async
+        generator that yields `ToolProgress` updates, which are relayed to the client,
+        followed by a `ToolResponse`. The first `ToolResponse` yielded is the tool's
+        result; the generator is closed at that point, so a tool can report that it
+        has enough before finishing all of its work.
+        """
         pass
 
     def get_definition(self) -> Tool:
@@ -1,3 +1,5 @@
-from .base_tool_call_parser import BaseToolCallParser
+from .base_tool_call_parser import BaseToolCallParser, ToolCallStream
 from .json_tool_call_parser import JSONToolCallParser
 from .non_json_tool_call_parser import NonJSONToolCallParser
+from .json_stream_scanner import JSONStreamScanner
+from .json_tool_call_stream import JSONToolCallStream
@@ -1,8 +1,38 @@
 # src/tools/core/parsers/base_tool_call_parser.py
 
 import logging
-from typing import Any, Dict
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class ToolCallStream(ABC):
+    """Interface of resumable tool call parsers created by `BaseToolCallParser.create_stream`.
+
+    Attributes:
+        last_call_end (Optional[int]): Offset just past the text of the last parsed tool
+            call, counted from the start of the first text fed.
+    """
+
+    last_call_end: Optional[int] = None
+
+    @abstractmethod
+    def feed(self, text: str) -> bool:
+        """Parse the next chunk of tool call text.
+
+        Args:
+            text (str): Text following everything fed so far.
+
+        Returns:
+            bool: True if new tool calls were completed by this text.
+        """
+
+    @abstractmethod
+    def result(self) -> Dict[str, Any]:
+        """Return the tool calls completed so far, in the format of `BaseToolCallParser.parse`."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Discard all state to parse a new text."""
 
 
 class BaseToolCallParser(ABC):
@@ -45,18 +75,7 @@ class BaseToolCallParser(ABC):
         """
         cleaned_text = self.clean_text(text)
         try:
-            extracted_data = self.extract(cleaned_text)
-            if "tool_calls" in extracted_data:
-                for tool_call in extracted_data["tool_calls"]:
-                    if "parameters" in tool_call:
-                        tool_call["arguments"] = tool_call.pop("parameters")
-            if "parameters" in extracted_data:
-                extracted_data["arguments"] = extracted_data.pop("parameters")
-                print(f"updated extracted_data: {extracted_data}")
-            if "error" not in extracted_data:
-                if self.validate(extracted_data):
-                    return extracted_data
-            return extracted_data
+            return self.postprocess(self.extract(cleaned_text))
         except ValueError as e:
             self.logger.error(f"Validation error: {str(e)}")
             return {"error": str(e)}
@@ -64,6 +83,42 @@ class BaseToolCallParser(ABC):
             self.logger.error("Unexpected error during parsing", exc_info=True)
             return {"error": f"Unexpected error: {str(e)}"}
 
+    def postprocess(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize and validate extracted tool calls.
+
+        Renames `parameters` to `arguments` and validates successful extractions.
+
+        Args:
+            extracted_data (Dict[str, Any]): Result of `extract`.
+
+        Returns:
+            Dict[str, Any]: The normalized tool calls or the extraction's error information.
+
+        Raises:
+            ValueError: If validation fails.
+        """
+        if "tool_calls" in extracted_data:
+            for tool_call in extracted_data["tool_calls"]:
+                if "parameters" in tool_call:
+                    tool_call["arguments"] = tool_call.pop("parameters")
+        if "parameters" in extracted_data:
+            extracted_data["arguments"] = extracted_data.pop("parameters")
+            self.logger.debug("Renamed parameters to arguments: %s", extracted_data)
+        if "error" not in extracted_data:
+            self.validate(extracted_data)
+        return extracted_data
+
+    def create_stream(self) -> Optional["ToolCallStream"]:
+        """Create a resumable parser that is fed tool call text chunk by chunk.
+
+        Parsers without incremental support return None; their callers parse the
+        complete text with `parse` instead.
+
+        Returns:
+            Optional[ToolCallStream]: A new stream, or None if not supported.
+        """
+        return None
+
     def clean_text(self, text: str) -> str:
         """Clean input text by removing specified tokens.
 
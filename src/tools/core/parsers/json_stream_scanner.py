@@ -0,0 +1,85 @@
+# src/tools/core/parsers/json_stream_scanner.py
+
+from typing import List, Optional
+
+
+class JSONStreamScanner:
+    """Incremental, bracket- and string-aware scanner for streamed JSON text.
+
+    Text is fed chunk by chunk and each character is inspected exactly once. The
+    scanner tracks the nesting depth of objects and arrays and whether it is inside
+    a string literal, and reports where each top-level value closes. Both double and
+    single quoted strings are recognized, matching the JSON5 accepted by
+    `JSONToolCallParser`. Quotes outside any object or array are ordinary text, so
+    apostrophes in surrounding prose do not open a string.
+
+    The scanner only checks balance; whether a closed value is valid JSON is left to
+    the parser.
+
+    Attributes:
+        position (int): Number of characters scanned so far.
+        depth (int): Current nesting depth of objects and arrays.
+
+    Example:
+        ```python
+        scanner = JSONStreamScanner()
+        scanner.feed('<|tool_call|>[{"name": "a"')  # []
+        scanner.feed('}] done')                      # [29]
+        ```
+    """
+
+    OPENERS = frozenset("{[")
+    CLOSERS = frozenset("}]")
+    QUOTES = frozenset("\"'")
+
+    def __init__(self):
+        self.position = 0
+        self.depth = 0
+        self._quote: Optional[str] = None
+        self._escaped = False
+
+    def reset(self) -> None:
+        """Reset the scanner to the start of a new text."""
+        self.position = 0
+        self.depth = 0
+        self._quote = None
+        self._escaped = False
+
+    @property
+    def in_string(self) -> bool:
+        """bool: Whether the scanner is inside a string literal."""
+        return self._quote is not None
+
+    def feed(self, text: str) -> List[int]:
+        """Scan the next piece of text.
+
+        Args:
+            text (str): Text following everything fed so far.
+
+        Returns:
+            List[int]: For every top-level value that closed in `text`, the offset just
+                past its closing bracket, counted from the start of the first text fed.
+        """
+        closed = []
+        depth, quote, escaped = self.depth, self._quote, self._escaped
+        for i, char in enumerate(text):
+            if quote is not None:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == quote:
+                    quote = None
+            elif char in self.OPENERS:
+                depth += 1
+            elif char in self.CLOSERS:
+                if depth > 0:
+                    depth -= 1
+                    if depth == 0:
+                        closed.append(self.position + i + 1)
+            elif depth > 0 and char in self.QUOTES:
+                quote = char
+
+        self.depth, self._quote, self._escaped = depth, quote, escaped
+        self.position += len(text)
+        return closed
@@ -1,10 +1,12 @@
 # src/tools/core/parsers/json_tool_call_parser.py
 
 import re
+import json
 import json5
 from typing import Dict, Any, List
 
 from src.tools.core.parsers.base_tool_call_parser import BaseToolCallParser
+from src.tools.core.parsers.json_tool_call_stream import JSONToolCallStream
 
 
 class JSONToolCallParser(BaseToolCallParser):
@@ -39,46 +41,66 @@ class JSONToolCallParser(BaseToolCallParser):
         """
         try:
             # Try to find JSON-like content
-            json_strings = self.find_json_content(text)
             valid_calls = []
-
-            for json_str in json_strings:
-                try:
-                    # First attempt: Standard parsing with json5
-                    parsed = json5.loads(json_str)
-                    parsed = self.parse_nested_json(parsed)
-
-                    if isinstance(parsed, dict):
-                        valid_calls.append(parsed)
-                    elif isinstance(parsed, list):
-                        valid_calls.extend(parsed)
-                except Exception:
-                    # Second attempt: Apply preprocessing to fix common issues
-                    try:
-                        fixed_json = self.preprocess_json(json_str)
-                        parsed = json5.loads(fixed_json)
-                        parsed = self.parse_nested_json(parsed)
-
-                        if isinstance(parsed, dict):
-                            valid_calls.append(parsed)
-                        elif isinstance(parsed, list):
-                            valid_calls.extend(parsed)
-                    except Exception:
-                        # If all else fails, try a more aggressive approach for lists
-                        if json_str.startswith('[') and json_str.endswith(']'):
-                            items = self.split_json_list_items(json_str)
-                            for item in items:
-                                try:
-                                    parsed_item = json5.loads(item)
-                                    parsed_item = self.parse_nested_json(parsed_item)
-                                    valid_calls.append(parsed_item)
-                                except Exception:
-                                    continue
+            for json_str in self.find_json_content(text):
+                valid_calls.extend(self.parse_json_value(json_str))
 
             return {"tool_calls": valid_calls} if valid_calls else {"error": "No valid tool calls found"}
         except Exception as e:
             return {"error": f"Unexpected error: {str(e)}"}
 
+    def parse_json_value(self, json_str: str) -> List[Any]:
+        """Parse one balanced JSON object or array into tool call items, recovering from common errors.
+
+        Strict JSON is tried first, as it is by far the most common case and the fastest
+        to parse. Then JSON5, JSON5 after fixing common syntax errors, and finally, for
+        arrays, each item on its own.
+
+        Args:
+            json_str (str): A single balanced JSON object or array.
+
+        Returns:
+            List[Any]: The parsed tool call items; empty if nothing could be parsed.
+        """
+        for loads in (json.loads, json5.loads):
+            try:
+                return self._as_items(self.parse_nested_json(loads(json_str)))
+            except Exception:
+                pass
+
+        # Apply preprocessing to fix common issues
+        try:
+            return self._as_items(self.parse_nested_json(json5.loads(self.preprocess_json(json_str))))
+        except Exception:
+            pass
+
+        # If all else fails, try a more aggressive approach for lists
+        items = []
+        if json_str.startswith('[') and json_str.endswith(']'):
+            for item in self.split_json_list_items(json_str):
+                try:
+                    items.append(self.parse_nested_json(json5.loads(item)))
+                except Exception:
+                    continue
+        return items
+
+    @staticmethod
+    def _as_items(parsed: Any) -> List[Any]:
+        """Wrap a parsed object as a single tool call; arrays are lists of tool calls."""
+        if isinstance(parsed, dict):
+            return [parsed]
+        if isinstance(parsed, list):
+            return parsed
+        return []
+
+    def create_stream(self) -> "JSONToolCallStream":
+        """Create a resumable parser that parses each JSON value as soon as it closes.
+
+        Returns:
+            JSONToolCallStream: A new stream using this parser.
+        """
+        return JSONToolCallStream(self)
+
     @staticmethod
     def find_json_content(text: str) -> List[str]:
         """Extract potential JSON content from raw text using balanced delimiter matching.
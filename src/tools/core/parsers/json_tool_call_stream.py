@@ -0,0 +1,105 @@
+# src/tools/core/parsers/json_tool_call_stream.py
+
+import re
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from src.tools.core.parsers.base_tool_call_parser import ToolCallStream
+from src.tools.core.parsers.json_stream_scanner import JSONStreamScanner
+
+if TYPE_CHECKING:
+    from src.tools.core.parsers.json_tool_call_parser import JSONToolCallParser
+
+
+class JSONToolCallStream(ToolCallStream):
+    """Resumable JSON tool call parser fed chunk by chunk.
+
+    A `JSONStreamScanner` keeps depth, string and escape state between chunks, so each
+    character is scanned once. As soon as a top-level object or array closes, it is
+    cleaned and parsed with the recovery rules of `JSONToolCallParser.parse_json_value`,
+    and only the text of the value still open is kept. Parsing a tool call thus costs
+    one pass spread across the stream instead of a full re-parse at the end.
+
+    Args:
+        parser (JSONToolCallParser): Parser providing cleaning, recovery and validation.
+
+    Attributes:
+        tool_calls (List[Any]): Tool call items parsed so far.
+        last_call_end (Optional[int]): Offset just past the last value that yielded tool
+            calls, counted from the start of the first text fed.
+
+    Example:
+        ```python
+        stream = parser.create_stream()
+        stream.feed('<|tool_call|>[{"name": "a", ')   # False
+        stream.feed('"arguments": {}}] Done.')        # True
+        stream.result()  # {"tool_calls": [{"name": "a", "arguments": {}}]}
+        ```
+    """
+
+    VALUE_START = re.compile(r"[{\[]")
+
+    def __init__(self, parser: "JSONToolCallParser"):
+        self.parser = parser
+        self.scanner = JSONStreamScanner()
+        self.tool_calls: List[Any] = []
+        self.last_call_end: Optional[int] = None
+        self._pending = ""
+        self._pending_start = 0
+
+    def reset(self) -> None:
+        """Discard all state to parse a new text."""
+        self.scanner.reset()
+        self.tool_calls = []
+        self.last_call_end = None
+        self._pending = ""
+        self._pending_start = 0
+
+    def feed(self, text: str) -> bool:
+        """Scan the next chunk and parse every top-level value it closes.
+
+        Args:
+            text (str): Text following everything fed so far.
+
+        Returns:
+            bool: True if a value closed in `text` yielded tool calls.
+        """
+        self._pending += text
+        found = False
+        for end in self.scanner.feed(text):
+            value = self._pending[:end - self._pending_start]
+            self._pending = self._pending[end - self._pending_start:]
+            self._pending_start = end
+
+            # Outside of values there are no strings, so the first bracket opens the value
+            start = self.VALUE_START.search(value)
+            cleaned = self.parser.clean_text(value[start.start():]) if start else ""
+            if not cleaned:
+                continue
+            calls = self.parser.parse_json_value(cleaned)
+            if calls:
+                self.tool_calls.extend(calls)
+                self.last_call_end = end
+                found = True
+
+        if self.scanner.depth == 0:
+            # Text between values is never part of a tool call
+            self._pending_start += len(self._pending)
+            self._pending = ""
+        return found
+
+    def result(self) -> Dict[str, Any]:
+        """Return the tool calls parsed so far, in the format of `BaseToolCallParser.parse`.
+
+        Returns:
+            Dict[str, Any]: `{"tool_calls": [...]}` or `{"error": "error message"}`.
+        """
+        if not self.tool_calls:
+            return {"error": "No valid tool calls found"}
+        try:
+            return self.parser.postprocess({"tool_calls": list(self.tool_calls)})
+        except ValueError as e:
+            self.parser.logger.error(f"Validation error: {str(e)}")
+            return {"error": str(e)}
+        except Exception as e:
+            self.parser.logger.error("Unexpected error during parsing", exc_info=True)
+            return {"error": f"Unexpected error: {str(e)}"}
@@ -29,7 +29,8 @@ class NonJSONToolCallParser(BaseToolCallParser):
         """Extract non-JSON tool calls using regex patterns.
 
         Searches for tool calls using configured regex patterns and parses
-        their arguments as JSON.
+        their arguments as JSON. Arguments captured without their enclosing braces,
+        as the default pattern does, get them restored before parsing.
 
         Args:
             text (str): Cleaned input text containing tool calls.
@@ -49,10 +50,14 @@ class NonJSONToolCallParser(BaseToolCallParser):
 
         tool_calls = []
         for match in matches:
+            arguments = match[1].strip()
+            # The default pattern captures the arguments without their enclosing braces
+            if not arguments.startswith("{"):
+                arguments = "{" + arguments + "}"
             try:
                 tool_calls.append({
                     "name": match[0],
-                    "arguments": json.loads(match[1])  # Parse arguments as JSON
+                    "arguments": json.loads(arguments)
                 })
             except json.JSONDecodeError:
                 return {"error": f"Failed to parse arguments for function: {match[0]}"}
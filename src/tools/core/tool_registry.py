@@ -2,12 +2,14 @@
 
 import logging
 import asyncio
-from typing import Dict, Optional, List, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, Optional, List, Any, Tuple, Mapping, NamedTuple
 
 from src.data_models.tools import Tool
 from src.tools.core.base_tool import BaseTool
 from src.tools.core.utils.tool_discovery import discover_custom_tools
 from src.tools.core.utils.tool_builder import create_tool_from_config
+from src.tools.core.utils.argument_validator import ArgumentValidator
 from src.tools.core.observer import ToolUpdateEvent
 
 TOOL_SOURCE_LOCAL = "local"
@@ -21,6 +23,19 @@ ToolInfo = Dict[str, Any]
 RegistrationResult = Tuple[str, str]
 
 
+class ToolDefinitionSnapshot(NamedTuple):
+    """Immutable view of the public tool definitions at one registry version.
+
+    Attributes:
+        version: Incremented every time the set of registered tools changes.
+        definitions: Tool definitions in registration order.
+        by_name: Read-only mapping from tool name to its definition.
+    """
+    version: int
+    definitions: Tuple[Tool, ...]
+    by_name: Mapping[str, Tool]
+
+
 class ToolRegistry:
     """
     Registry for dynamically loading and storing tool instances.
@@ -31,6 +46,9 @@ class ToolRegistry:
          registers tools, and logs summaries.
 
     Callers with MCP configurations must await `initialize_all_tools()` after construction.
+
+    Each tool's `parameters` schema is compiled into an `ArgumentValidator` when the tool
+    is registered, so `validate_arguments` can check tool calls before they execute.
     """
 
     def __init__(self, tools_config: List[Any], mcp_config: Optional[Dict[str, Any]] = None):
@@ -42,6 +60,7 @@ class ToolRegistry:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.tools: Dict[str, BaseTool] = {}
         self.hidden_tools: Dict[str, BaseTool] = {}
+        self.validators: Dict[str, ArgumentValidator] = {}
         self.registration_results: Dict[str, List[RegistrationResult]] = {
             REGISTRATION_SUCCESS: [],
             REGISTRATION_HIDDEN_SUCCESS: [],
@@ -54,6 +73,7 @@ class ToolRegistry:
         self._local_tool_info: List[ToolInfo] = self._gather_local_tool_info()
         self._mcp_tool_infos: List[ToolInfo] = []
         self._lock = asyncio.Lock()  # thinking about mcp notifications, registering, initialization competing
+        self._snapshot = ToolDefinitionSnapshot(version=0, definitions=(), by_name=MappingProxyType({}))
 
         if not self.mcp_config:
             # In local-only mode, we expect the caller to await initialization.
@@ -153,6 +173,7 @@ class ToolRegistry:
                 self.registration_results[REGISTRATION_FAILED].append((name, "Already registered"))
                 raise ValueError(error_msg)
 
+            self._compile_validator(name, tool)
             if hidden:
                 self.hidden_tools[name] = tool
                 self.registration_results[REGISTRATION_HIDDEN_SUCCESS].append((name, source))
@@ -161,6 +182,48 @@ class ToolRegistry:
                 self.tools[name] = tool
                 self.registration_results[REGISTRATION_SUCCESS].append((name, source))
                 self.logger.debug(f"Registered tool: {name} from {source}")
+                self._rebuild_snapshot()
+
+    def _compile_validator(self, name: str, tool: BaseTool):
+        """
+        Compile the argument validator for a tool from its `parameters` schema.
+        A schema that cannot be compiled leaves the tool without validation rather than unregistered.
+        """
+        try:
+            self.validators[name] = ArgumentValidator(name, getattr(tool, "parameters", None))
+        except Exception as e:
+            self.validators.pop(name, None)
+            self.logger.warning(f"Could not compile argument validator for tool '{name}': {e}", exc_info=True)
+
+    def validate_arguments(self, name: str, arguments: Any) -> Dict[str, Any]:
+        """
+        Validate and coerce tool call arguments with the tool's compiled validator.
+        Tools without a validator get their arguments back unchanged.
+
+        Raises:
+            ArgumentValidationError: If the arguments do not match the tool's parameter schema.
+        """
+        validator = self.validators.get(name)
+        return validator.validate(arguments) if validator is not None else arguments
+
+    def _rebuild_snapshot(self):
+        """
+        Rebuild the tool definition snapshot from the public tools.
+        Must be called with `_lock` held, after every change to `self.tools`.
+        """
+        definitions = {}
+        for tool_name, tool in self.tools.items():
+            try:
+                definitions[tool_name] = tool.get_definition()
+            except Exception as e:
+                self.logger.error(f"Error getting definition for tool '{tool_name}': {e}", exc_info=True)
+        self._snapshot = ToolDefinitionSnapshot(
+            version=self._snapshot.version + 1,
+            definitions=tuple(definitions.values()),
+            by_name=MappingProxyType(definitions)
+        )
+        self.logger.debug(f"Rebuilt tool definition snapshot v{self._snapshot.version} "
+                          f"({len(definitions)} tool(s))")
 
     def _log_registration_summary(self):
         """Log the final registration summary (displays discovered and registered info)."""
@@ -224,25 +287,25 @@ class ToolRegistry:
         async with self._lock:
             return self.hidden_tools.get(name)
 
+    def get_definitions_snapshot(self) -> ToolDefinitionSnapshot:
+        """
+        Return the current tool definition snapshot without taking the lock.
+        Snapshots are replaced, never mutated, so the result stays consistent for the caller.
+        """
+        return self._snapshot
+
     async def get_tool_definitions(
             self,
             allowed: Optional[List[str]] = None,
             disallowed: Optional[List[str]] = None
     ) -> List[Tool]:
         """Get definitions for all registered non-hidden tools with optional filtering."""
-        definitions = []
-        async with self._lock:
-            tools_copy = list(self.tools.items())
-        for tool_name, tool in tools_copy:
-            if allowed is not None and tool_name not in allowed:
-                continue
-            if disallowed is not None and tool_name in disallowed:
-                continue
-            try:
-                definitions.append(tool.get_definition())
-            except Exception as e:
-                self.logger.error(f"Error getting definition for tool '{tool_name}': {e}", exc_info=True)
-        return definitions
+        snapshot = self._snapshot
+        return [
+            definition for tool_name, definition in snapshot.by_name.items()
+            if (allowed is None or tool_name in allowed)
+            and (disallowed is None or tool_name not in disallowed)
+        ]
 
     def update_tools_from_mcp(self, event: ToolUpdateEvent):
         """
@@ -287,6 +350,9 @@ class ToolRegistry:
                         del self.hidden_tools[name]
                     else:
                         self.logger.warning(f"Cannot remove unknown tool: {name}")
+                        continue
+                    self.validators.pop(name, None)
+                self._rebuild_snapshot()
 
         # Handle tool updates.
         if event.updated_tool_defs:
@@ -298,9 +364,12 @@ class ToolRegistry:
                     async with self._lock:
                         if name in self.tools:
                             self.tools[name] = instance
+                            self._compile_validator(name, instance)
                             self.logger.info(f"Updated MCP tool: {name}")
+                            self._rebuild_snapshot()
                         elif name in self.hidden_tools:
                             self.hidden_tools[name] = instance
+                            self._compile_validator(name, instance)
                             self.logger.info(f"Updated hidden MCP tool: {name}")
                         else:
                             self.logger.warning(f"Cannot update unknown tool: {name}")
@@ -0,0 +1,328 @@
+# src/tools/core/utils/argument_validator.py
+
+import re
+import json
+import math
+from typing import Any, Callable, Dict, List, Optional
+
+# A compiled check takes a value and its path, records problems in the issue list
+# and returns the value, coerced where the schema allows it.
+Check = Callable[[Any, str, List[Dict[str, str]]], Any]
+
+_INTEGER_TEXT = re.compile(r"\s*[-+]?\d+\s*")
+
+
+class ArgumentValidationError(ValueError):
+    """Raised when tool call arguments do not match the tool's parameter schema.
+
+    Attributes:
+        tool_name (str): Name of the tool that was called.
+        issues (List[Dict[str, str]]): One entry per problem, each with the `path` of
+            the offending argument (dotted, empty for the arguments as a whole) and
+            a `message`.
+    """
+
+    def __init__(self, tool_name: str, issues: List[Dict[str, str]]):
+        self.tool_name = tool_name
+        self.issues = issues
+        details = "; ".join(f"{issue['path'] or 'arguments'}: {issue['message']}" for issue in issues)
+        super().__init__(f"Invalid arguments for tool {tool_name}: {details}")
+
+    def to_tool_content(self) -> str:
+        """Render the issues as the JSON content of a tool message, so the model can correct the call."""
+        return json.dumps({
+            "error": "invalid_arguments",
+            "tool": self.tool_name,
+            "issues": self.issues,
+        })
+
+
+class ArgumentValidator:
+    """Validator for tool call arguments, compiled once from a tool's `parameters` schema.
+
+    The JSON schema is compiled into a tree of closures when the tool is registered,
+    so validating a call only runs the checks the schema needs, without interpreting
+    the schema again. The supported subset covers what tool schemas use in practice:
+    `type` (single or list), `properties`, `required`, `additionalProperties`, `items`,
+    `enum`, `const`, `anyOf`/`oneOf` (the first matching branch wins), numeric bounds,
+    `minLength`/`maxLength`, `minItems`/`maxItems` and `pattern`. Other keywords,
+    including `$ref`, are ignored.
+
+    Common model mistakes are coerced instead of rejected: numbers and booleans given
+    as strings, integral floats for integers, numbers for strings, and objects or
+    arrays given as JSON text.
+
+    Args:
+        tool_name (str): Name of the tool, used in error reports.
+        schema (Optional[Dict[str, Any]]): The tool's `parameters` JSON schema.
+
+    Example:
+        ```python
+        validator = ArgumentValidator("get_weather", {
+            "type": "object",
+            "properties": {"city": {"type": "string"}, "days": {"type": "integer"}},
+            "required": ["city"]
+        })
+        validator.validate({"city": "Paris", "days": "3"})  # {"city": "Paris", "days": 3}
+        validator.validate({"days": 3})  # raises ArgumentValidationError
+        ```
+    """
+
+    def __init__(self, tool_name: str, schema: Optional[Dict[str, Any]]):
+        self.tool_name = tool_name
+        self._check = _compile(dict(schema or {}, type="object"))
+
+    def validate(self, arguments: Any) -> Dict[str, Any]:
+        """Validate and coerce the arguments of one tool call.
+
+        Args:
+            arguments (Any): Parsed tool call arguments.
+
+        Returns:
+            Dict[str, Any]: The arguments, coerced to the schema's types.
+
+        Raises:
+            ArgumentValidationError: If the arguments do not match the schema.
+        """
+        issues: List[Dict[str, str]] = []
+        coerced = self._check(arguments, "", issues)
+        if issues:
+            raise ArgumentValidationError(self.tool_name, issues)
+        return coerced
+
+
+def _join(path: str, key: Any) -> str:
+    return f"{path}.{key}" if path else str(key)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _as_string(value: Any) -> Any:
+    if isinstance(value, str):
+        return value
+    if _is_number(value):
+        return str(value)
+    return None
+
+
+def _as_integer(value: Any) -> Any:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and _INTEGER_TEXT.fullmatch(value):
+        return int(value)
+    return None
+
+
+def _as_number(value: Any) -> Any:
+    if _is_number(value):
+        return value
+    if isinstance(value, str):
+        if _INTEGER_TEXT.fullmatch(value):
+            return int(value)
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+        return number if math.isfinite(number) else None
+    return None
+
+
+def _as_boolean(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in ("true", "false"):
+        return value.strip().lower() == "true"
+    return None
+
+
+def _as_json(expected: type) -> Callable[[Any], Any]:
+    def convert(value: Any) -> Any:
+        if isinstance(value, expected):
+            return value
+        if isinstance(value, str):
+            try:
+                parsed = json.loads(value)
+            except ValueError:
+                return None
+            return parsed if isinstance(parsed, expected) else None
+        return None
+    return convert
+
+
+# Each converter returns the value as the JSON type, or None if it is not convertible
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "string": _as_string,
+    "integer": _as_integer,
+    "number": _as_number,
+    "boolean": _as_boolean,
+    "object": _as_json(dict),
+    "array": _as_json(list),
+}
+
+_EXACT: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": _is_number,
+    "boolean": lambda value: isinstance(value, bool),
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "null": lambda value: value is None,
+}
+
+
+def _compile(schema: Any) -> Check:
+    """Compile a JSON schema into a check function."""
+    if not isinstance(schema, dict):
+        return lambda value, path, issues: value
+
+    checks: List[Check] = []
+
+    types = schema.get("type")
+    if types is not None:
+        checks.append(_compile_type([types] if isinstance(types, str) else list(types)))
+
+    for keyword in ("anyOf", "oneOf"):
+        if schema.get(keyword):
+            checks.append(_compile_any_of([_compile(branch) for branch in schema[keyword]]))
+
+    if "enum" in schema or "const" in schema:
+        allowed = list(schema["enum"]) if "enum" in schema else [schema["const"]]
+
+        def check_enum(value, path, issues):
+            if value not in allowed:
+                issues.append({"path": path, "message": f"must be one of {json.dumps(allowed)}"})
+            return value
+        checks.append(check_enum)
+
+    if any(key in schema for key in ("properties", "required", "additionalProperties")):
+        checks.append(_compile_object(schema))
+    if "items" in schema or "minItems" in schema or "maxItems" in schema:
+        checks.append(_compile_array(schema))
+    if any(key in schema for key in ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")):
+        checks.append(_compile_bounds(schema))
+    if any(key in schema for key in ("minLength", "maxLength", "pattern")):
+        checks.append(_compile_string(schema))
+
+    if len(checks) == 1:
+        return checks[0]
+
+    def check_all(value, path, issues):
+        for check in checks:
+            count = len(issues)
+            value = check(value, path, issues)
+            if len(issues) > count:
+                break
+        return value
+    return check_all
+
+
+def _compile_type(types: List[str]) -> Check:
+    exact = [_EXACT[name] for name in types if name in _EXACT]
+    converters = [_CONVERTERS[name] for name in types if name in _CONVERTERS]
+    expected = " or ".join(types)
+
+    def check_type(value, path, issues):
+        if not exact or any(matches(value) for matches in exact):
+            return value
+        for convert in converters:
+            converted = convert(value)
+            if converted is not None:
+                return converted
+        issues.append({"path": path, "message": f"expected {expected}, got {type(value).__name__}"})
+        return value
+    return check_type
+
+
+def _compile_any_of(branches: List[Check]) -> Check:
+    def check_any_of(value, path, issues):
+        first_issues = None
+        for branch in branches:
+            branch_issues: List[Dict[str, str]] = []
+            converted = branch(value, path, branch_issues)
+            if not branch_issues:
+                return converted
+            first_issues = first_issues or branch_issues
+        issues.extend(first_issues or [])
+        return value
+    return check_any_of
+
+
+def _compile_object(schema: Dict[str, Any]) -> Check:
+    properties = {name: _compile(sub_schema) for name, sub_schema in (schema.get("properties") or {}).items()}
+    required = list(schema.get("required") or [])
+    additional = schema.get("additionalProperties", True)
+    additional_check = _compile(additional) if isinstance(additional, dict) else None
+
+    def check_object(value, path, issues):
+        if not isinstance(value, dict):
+            return value
+        coerced = {}
+        for key, item in value.items():
+            check = properties.get(key, additional_check)
+            if check is not None:
+                coerced[key] = check(item, _join(path, key), issues)
+            elif additional is False:
+                issues.append({"path": _join(path, key), "message": "unexpected argument"})
+            else:
+                coerced[key] = item
+        for key in required:
+            if key not in value:
+                issues.append({"path": _join(path, key), "message": "required argument is missing"})
+        return coerced
+    return check_object
+
+
+def _compile_array(schema: Dict[str, Any]) -> Check:
+    items = _compile(schema["items"]) if isinstance(schema.get("items"), dict) else None
+    min_items, max_items = schema.get("minItems"), schema.get("maxItems")
+
+    def check_array(value, path, issues):
+        if not isinstance(value, list):
+            return value
+        if min_items is not None and len(value) < min_items:
+            issues.append({"path": path, "message": f"must have at least {min_items} items"})
+        if max_items is not None and len(value) > max_items:
+            issues.append({"path": path, "message": f"must have at most {max_items} items"})
+        if items is None:
+            return value
+        return [items(item, _join(path, index), issues) for index, item in enumerate(value)]
+    return check_array
+
+
+def _compile_bounds(schema: Dict[str, Any]) -> Check:
+    bounds = [
+        (schema.get("minimum"), lambda value, bound: value >= bound, "must be >= {}"),
+        (schema.get("maximum"), lambda value, bound: value <= bound, "must be <= {}"),
+        (schema.get("exclusiveMinimum"), lambda value, bound: value > bound, "must be > {}"),
+        (schema.get("exclusiveMaximum"), lambda value, bound: value < bound, "must be < {}"),
+    ]
+    bounds = [(bound, holds, message) for bound, holds, message in bounds if _is_number(bound)]
+
+    def check_bounds(value, path, issues):
+        if _is_number(value):
+            for bound, holds, message in bounds:
+                if not holds(value, bound):
+                    issues.append({"path": path, "message": message.format(bound)})
+        return value
+    return check_bounds
+
+
+def _compile_string(schema: Dict[str, Any]) -> Check:
+    min_length, max_length = schema.get("minLength"), schema.get("maxLength")
+    pattern = re.compile(schema["pattern"]) if schema.get("pattern") else None
+
+    def check_string(value, path, issues):
+        if not isinstance(value, str):
+            return value
+        if min_length is not None and len(value) < min_length:
+            issues.append({"path": path, "message": f"must be at least {min_length} characters long"})
+        if max_length is not None and len(value) > max_length:
+            issues.append({"path": path, "message": f"must be at most {max_length} characters long"})
+        if pattern is not None and not pattern.search(value):
+            issues.append({"path": path, "message": f"must match pattern {pattern.pattern}"})
+        return value
+    return check_string
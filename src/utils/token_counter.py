@@ -0,0 +1,95 @@
+# src/utils/token_counter.py
+
+from typing import List, Sequence
+
+from src.data_models.chat_completions import TextChatMessage, ToolMessage
+
+
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4
+IMAGE_TOKENS = 85
+
+
+def count_text_tokens(text: str) -> int:
+    """Estimate the number of tokens in a piece of text.
+
+    Uses a vendor-neutral characters-per-token heuristic, which is accurate enough
+    for budgeting across the different tokenizers of the supported models.
+
+    Args:
+        text (str): Text to estimate.
+
+    Returns:
+        int: Estimated token count.
+    """
+    if not text:
+        return 0
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def count_message_tokens(message: TextChatMessage) -> int:
+    """Estimate the number of tokens a message occupies in the prompt.
+
+    The estimate is computed once and memoized on the message, so repeated context
+    windows over the same conversation do not re-scan message content.
+
+    Args:
+        message (TextChatMessage): Message to estimate.
+
+    Returns:
+        int: Estimated token count, including per-message formatting overhead.
+    """
+    if message._token_count is not None:
+        return message._token_count
+
+    tokens = MESSAGE_OVERHEAD_TOKENS
+    content = getattr(message, "content", None)
+    if isinstance(content, str):
+        tokens += count_text_tokens(content)
+    elif content:
+        for part in content:
+            if isinstance(part, dict):
+                tokens += count_text_tokens(part.get("text", "")) if part.get("type", "text") == "text" else IMAGE_TOKENS
+            elif getattr(part, "type", None) == "image_url":
+                tokens += IMAGE_TOKENS
+            else:
+                tokens += count_text_tokens(getattr(part, "text", ""))
+
+    for tool_call in getattr(message, "tool_calls", None) or []:
+        tokens += count_text_tokens(tool_call.function.name) + count_text_tokens(tool_call.function.arguments)
+
+    message._token_count = tokens
+    return tokens
+
+
+def select_messages_within_budget(messages: Sequence[TextChatMessage], budget: int) -> List[TextChatMessage]:
+    """Select the newest messages whose combined token estimate fits a budget.
+
+    Messages are packed from newest to oldest until the next one would exceed the
+    budget. The newest message is always kept, even if it alone exceeds the budget.
+    Tool messages left at the start of the window without the assistant message
+    that issued their tool call are dropped.
+
+    Args:
+        messages (Sequence[TextChatMessage]): Conversation messages, oldest first.
+        budget (int): Maximum number of estimated tokens.
+
+    Returns:
+        List[TextChatMessage]: The selected messages, oldest first.
+    """
+    if not messages:
+        return []
+
+    start = len(messages) - 1
+    used = count_message_tokens(messages[start])
+    while start > 0:
+        tokens = count_message_tokens(messages[start - 1])
+        if used + tokens > budget:
+            break
+        used += tokens
+        start -= 1
+
+    while start < len(messages) - 1 and isinstance(messages[start], ToolMessage):
+        start += 1
+
+    return list(messages[start:])
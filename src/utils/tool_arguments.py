@@ -0,0 +1,51 @@
+# src/utils/tool_arguments.py
+
+import json
+from typing import Any
+
+import json5
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def loads_arguments(text: str) -> Any:
+    """Parse tool call arguments from JSON text.
+
+    Well-formed JSON, which is what vendors return and what this module writes, is
+    parsed with orjson when it is installed and the standard library otherwise.
+    The much slower json5 is only used to recover malformed model output, such as
+    single quotes, unquoted keys or trailing commas.
+
+    Args:
+        text (str): Argument text.
+
+    Returns:
+        Any: The parsed arguments.
+
+    Raises:
+        ValueError: If the text is not valid JSON5 either.
+    """
+    try:
+        return orjson.loads(text) if orjson is not None else json.loads(text)
+    except ValueError:
+        return json5.loads(text)
+
+
+def dumps_arguments(arguments: Any) -> str:
+    """Serialize tool call arguments to canonical JSON text.
+
+    The output is compact and keeps non-ASCII characters. It is always written by the
+    standard library, never by orjson, whose float formatting differs (`1e16` rather
+    than `1e+16`): the text must be the same in every environment, as tool calls are
+    compared by it, for example to match speculatively started calls.
+
+    Args:
+        arguments (Any): JSON-serializable arguments.
+
+    Returns:
+        str: The JSON text.
+    """
+    return json.dumps(arguments, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,127 @@
+# src/utils/tracing.py
+
+import os
+import logging
+from typing import Any, Callable, Dict, Optional, Union
+
+TRACING_ENV = "HOT_PATH_TRACING"
+SAMPLE_EVERY_ENV = "HOT_PATH_TRACE_SAMPLE_EVERY"
+
+
+def _read_sample_every() -> int:
+    try:
+        return max(1, int(os.getenv(SAMPLE_EVERY_ENV, "1")))
+    except ValueError:
+        return 1
+
+
+# Read once at import, so switching tracing off removes it for the process's lifetime
+TRACING_ENABLED = os.getenv(TRACING_ENV, "true").strip().lower() not in ("0", "false", "off", "no")
+DEFAULT_SAMPLE_EVERY = _read_sample_every()
+
+
+class Lazy:
+    """A log argument computed only if the record is actually formatted.
+
+    Logging formats `%s` arguments with `str()` only when a handler emits the record,
+    so wrapping an expensive rendering in `Lazy` skips it whenever the record is
+    filtered out.
+
+    Args:
+        function (Callable[..., Any]): Renders the value.
+        *args: Positional arguments for `function`.
+        **kwargs: Keyword arguments for `function`.
+
+    Example:
+        ```python
+        tracer.trace("Request payload: %s", Lazy(json.dumps, payload, indent=2))
+        ```
+    """
+
+    __slots__ = ("function", "args", "kwargs")
+
+    def __init__(self, function: Callable[..., Any], *args: Any, **kwargs: Any):
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return str(self.function(*self.args, **self.kwargs))
+
+    def __repr__(self) -> str:
+        return repr(self.function(*self.args, **self.kwargs))
+
+
+def _disabled(self, msg: str, *args: Any) -> None:
+    """Stand-in for the tracing methods when tracing is switched off."""
+
+
+class HotPathTracer:
+    """Debug logging for per-chunk and per-token code paths.
+
+    Hot paths such as adapter chunk conversion, tool call detection and the agent's
+    streaming loop run for every token, so their debug records must cost nothing
+    unless someone is looking. Compared to calling `logger.debug` directly:
+
+    - Arguments are formatted by the logging module, and only if DEBUG is enabled for
+      the logger. Wrap renderings that are expensive in themselves in `Lazy`.
+    - `sample` emits one in `sample_every` records per message, to follow a
+      stream at DEBUG without logging every token.
+    - Setting the `HOT_PATH_TRACING` environment variable to `false` replaces the
+      tracing methods with no-ops at import time, regardless of the log level.
+
+    Records are attributed to the caller's line, not to this class.
+
+    Args:
+        logger (Union[logging.Logger, str]): The logger, or the name of one, to emit to.
+        sample_every (Optional[int]): Emit one in this many records in `sample`.
+            Defaults to the `HOT_PATH_TRACE_SAMPLE_EVERY` environment variable, or 1.
+
+    Example:
+        ```python
+        tracer = HotPathTracer(logger)
+        tracer.sample("Converting chunk: %s", Lazy(json.dumps, raw_chunk, indent=2))
+        ```
+    """
+
+    __slots__ = ("logger", "sample_every", "_counts")
+
+    def __init__(self, logger: Union[logging.Logger, str], sample_every: Optional[int] = None):
+        self.logger = logger if isinstance(logger, logging.Logger) else logging.getLogger(logger)
+        self.sample_every = max(1, sample_every or DEFAULT_SAMPLE_EVERY)
+        self._counts: Dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether records would be emitted; use it to guard building expensive arguments."""
+        return TRACING_ENABLED and self.logger.isEnabledFor(logging.DEBUG)
+
+    def trace(self, msg: str, *args: Any) -> None:
+        """Log a DEBUG record, formatting the arguments only if it is emitted.
+
+        Args:
+            msg (str): %-style format string.
+            *args: Arguments for the format string.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg, *args, stacklevel=2)
+
+    def sample(self, msg: str, *args: Any) -> None:
+        """Log a DEBUG record for one in `sample_every` calls with this message.
+
+        Calls are counted per format string, so each call site is sampled on its own,
+        starting with its first call.
+
+        Args:
+            msg (str): %-style format string.
+            *args: Arguments for the format string.
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        count = self._counts.get(msg, 0)
+        self._counts[msg] = count + 1
+        if count % self.sample_every == 0:
+            self.logger.debug(msg, *args, stacklevel=2)
+
+    if not TRACING_ENABLED:
+        trace = sample = _disabled
@@ -0,0 +1,76 @@
+# tests/test_chat_completions_api.py
+
+import importlib
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import SSEChunk
+from src.agent import StreamingChatAgent
+from src.api.sse_models import AgentStatus
+
+
+class ScriptedAgent:
+    """Replays a fixed response stream and records whether it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def stream_step(self, conversation_history, api_passed_context=None, thread_id=None):
+        try:
+            yield await SSEChunk.make_status_chunk(AgentStatus.STARTING)
+            yield SSEChunk.make_text_chunk("Hello, ")
+            yield await SSEChunk.make_status_chunk(AgentStatus.TOOLS_EXECUTED, {"tool": "lookup"})
+            yield SSEChunk.make_text_chunk("world")
+            yield await SSEChunk.make_stop_chunk()
+            yield SSEChunk.make_text_chunk("never sent")
+        finally:
+            self.closed = True
+
+
+def load_api_module(monkeypatch):
+    """Import the route module without building the real agent it creates at import time."""
+    monkeypatch.setenv("FLEXO_API_KEY", "test-key")
+    monkeypatch.setattr(StreamingChatAgent, "__init__", lambda self, config: None)
+    return importlib.import_module("src.api.routes.chat_completions_api")
+
+
+def test_non_streaming_request_returns_aggregated_completion(monkeypatch):
+    """With stream false, the agent stream is aggregated into one chat.completion object"""
+    api = load_api_module(monkeypatch)
+    agent = ScriptedAgent()
+    app = FastAPI()
+    app.include_router(api.router)
+    app.dependency_overrides[api.get_streaming_agent] = lambda: agent
+    app.dependency_overrides[api.get_api_key] = lambda: "test-key"
+
+    response = TestClient(app).post(
+        "/chat/completions",
+        json={"messages": [{"role": "user", "content": "Hi"}], "stream": False},
+        headers={"X-IBM-THREAD-ID": "thread-1"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["object"] == "chat.completion"
+    assert body["thread_id"] == "thread-1"
+    assert body["choices"] == [{
+        "index": 0,
+        "message": {"role": "assistant", "content": "Hello, world"},
+        "finish_reason": "stop"
+    }]
+    assert body["tool_activity"] == [{"status": "starting_generation"},
+                                     {"status": "tools_executed", "tool": "lookup"}]
+    assert agent.closed
+
+
+def test_openapi_documents_both_response_shapes(monkeypatch):
+    """The schema lists the SSE stream and the aggregated chat.completion object"""
+    api = load_api_module(monkeypatch)
+    app = FastAPI()
+    app.include_router(api.router)
+
+    content = app.openapi()["paths"]["/chat/completions"]["post"]["responses"]["200"]["content"]
+    assert set(content) == {"application/json", "text/event-stream"}
+    assert content["application/json"]["schema"] == {"$ref": "#/components/schemas/ChatCompletionResponse"}
@@ -0,0 +1,122 @@
+# tests/test_conversation_store.py
+
+import types
+import asyncio
+import logging
+import sqlite3
+
+from src.agent.conversation_store import ConversationStore
+from src.agent.chat_agent_streaming import StreamingChatAgent, handle_streaming_errors
+from src.api import SSEChunk
+from src.data_models.agent import StreamContext, StreamState
+from src.data_models.chat_completions import UserMessage, AssistantMessage
+from src.llm.tool_detection import DetectionStrategyPool, VendorToolCallDetectionStrategy
+from src.utils.tracing import HotPathTracer
+
+
+def test_threads_persist_across_eviction_and_restart(tmp_path):
+    """Appends are written through, so evicted threads reload and a new store sees every thread"""
+    sqlite_path = str(tmp_path / "threads.db")
+
+    async def run():
+        store = ConversationStore(max_threads=1, sqlite_path=sqlite_path)
+        await store.append("a", [UserMessage(content="hello a")])
+        await store.append("b", [UserMessage(content="hello b")])
+        evicted = list(store._threads)
+        await store.append("a", [AssistantMessage(content="hi a")])
+        reloaded = await store.load("a")
+
+        restarted = ConversationStore(max_threads=1, sqlite_path=sqlite_path)
+        return evicted, reloaded, await restarted.load("a"), await restarted.load("b"), await restarted.load("c")
+
+    evicted, reloaded, after_restart_a, after_restart_b, unknown = asyncio.run(run())
+    assert evicted == ["b"]
+    assert [message.content for message in reloaded] == ["hello a", "hi a"]
+    assert after_restart_a == reloaded
+    assert [message.content for message in after_restart_b] == ["hello b"]
+    assert unknown == []
+
+
+def test_append_writes_one_row_per_new_message(tmp_path):
+    """Each append inserts only its own messages, which load back in order"""
+    sqlite_path = str(tmp_path / "threads.db")
+
+    async def run():
+        store = ConversationStore(sqlite_path=sqlite_path)
+        await store.append("t", [UserMessage(content="one"), AssistantMessage(content="two")])
+        await store.append("t", [UserMessage(content="three")])
+        await store.append("t", [])
+        return await ConversationStore(sqlite_path=sqlite_path).load("t")
+
+    reloaded = asyncio.run(run())
+    assert [message.content for message in reloaded] == ["one", "two", "three"]
+    with sqlite3.connect(sqlite_path) as connection:
+        rows = connection.execute("SELECT thread_id, seq FROM thread_messages ORDER BY seq").fetchall()
+    assert rows == [("t", 0), ("t", 1), ("t", 2)]
+
+
+def test_thread_lock_serializes_turns():
+    """A second turn on the same thread starts from the history the first one saved"""
+    store = ConversationStore()
+    seen = []
+
+    async def turn(name):
+        async with store.thread_lock("t"):
+            history = await store.load("t")
+            seen.append(len(history))
+            await asyncio.sleep(0.01)
+            await store.append("t", [UserMessage(content=name)])
+
+    async def run():
+        await asyncio.gather(turn("first"), turn("second"), turn("third"))
+        return await store.load("t")
+
+    history = asyncio.run(run())
+    assert seen == [0, 1, 2]
+    assert [message.content for message in history] == ["first", "second", "third"]
+    assert not store._thread_locks
+
+
+def make_store_agent(completing_fails):
+    """An agent that answers "answer" and then runs a completing step that may fail."""
+    agent = StreamingChatAgent.__new__(StreamingChatAgent)
+    agent.logger = logging.getLogger("test_agent")
+    agent.tracer = HotPathTracer(agent.logger)
+    agent.conversation_store = ConversationStore()
+    agent.detection_pool = DetectionStrategyPool(VendorToolCallDetectionStrategy(), max_size=1, prebuilt=0)
+
+    async def initialize_context(self, conversation_history, api_passed_context, detection_strategy):
+        return StreamContext(conversation_history=list(conversation_history), detection_strategy=detection_strategy,
+                             current_state=StreamState.STREAMING)
+
+    @handle_streaming_errors
+    async def handle_streaming(self, context):
+        context.conversation_history.append(AssistantMessage(content="answer"))
+        context.current_state = StreamState.COMPLETING
+        yield SSEChunk.make_text_chunk("answer")
+
+    @handle_streaming_errors
+    async def handle_completing(self, context):
+        if completing_fails:
+            raise RuntimeError("completing failed")
+        yield await SSEChunk.make_stop_chunk()
+
+    agent._initialize_context = types.MethodType(initialize_context, agent)
+    agent._handle_streaming = types.MethodType(handle_streaming, agent)
+    agent._handle_completing = types.MethodType(handle_completing, agent)
+    return agent
+
+
+def test_only_turns_without_error_fallback_are_stored():
+    """A turn that reached completion through the error fallback is not saved to the thread"""
+    async def run(completing_fails):
+        agent = make_store_agent(completing_fails)
+        chunks = [chunk async for chunk in agent._run_stream_step([UserMessage(content="hi")], None, "t")]
+        return chunks[-1].choices[0].delta.content, await agent.conversation_store.load("t")
+
+    fallback, failed_thread = asyncio.run(run(completing_fails=True))
+    assert fallback.startswith("I apologize")
+    assert failed_thread == []
+
+    _, thread = asyncio.run(run(completing_fails=False))
+    assert [message.content for message in thread] == ["hi", "answer"]
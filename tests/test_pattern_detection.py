@@ -0,0 +1,250 @@
+# tests/test_pattern_detection.py
+
+import os
+import pickle
+import random
+import asyncio
+
+from src.llm.pattern_detection import AhoCorasickBufferedProcessor, AhoCorasickBufferedProcessorNormalized
+from src.llm.pattern_detection.aho_corasick import AhoCorasickAutomaton
+from src.llm.pattern_detection.automaton_cache import AutomatonSource
+from src.llm.pattern_detection.aho_corasick_normalized import AhoCorasickAutomatonNormalized
+from src.llm.pattern_detection.pattern_utils import load_patterns, normalize_and_map, resolve_pattern_family
+
+PATTERNS_PATH = "src/configs/tool_call_patterns.yaml"
+WORDS = ["hello", " ", "\n", "{", "[", "<", "`", "name", '"', "'", "tool", "_call", "|", ">", "json", "x y"]
+
+
+def find_earliest_match(text, automaton):
+    """Reference result: original start offset of the earliest normalized match, or None."""
+    automaton.reset_state()
+    normalized, index_map = normalize_and_map(text)
+    matches = automaton.search_chunk(normalized)
+    if not matches:
+        return None
+    end, name = min(matches, key=lambda match: match[0])
+    return index_map[end - automaton.get_pattern_length(name) + 1]
+
+
+async def stream_through(processor, text, rng):
+    """Feed text in random chunks; return (emitted output, matched, text from the match on)."""
+    output, position = [], 0
+    while position < len(text):
+        size = rng.randint(1, 8)
+        result = await processor.process_chunk(text[position:position + size])
+        position += size
+        output.append(result.output or "")
+        if result.matched:
+            return "".join(output), True, result.text_with_tool_call + text[position:]
+    output.append((await processor.flush_buffer()).output or "")
+    return "".join(output), False, ""
+
+
+def test_normalized_processor_matches_reference():
+    """Chunked incremental matching finds the same match as scanning the whole text"""
+    rng = random.Random(7)
+    patterns = load_patterns(PATTERNS_PATH)
+    prototype = AhoCorasickBufferedProcessorNormalized(PATTERNS_PATH)
+    reference = AhoCorasickAutomatonNormalized(patterns)
+
+    async def run():
+        for _ in range(500):
+            text = "".join(rng.choice(WORDS) for _ in range(rng.randint(1, 30)))
+            if rng.random() < 0.5:
+                pattern = "".join(ch + (" " if rng.random() < 0.2 else "") for ch in rng.choice(list(patterns.values())))
+                text = text[:rng.randint(0, len(text))] + pattern + text
+
+            output, matched, rest = await stream_through(prototype.clone(), text, rng)
+            expected_start = find_earliest_match(text, reference)
+
+            if expected_start is None:
+                assert not matched and output == text
+            else:
+                assert matched and output == text[:expected_start] and output + rest == text
+
+    asyncio.run(run())
+
+
+def test_standard_processor_matches_reference():
+    """The incremental exact processor finds the earliest exact match of the whole text"""
+    rng = random.Random(13)
+    patterns = load_patterns(PATTERNS_PATH)
+    prototype = AhoCorasickBufferedProcessor(PATTERNS_PATH)
+
+    async def run():
+        for _ in range(300):
+            text = "".join(rng.choice(WORDS + list(patterns.values())[:4]) for _ in range(rng.randint(1, 30)))
+            output, matched, rest = await stream_through(prototype.clone(), text, rng)
+            ends = [(text.find(p) + len(p), text.find(p)) for p in patterns.values() if p in text]
+
+            if not ends:
+                assert not matched and output == text
+            else:
+                assert matched and output == text[:min(ends)[1]] and output + rest == text
+
+    asyncio.run(run())
+
+
+def test_hold_back_follows_partial_match():
+    """Only the suffix that can still begin a pattern is held back"""
+    processor = AhoCorasickBufferedProcessorNormalized(PATTERNS_PATH)
+
+    async def run():
+        return [await processor.process_chunk(chunk) for chunk in ("Sure <", "b>old", " [ {")]
+
+    opening, closed, partial = asyncio.run(run())
+    assert opening.output == "Sure " and closed.output == "<b>old"
+    assert partial.output == " " and processor.trailing_buffer_original == "[ {"
+
+
+def test_pattern_split_across_whitespace_and_chunks():
+    """A pattern broken by whitespace and chunk boundaries is still detected"""
+    processor = AhoCorasickBufferedProcessorNormalized(PATTERNS_PATH)
+
+    async def run():
+        first = await processor.process_chunk("Sure! [ {")
+        second = await processor.process_chunk('"na')
+        third = await processor.process_chunk('me": "search"}]')
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+    assert not first.matched and not second.matched
+    assert third.matched and third.pattern_name == "JsonArrayPattern0"
+    assert (first.output or "") + (second.output or "") + third.output == "Sure! "
+    assert third.text_with_tool_call == '[ {"name": "search"}]'
+
+
+def test_goto_table_matches_failure_links():
+    """The compiled goto table reaches the same states as walking the failure links"""
+    rng = random.Random(11)
+    automaton = AhoCorasickAutomaton(load_patterns(PATTERNS_PATH))
+    text = "".join(rng.choice(WORDS + list(automaton.patterns.values())) for _ in range(2000))
+
+    state = 0
+    for char in text:
+        while state > 0 and char not in automaton.next_states[state]:
+            state = automaton.fail[state]
+        state = automaton.next_states[state].get(char, 0)
+        automaton.search_chunk(char)
+        assert automaton.current_state == state
+
+
+def test_goto_table_matches_in_chunks():
+    """Chunked search, including the skip to the next pattern start, reports every match"""
+    rng = random.Random(12)
+    automaton = AhoCorasickAutomaton(load_patterns(PATTERNS_PATH))
+    text = "".join(rng.choice(WORDS * 5 + list(automaton.patterns.values())) for _ in range(2000))
+
+    expected, state = [], 0
+    for i, char in enumerate(text):
+        while state > 0 and char not in automaton.next_states[state]:
+            state = automaton.fail[state]
+        state = automaton.next_states[state].get(char, 0)
+        expected.extend((i, name) for name in automaton.output[state])
+
+    found, position = [], 0
+    while position < len(text):
+        size = rng.randint(1, 40)
+        found.extend((position + end, name) for end, name in automaton.search_chunk(text[position:position + size]))
+        position += size
+    assert found == expected and expected
+
+
+def test_prose_chunks_skip_the_automaton():
+    """Chunks without trigger characters are released whole; detection still works afterwards"""
+    processor = AhoCorasickBufferedProcessor(PATTERNS_PATH)
+
+    async def run():
+        return [await processor.process_chunk(chunk) for chunk in ("Hello there", " [", "tool", "_call] x")]
+
+    prose, opening, partial, closing = asyncio.run(run())
+    assert prose.output == "Hello there" and processor.trailing_buffer_original == ""
+    assert not opening.matched and not partial.matched
+    assert closing.matched and closing.pattern_name == "ToolCallTagPattern3"
+    assert opening.output + partial.output + closing.output == " "
+
+
+def test_pattern_families():
+    """Families resolve from the vendor or model ID and load only their own patterns"""
+    assert resolve_pattern_family(PATTERNS_PATH, "watsonx-granite", None) == "granite"
+    assert resolve_pattern_family(PATTERNS_PATH, "openai-compat", "meta-llama/llama-3-405b-instruct") == "llama"
+    assert resolve_pattern_family(PATTERNS_PATH, "openai", "gpt-4o-mini") is None
+
+    granite = load_patterns(PATTERNS_PATH, "granite")
+    assert "ToolCallTagPattern0" in granite and "LanguageTagPattern0" not in granite
+    assert load_patterns(PATTERNS_PATH, None) == load_patterns(PATTERNS_PATH, "unknown")
+
+
+def test_granite_family_detects_json_and_fenced_calls():
+    """Granite output with a bare JSON object or a fenced call is still detected as a tool call"""
+    processor = AhoCorasickBufferedProcessorNormalized(PATTERNS_PATH, family="granite")
+    outputs = {
+        '<|tool_call|>[{"name": "a"}]': "ToolCallTagPattern0",
+        'Sure. {"name": "a", "arguments": {}}': "FunctionCallPattern1",
+        'Sure.\n```json\n{"name": "a"}\n```': "CodeBlockPattern3",
+    }
+
+    async def detect(text):
+        processor.reset_states()
+        for chunk in (text[i:i + 3] for i in range(0, len(text), 3)):
+            result = await processor.process_chunk(chunk)
+            if result.matched:
+                return result.pattern_name
+        return None
+
+    for text, pattern_name in outputs.items():
+        assert asyncio.run(detect(text)) == pattern_name, text
+
+
+def test_automaton_cache_and_reload(tmp_path):
+    """Compiled automata are cached on disk and swapped in when the pattern file changes"""
+    patterns_file = tmp_path / "patterns.yaml"
+    patterns_file.write_text("patterns:\n  Tag: '<tool>'\n")
+    source = AutomatonSource(str(patterns_file), cache_dir=str(tmp_path / "cache"), poll_interval=0)
+    processor = AhoCorasickBufferedProcessor(str(patterns_file))
+    processor.automaton_source = source
+
+    cached = AutomatonSource(str(patterns_file), cache_dir=str(tmp_path / "cache"))
+    assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+    assert cached.compiled.version == source.compiled.version
+    assert cached.compiled.automaton.search_chunk("a <tool>") == [(7, "Tag")]
+
+    patterns_file.write_text("patterns:\n  Tag: '[CALL]'\n")
+    assert processor.refresh_automaton()
+    assert processor.automaton.patterns == {"Tag": "[CALL]"} and processor.max_hold_back == 5
+    assert not processor.refresh_automaton()
+
+
+def test_automaton_cache_ignores_untrusted_files(tmp_path):
+    """Cache files writable by group or others are never unpickled"""
+    patterns_file = tmp_path / "patterns.yaml"
+    patterns_file.write_text("patterns:\n  Tag: '<tool>'\n")
+    cache_dir = tmp_path / "cache"
+    source = AutomatonSource(str(patterns_file), cache_dir=str(cache_dir))
+    cache_file = next(cache_dir.glob("*.pkl"))
+
+    cache_file.write_bytes(pickle.dumps("not an automaton"))
+    os.chmod(cache_file, 0o666)
+    reloaded = AutomatonSource(str(patterns_file), cache_dir=str(cache_dir))
+    assert reloaded.compiled.version == source.compiled.version
+    assert reloaded.compiled.automaton.search_chunk("a <tool>") == [(7, "Tag")]
+
+
+def test_automaton_reload_runs_off_the_event_loop(tmp_path):
+    """Inside a loop, the old automaton keeps serving until the new one is compiled"""
+    patterns_file = tmp_path / "patterns.yaml"
+    patterns_file.write_text("patterns:\n  Tag: '<tool>'\n")
+    source = AutomatonSource(str(patterns_file), poll_interval=0)
+    original = source.compiled
+
+    async def run():
+        patterns_file.write_text("patterns:\n  Tag: '[CALL]'\n")
+        swapped = source.refresh()
+        serving = source.compiled
+        while source._reload is not None:
+            await asyncio.sleep(0.01)
+        return swapped, serving
+
+    swapped, serving = asyncio.run(run())
+    assert not swapped and serving is original
+    assert source.compiled.automaton.patterns == {"Tag": "[CALL]"}
@@ -0,0 +1,107 @@
+# tests/test_request_coalescer.py
+
+import asyncio
+
+import pytest
+
+from src.api import SSEChunk
+from src.agent.request_coalescer import RequestCoalescer
+
+
+def chunk_texts(chunks):
+    return [chunk.choices[0].delta.content for chunk in chunks]
+
+
+class Producer:
+    """Upstream stream that emits one chunk each time `step` is set."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.started = 0
+        self.closed = False
+        self.step = asyncio.Event()
+
+    async def stream(self):
+        self.started += 1
+        try:
+            for text in self.texts:
+                await self.step.wait()
+                self.step.clear()
+                yield SSEChunk.make_text_chunk(text)
+        finally:
+            self.closed = True
+
+
+async def collect(stream, received):
+    async for chunk in stream:
+        received.append(chunk)
+
+
+def test_late_follower_replays_and_shares_one_producer():
+    """A follower joining mid-stream replays earlier chunks and gets its own copies"""
+    async def run():
+        coalescer = RequestCoalescer()
+        producer = Producer(["a", "b", "c"])
+        leader, follower = [], []
+
+        leader_task = asyncio.create_task(collect(coalescer.subscribe("k", producer.stream), leader))
+        producer.step.set()
+        while not leader:
+            await asyncio.sleep(0)
+
+        follower_task = asyncio.create_task(collect(coalescer.subscribe("k", producer.stream), follower))
+        for _ in range(2):
+            await asyncio.sleep(0.01)
+            producer.step.set()
+        await asyncio.gather(leader_task, follower_task)
+        return producer, leader, follower, coalescer
+
+    producer, leader, follower, coalescer = asyncio.run(run())
+    assert producer.started == 1
+    assert chunk_texts(leader) == chunk_texts(follower) == ["a", "b", "c"]
+    assert all(mine is not theirs for mine, theirs in zip(leader, follower))
+    assert not coalescer._flights
+
+
+def test_producer_cancelled_when_last_subscriber_leaves():
+    """The shared stream keeps running for remaining subscribers and stops after the last one"""
+    async def run():
+        coalescer = RequestCoalescer()
+        producer = Producer(["a", "b"])
+        first = coalescer.subscribe("k", producer.stream)
+        second = coalescer.subscribe("k", producer.stream)
+        producer.step.set()
+        await first.__anext__()
+        await second.__anext__()
+
+        await first.aclose()
+        await asyncio.sleep(0.01)
+        still_running = not producer.closed
+
+        await second.aclose()
+        await asyncio.sleep(0.01)
+        return still_running, producer.closed, coalescer
+
+    still_running, closed, coalescer = asyncio.run(run())
+    assert still_running
+    assert closed
+    assert not coalescer._flights
+
+
+def test_cancelled_producer_raises_ordinary_error_in_followers():
+    """Cancelling the shared producer does not cancel the subscribers' own tasks"""
+    async def run():
+        coalescer = RequestCoalescer()
+        producer = Producer(["a", "b"])
+        stream = coalescer.subscribe("k", producer.stream)
+        producer.step.set()
+        await stream.__anext__()
+
+        flight = next(iter(coalescer._flights.values()))
+        flight.task.cancel()
+        with pytest.raises(RuntimeError, match="coalesced stream cancelled"):
+            await stream.__anext__()
+        await asyncio.sleep(0)
+        return flight.task.cancelled()
+
+    assert asyncio.run(run())
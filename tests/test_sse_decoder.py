@@ -0,0 +1,37 @@
+# tests/test_sse_decoder.py
+
+import random
+
+from src.llm.adapters.sse_decoder import SSEDecoder, SSEEvent
+
+STREAM = (
+    b": keep-alive\n\n"
+    b"id: 1\nevent: message\ndata: {\"text\": \"caf\xc3\xa9\"}\n\n"
+    b"id: 2\r\ndata: first\r\ndata:second\r\n\r\n"
+    b"event: ping\rid: 3\r\r"
+    b"data: {\"done\": true}\n"
+)
+EXPECTED = [
+    SSEEvent(b'{"text": "caf\xc3\xa9"}', "message", "1"),
+    SSEEvent(b"first\nsecond", None, "2"),
+    SSEEvent(b'{"done": true}'),
+]
+
+
+def decode(chunks):
+    decoder = SSEDecoder()
+    events = [event for chunk in chunks for event in decoder.feed(chunk)]
+    return events + decoder.flush()
+
+
+def test_decoder_is_independent_of_chunking():
+    """Events come out the same however the stream is split, including inside \\r\\n and UTF-8 sequences"""
+    assert decode([STREAM]) == EXPECTED
+    assert decode([STREAM[i:i + 1] for i in range(len(STREAM))]) == EXPECTED
+
+    rng = random.Random(0)
+    for _ in range(200):
+        cuts = sorted(rng.sample(range(1, len(STREAM)), rng.randint(1, 12)))
+        chunks = [STREAM[start:end] for start, end in zip([0] + cuts, cuts + [len(STREAM)])]
+        assert decode(chunks) == EXPECTED
+    assert EXPECTED[0].json() == {"text": "café"}
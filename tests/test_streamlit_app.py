@@ -20,6 +20,7 @@ def get_status_icon(status: str) -> str:
     status_icons = {
         "starting_generation": "🟢",
         "tool_call_detected": "🔍",
+        "tool_progress": "⏳",
         "tools_executed": "⚡",
         "continuing_generation": "📝",
         "generation_complete": "✅"
@@ -105,6 +106,8 @@ def stream_response(conversation_input: Dict[str, any]) -> Optional[str]:
                                         tools = delta["metadata"]["tools"]
                                         tools_list = "\n".join([f"- 🛠 {tool}" for tool in tools])
                                         content = f"{status}\n{tools_list}"
+                                    elif status == "tool_progress":
+                                        content = f"{delta['metadata']['tool']}: {delta['metadata']['message']}"
 
                                     status_msg = {
                                         "role": "assistant",
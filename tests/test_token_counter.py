@@ -0,0 +1,31 @@
+# tests/test_token_counter.py
+
+from src.data_models.chat_completions import UserMessage, AssistantMessage, ToolMessage, ToolCall, FunctionDetail
+from src.utils.token_counter import count_message_tokens, select_messages_within_budget
+
+
+def test_select_messages_within_budget_keeps_newest_messages():
+    """Messages are packed newest first until the next one would exceed the budget"""
+    messages = [UserMessage(content="x" * 8) for _ in range(4)]
+    assert count_message_tokens(messages[0]) == 6
+
+    assert select_messages_within_budget(messages, 18) == messages[1:]
+    assert select_messages_within_budget(messages, 17) == messages[2:]
+    assert select_messages_within_budget(messages, 100) == messages
+    assert select_messages_within_budget(messages, 0) == messages[-1:]
+    assert select_messages_within_budget([], 100) == []
+
+
+def test_select_messages_within_budget_drops_orphaned_tool_messages():
+    """Tool messages cut off from the assistant message that called them are dropped"""
+    messages = [
+        UserMessage(content="x" * 40),
+        AssistantMessage(tool_calls=[ToolCall(id="call_lookup", function=FunctionDetail.from_arguments("lookup", {}))]),
+        ToolMessage(content="x" * 8, tool_call_id="call_lookup"),
+        ToolMessage(content="x" * 8, tool_call_id="call_lookup"),
+        AssistantMessage(content="x" * 8),
+    ]
+
+    assert select_messages_within_budget(messages, 18) == messages[4:]
+    assert select_messages_within_budget(messages, 25) == messages[1:]
+    assert select_messages_within_budget(messages, 100) == messages
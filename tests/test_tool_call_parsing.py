@@ -0,0 +1,121 @@
+# tests/test_tool_call_parsing.py
+
+import json
+import random
+
+import pytest
+import yaml
+
+from src.data_models.chat_completions import FunctionDetail, ToolCall
+from src.utils.factory import FormatType, ToolCallParserFactory
+from src.tools.core.utils.argument_validator import ArgumentValidationError, ArgumentValidator
+from src.tools.core.parsers import JSONStreamScanner, JSONToolCallParser, NonJSONToolCallParser
+
+
+def test_scanner_reports_top_level_closes():
+    """Closing offsets are reported for top-level values only, independent of chunking"""
+    text = '<|tool_call|>[{"name": "a", "arguments": {"q": "}]\\" \'"}}] it\'s {"name": "b"} [x'
+    expected = [text.index("}] it") + 2, text.index("} [x") + 1]
+
+    rng = random.Random(3)
+    for _ in range(50):
+        scanner, closed, position = JSONStreamScanner(), [], 0
+        while position < len(text):
+            size = rng.randint(1, 6)
+            closed.extend(scanner.feed(text[position:position + size]))
+            position += size
+        assert closed == expected
+        assert scanner.depth == 1 and not scanner.in_string
+
+
+def test_stream_matches_full_parse():
+    """Feeding the stream chunk by chunk gives the same result as parsing the whole text"""
+    parser = JSONToolCallParser({"clean_tokens": ["\n", "<|tool_call|>", "[TOOL_CALLS]"]})
+    texts = [
+        '<|tool_call|>[{"name": "a", "arguments": {"q": "x]"}}] done',
+        '[TOOL_CALLS][{"name": "a", "arguments": {}}; {name: "b", arguments: {}}]',
+        '{"name": "a", "arguments": {}},\n{"name": "b", "parameters": {"k": 1}}',
+        '<|tool_call|>[{"name": "a"}]',
+    ]
+
+    rng = random.Random(5)
+    for text in texts:
+        stream, position = parser.create_stream(), 0
+        while position < len(text):
+            size = rng.randint(1, 6)
+            stream.feed(text[position:position + size])
+            position += size
+        assert stream.result() == parser.parse(text)
+
+
+def test_function_detail_keeps_parsed_arguments():
+    """Arguments are carried parsed and as canonical JSON, recovering malformed model output"""
+    detail = FunctionDetail.from_arguments("f", "{'city': 'Zürich', days: [1, 2],}")
+    assert detail.arguments == '{"city":"Zürich","days":[1,2]}'
+    assert detail.parsed_arguments == {"city": "Zürich", "days": [1, 2]}
+
+    tool_call = ToolCall(id="1", function=FunctionDetail(name="f", arguments='{"a": 1}'))
+    assert tool_call.function.parsed_arguments == {"a": 1}
+    assert tool_call.model_dump()["function"]["arguments"] == '{"a": 1}'
+
+    null_detail = FunctionDetail(name="f", arguments="null")
+    assert null_detail.parsed_arguments is None
+    null_detail.arguments = "{}"
+    assert null_detail.parsed_arguments is None  # parsed once, not on every access
+
+    assert FunctionDetail.from_arguments("f", {"x": 1e16}).arguments == '{"x":1e+16}'
+
+
+def test_argument_validator_coerces_and_reports():
+    """Common model mistakes are coerced; remaining problems are reported per argument"""
+    validator = ArgumentValidator("search", {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "minLength": 1},
+            "limit": {"type": "integer", "minimum": 1},
+            "exact": {"type": "boolean"},
+            "filters": {"type": "object", "properties": {"year": {"type": "number"}}},
+            "unit": {"enum": ["c", "f"]},
+        },
+        "required": ["query"],
+        "additionalProperties": False,
+    })
+
+    assert validator.validate({"query": 2024, "limit": "5", "exact": "True", "filters": '{"year": "2020.5"}'}) == {
+        "query": "2024", "limit": 5, "exact": True, "filters": {"year": 2020.5}
+    }
+
+    with pytest.raises(ArgumentValidationError) as error:
+        validator.validate({"limit": 0, "unit": "k", "page": 2})
+    assert [issue["path"] for issue in error.value.issues] == ["limit", "unit", "page", "query"]
+    assert json.loads(error.value.to_tool_content())["tool"] == "search"
+
+
+def test_non_json_parser_restores_argument_braces():
+    """Arguments are parsed whether or not the configured pattern captures their braces"""
+    text = '<function=get_weather>{"city": "Oslo", "days": 2}</function>'
+    expected = {"tool_calls": [{"name": "get_weather", "arguments": {"city": "Oslo", "days": 2}}]}
+
+    with open("src/configs/parsing.yaml", "r") as f:
+        config = yaml.safe_load(f)
+    assert NonJSONToolCallParser(config).extract(text) == expected
+
+    config["formats"]["non_json_format"]["function_call_pattern"] = r"<function=(.*?)>(\{.*?\})</function>"
+    assert NonJSONToolCallParser(config).extract(text) == expected
+
+
+with open("tests/data/tool_call_corpus.json", "r", encoding="utf-8") as corpus_file:
+    CORPUS = json.load(corpus_file)["cases"]
+
+
+@pytest.mark.parametrize("case", CORPUS, ids=[case["id"] for case in CORPUS])
+def test_corpus(case):
+    """Every corpus case parses to its expected tool calls, or fails if none are expected"""
+    with open("src/configs/parsing.yaml", "r") as f:
+        config = yaml.safe_load(f)
+    format_type = FormatType.JSON if case["format"] == "json" else FormatType.NON_JSON
+    result = ToolCallParserFactory.get_parser(format_type, config).parse(case["text"])
+    if case["expected"] is None:
+        assert "error" in result
+    else:
+        assert result.get("tool_calls") == case["expected"]
@@ -0,0 +1,89 @@
+# tests/test_tool_detection.py
+
+import asyncio
+
+from src.api import SSEChunk
+from src.api.sse_models import SSEChoice, SSEDelta, SSEFunction, SSEToolCall
+from src.data_models.agent import StreamContext
+from src.llm.tool_detection import VendorToolCallDetectionStrategy
+from src.llm.tool_detection.strategy_pool import DetectionStrategyPool
+from src.llm.tool_detection.detection_result import DetectionState
+
+
+def make_chunk(content=None, tool_calls=None, finish_reason=None):
+    return SSEChunk(id="chunk", object="chat.completion.chunk", created=0, model="test", choices=[
+        SSEChoice(index=0, delta=SSEDelta(content=content, tool_calls=tool_calls), finish_reason=finish_reason)
+    ])
+
+
+def test_strategy_pool_leases_distinct_reset_strategies():
+    """Leased strategies are distinct clones, and a released one comes back reset"""
+    async def scenario():
+        prototype = VendorToolCallDetectionStrategy()
+        pool = DetectionStrategyPool(prototype, max_size=2, prebuilt=1)
+
+        first = await pool.acquire()
+        second = await pool.acquire()
+        assert first is not second and prototype not in (first, second)
+        assert pool.in_use == 2
+
+        delta = SSEToolCall(index=0, id="a", function=SSEFunction(name="f", arguments='{"x"'))
+        await first.detect_chunk(make_chunk(tool_calls=[delta]), StreamContext())
+        assert first.partial_calls
+
+        pool.release(first)
+        assert pool.in_use == 1
+        assert not first.partial_calls and not first.collected_tool_calls
+
+        async with pool.lease() as reused:
+            assert reused is first
+        pool.release(second)
+        assert pool.in_use == 0
+
+    asyncio.run(scenario())
+
+
+def test_strategy_pool_blocks_at_max_size():
+    """acquire() waits while max_size strategies are leased and resumes on release"""
+    async def scenario():
+        pool = DetectionStrategyPool(VendorToolCallDetectionStrategy(), max_size=1, prebuilt=0)
+        leased = await pool.acquire()
+
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        pool.release(leased)
+        assert await asyncio.wait_for(waiter, 1) is leased
+
+    asyncio.run(scenario())
+
+
+def test_vendor_strategy_assembles_interleaved_calls():
+    """Deltas are routed by index, and a new id at a used index starts another call"""
+    def delta(index, call_id=None, name="", arguments=""):
+        return SSEToolCall(index=index, id=call_id, function=SSEFunction(name=name, arguments=arguments))
+
+    chunks = [
+        make_chunk(tool_calls=[delta(0, "a", "weather"), delta(1, "b", "time")]),
+        make_chunk(tool_calls=[delta(1, arguments='{"zone": '), delta(0, arguments='{"city": ')]),
+        make_chunk(tool_calls=[delta(0, arguments='"Oslo"}'), delta(1, arguments='"UTC"}')]),
+        make_chunk(tool_calls=[delta(0, "c", "news", '{"topic": "ai"}')]),
+        make_chunk(finish_reason="tool_calls"),
+    ]
+
+    async def scenario():
+        detector = VendorToolCallDetectionStrategy()
+        context = StreamContext()
+        results = [await detector.detect_chunk(chunk, context) for chunk in chunks]
+        return results, await detector.finalize_detection(context)
+
+    results, final = asyncio.run(scenario())
+    assert [result.state for result in results[:-1]] == [DetectionState.PARTIAL_MATCH] * 4
+    assert results[-1].state == DetectionState.COMPLETE_MATCH
+    assert [(call.id, call.function.name, call.function.parsed_arguments) for call in results[-1].tool_calls] == [
+        ("a", "weather", {"city": "Oslo"}),
+        ("b", "time", {"zone": "UTC"}),
+        ("c", "news", {"topic": "ai"}),
+    ]
+    assert final.tool_calls == results[-1].tool_calls
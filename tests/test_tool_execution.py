@@ -0,0 +1,175 @@
+# tests/test_tool_execution.py
+
+import asyncio
+import logging
+
+from src.tools import ToolRegistry
+from src.tools.core.base_tool import BaseTool
+from src.data_models.tools import ToolResponse, ToolProgress
+from src.data_models.agent import StreamContext
+from src.data_models.chat_completions import ToolCall, ToolMessage, FunctionDetail
+from src.agent.chat_agent_streaming import StreamingChatAgent, ToolTimeoutError
+from src.utils.tracing import HotPathTracer
+
+
+class SleepTool(BaseTool):
+    """Returns its name after sleeping, or raises the configured error."""
+
+    def __init__(self, name, delay=0.0, error=None, config=None):
+        super().__init__(config)
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def execute(self, context=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return ToolResponse(result=self.name)
+
+    def parse_output(self, output):
+        return output
+
+
+class ProgressTool(BaseTool):
+    """Streams progress updates, then its result, then output that should never be read."""
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.closed = False
+        self.read_past_result = False
+
+    async def execute(self, context=None, **kwargs):
+        try:
+            for step in (1, 2):
+                await asyncio.sleep(0.01)
+                yield ToolProgress(message=f"step {step}", details={"step": step})
+            yield ToolResponse(result="done")
+            self.read_past_result = True
+            yield ToolProgress(message="too late")
+        finally:
+            self.closed = True
+
+    def parse_output(self, output):
+        return output
+
+
+def make_call(name, call_id=None, arguments=None):
+    return ToolCall(id=call_id or f"call_{name}", type="function",
+                    function=FunctionDetail.from_arguments(name, arguments or {}))
+
+
+async def make_agent(tools, tool_execution_timeout=None, tool_turn_timeout=None):
+    """An agent with only the state tool execution needs, without models or config files."""
+    agent = StreamingChatAgent.__new__(StreamingChatAgent)
+    agent.logger = logging.getLogger("test_agent")
+    agent.tracer = HotPathTracer(agent.logger)
+    agent.tool_registry = ToolRegistry([])
+    for tool in tools:
+        await agent.tool_registry.register_tool(tool.name, tool)
+    agent.tool_execution_timeout = tool_execution_timeout
+    agent.tool_turn_timeout = tool_turn_timeout
+    return agent
+
+
+def test_per_tool_timeout_overrides_agent_default():
+    """A tool's own execution_timeout wins over the agent default and cancels only that tool"""
+    async def run():
+        slow = SleepTool("slow", delay=1.0, config={"timeouts": {"execution_timeout": 0.05}})
+        fast = SleepTool("fast", delay=0.2)
+        agent = await make_agent([slow, fast], tool_execution_timeout=0.5)
+        context = StreamContext(current_tool_call=[make_call("slow"), make_call("fast")])
+        return await agent._execute_tools_concurrently(context)
+
+    slow_result, fast_result = asyncio.run(run())
+    assert isinstance(slow_result, ToolTimeoutError)
+    assert slow_result.timeout == 0.05
+    assert fast_result == {"tool_name": "fast", "result": "fast"}
+
+
+def test_empty_tool_timeouts_use_agent_default():
+    """A tool config with an empty `timeouts:` entry falls back to the agent default"""
+    async def run():
+        agent = await make_agent([SleepTool("slow", delay=1.0, config={"timeouts": None})], tool_execution_timeout=0.05)
+        return await agent._run_tool(make_call("slow"), StreamContext())
+
+    result = asyncio.run(run())
+    assert isinstance(result, ToolTimeoutError)
+    assert result.timeout == 0.05
+
+
+def test_turn_timeout_keeps_finished_results():
+    """Tools still running at the turn timeout are cancelled; finished results are kept"""
+    async def run():
+        agent = await make_agent([SleepTool("slow", delay=1.0), SleepTool("fast")], tool_turn_timeout=0.05)
+        context = StreamContext(current_tool_call=[make_call("slow"), make_call("fast")])
+        return await agent._execute_tools_concurrently(context)
+
+    slow_result, fast_result = asyncio.run(run())
+    assert isinstance(slow_result, ToolTimeoutError)
+    assert slow_result.timeout == 0.05
+    assert fast_result == {"tool_name": "fast", "result": "fast"}
+
+
+def test_tool_errors_become_tool_messages():
+    """A TimeoutError raised by the tool itself is an ordinary error, answered with a ToolMessage"""
+    async def run():
+        agent = await make_agent([SleepTool("flaky", error=TimeoutError("upstream timed out")),
+                                  SleepTool("slow", delay=1.0, config={"timeouts": {"execution_timeout": 0.05}})])
+        context = StreamContext(current_tool_call=[make_call("flaky"), make_call("slow")])
+        [chunk async for chunk in agent._handle_tool_execution(context)]
+        return context.conversation_history
+
+    history = asyncio.run(run())
+    tool_messages = [message for message in history if isinstance(message, ToolMessage)]
+    assert [message.tool_call_id for message in tool_messages] == ["call_flaky", "call_slow"]
+    assert tool_messages[0].content == "Error executing tool flaky: upstream timed out"
+    assert tool_messages[1].content.startswith("Tool slow timed out after 0.05 seconds and was cancelled")
+
+
+def test_speculative_tools_are_claimed_or_cancelled():
+    """Confirmed calls reuse their speculative execution; unclaimed ones are cancelled"""
+    async def run():
+        claimed, unclaimed = SleepTool("claimed", delay=0.05), SleepTool("unclaimed", delay=1.0)
+        agent = await make_agent([claimed, unclaimed])
+        context = StreamContext()
+        agent._start_speculative_tools(context, [make_call("claimed", arguments={"x": 1}), make_call("unclaimed")])
+        agent._start_speculative_tools(context, [make_call("claimed", arguments={"x": 1})])
+        unclaimed_task = context.speculative_tool_tasks[agent._speculation_key(make_call("unclaimed"))]
+        await asyncio.sleep(0)
+
+        context.current_tool_call = [make_call("claimed", "final_id", {"x": 1})]
+        results = await agent._execute_tools_concurrently(context)
+        await asyncio.sleep(0)
+        return claimed.calls, unclaimed_task.cancelled(), context.speculative_tool_tasks, results
+
+    claimed_calls, unclaimed_cancelled, remaining, results = asyncio.run(run())
+    assert claimed_calls == 1
+    assert unclaimed_cancelled
+    assert remaining == {}
+    assert results == [{"tool_name": "claimed", "result": "claimed"}]
+
+
+def test_streaming_tool_progress_is_relayed():
+    """Progress from a streaming tool is relayed in order; its first result ends the execution"""
+    async def run():
+        tool = ProgressTool("progress")
+        agent = await make_agent([tool])
+        context = StreamContext(current_tool_call=[make_call("progress")])
+        chunks = [chunk async for chunk in agent._handle_tool_execution(context)]
+        return tool, chunks, context.conversation_history
+
+    tool, chunks, history = asyncio.run(run())
+    statuses = [chunk.choices[0].delta.metadata for chunk in chunks]
+    assert statuses == [
+        {"status": "tool_progress", "tool": "progress", "tool_call_id": "call_progress",
+         "message": "step 1", "details": {"step": 1}},
+        {"status": "tool_progress", "tool": "progress", "tool_call_id": "call_progress",
+         "message": "step 2", "details": {"step": 2}},
+        {"status": "tools_executed"},
+    ]
+    assert history[-1].content == "done"
+    assert tool.closed and not tool.read_past_result
@@ -0,0 +1,49 @@
+# tests/test_tool_registry.py
+
+import asyncio
+
+from src.tools import ToolRegistry
+from src.tools.core.base_tool import BaseTool
+from src.data_models.tools import ToolResponse
+from src.tools.core.observer import ToolEventType, ToolUpdateEvent
+
+
+class NamedTool(BaseTool):
+    """A tool that only has a name."""
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+
+    async def execute(self, context=None, **kwargs):
+        return ToolResponse(result=self.name)
+
+    def parse_output(self, output):
+        return output
+
+
+def test_definitions_snapshot_follows_registrations():
+    """The snapshot is replaced, with a new version, whenever the public tools change"""
+    async def scenario():
+        registry = ToolRegistry([])
+        empty = registry.get_definitions_snapshot()
+        assert empty.definitions == ()
+
+        await registry.register_tool("alpha", NamedTool("alpha"))
+        await registry.register_tool("beta", NamedTool("beta"))
+        registered = registry.get_definitions_snapshot()
+        assert registered.version == empty.version + 2
+        assert [definition.function.name for definition in registered.definitions] == ["alpha", "beta"]
+        assert set(registered.by_name) == {"alpha", "beta"}
+        assert empty.definitions == ()  # earlier snapshots are never mutated
+
+        await registry.register_tool("secret", NamedTool("secret"), hidden=True)
+        assert registry.get_definitions_snapshot() is registered
+
+        await registry._handle_mcp_update(ToolUpdateEvent(ToolEventType.REMOVED, removed_tool_names=["alpha"]))
+        removed = registry.get_definitions_snapshot()
+        assert removed.version == registered.version + 1
+        assert list(removed.by_name) == ["beta"]
+        assert [definition.function.name for definition in await registry.get_tool_definitions()] == ["beta"]
+
+    asyncio.run(scenario())
@@ -0,0 +1,58 @@
+# tests/test_tracing.py
+
+import os
+import sys
+import logging
+import subprocess
+from pathlib import Path
+
+from src.utils.tracing import HotPathTracer, Lazy, TRACING_ENV
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_sample_emits_one_in_sample_every_per_message(caplog):
+    """Each message is sampled on its own, starting with its first call"""
+    logger = logging.getLogger("test_tracing.sample")
+    tracer = HotPathTracer(logger, sample_every=3)
+    rendered = []
+
+    def render(value):
+        rendered.append(value)
+        return str(value)
+
+    caplog.set_level(logging.INFO, logger=logger.name)
+    for i in range(7):
+        tracer.sample("chunk %s", Lazy(render, i))
+    assert not caplog.records and not rendered  # nothing is formatted below DEBUG
+
+    caplog.set_level(logging.DEBUG, logger=logger.name)
+    for i in range(7):
+        tracer.sample("chunk %s", Lazy(render, i))
+        tracer.sample("token %s", i)
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == ["chunk 0", "token 0", "chunk 3", "token 3", "chunk 6", "token 6"]
+    assert set(rendered) == {0, 3, 6}
+    assert caplog.records[0].funcName == "test_sample_emits_one_in_sample_every_per_message"
+
+
+def test_tracing_can_be_switched_off():
+    """With HOT_PATH_TRACING=false, nothing is traced even at DEBUG"""
+    code = (
+        "import logging\n"
+        "logging.basicConfig(level=logging.DEBUG)\n"
+        "from src.utils.tracing import HotPathTracer\n"
+        "tracer = HotPathTracer('switched_off')\n"
+        "tracer.trace('traced')\n"
+        "tracer.sample('sampled')\n"
+        "logging.getLogger('switched_off').debug('direct')\n"
+        "print(tracer.enabled)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env=dict(os.environ, **{TRACING_ENV: "false"}),
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+    assert "direct" in result.stderr
+    assert "traced" not in result.stderr and "sampled" not in result.stderr
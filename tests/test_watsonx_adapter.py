@@ -0,0 +1,73 @@
+# tests/test_watsonx_adapter.py
+
+import asyncio
+
+from aiohttp import web
+
+from src.llm.adapters.watsonx.watsonx_adapter import WatsonXAdapter
+
+
+class StaticTokenManager:
+    async def get_token(self):
+        return "token"
+
+
+async def serve_generation_stream(peers):
+    """Local stand-in for the WatsonX generation stream, recording the client's connection."""
+    async def handler(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for index in range(2):
+            await response.write(f'id: {index}\ndata: {{"results": [{{"generated_text": "t{index}"}}]}}\n\n'.encode())
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/ml/v1/text/generation_stream", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+def test_requests_share_one_session_until_close():
+    """Generations reuse the loop's session and its connection; close() releases it"""
+    async def run():
+        peers = []
+        runner, port = await serve_generation_stream(peers)
+        adapter = WatsonXAdapter("model", StaticTokenManager())
+        adapter.base_url = f"http://127.0.0.1:{port}/ml/v1/text"
+        try:
+            texts = []
+            for _ in range(3):
+                texts.append([chunk.choices[0].delta.content async for chunk in adapter.gen_sse_stream("hi")])
+            session = adapter._get_session()
+            sessions = dict(adapter._sessions)
+            await adapter.close()
+            return texts, peers, session, sessions, adapter._sessions
+        finally:
+            await runner.cleanup()
+
+    texts, peers, session, sessions, sessions_after_close = asyncio.run(run())
+    assert texts == [["t0", "t1"]] * 3
+    assert len(peers) == 3 and len(set(peers)) == 1
+    assert list(sessions.values()) == [session]
+    assert session.closed and sessions_after_close == {}
+
+
+def test_sessions_of_closed_loops_are_discarded():
+    """A new event loop gets its own session; the previous loop's session is not left open"""
+    adapter = WatsonXAdapter("model", StaticTokenManager())
+
+    async def open_session():
+        return adapter._get_session()
+
+    first = asyncio.run(open_session())
+    second = asyncio.run(open_session())
+    assert first is not second
+    assert first.closed
+    assert list(adapter._sessions.values()) == [second]
+    asyncio.run(adapter.close())
+    assert adapter._sessions == {}